@@ -0,0 +1,228 @@
+"""Heartbeat-based AVOT agent liveness tracking on a hierarchical timing wheel.
+
+Agents report heartbeats; an agent that misses its beat for
+``late_after`` intervals is marked *late*, and after ``dead_after``
+intervals *dead*. Each pending deadline sits in a hierarchical timing wheel
+(four levels of 64 slots), so a heartbeat reschedules in O(1) and a tick
+only touches the timers that expire (plus the occasional cascade of one
+higher-level slot) instead of scanning every agent. With one-second
+resolution the wheel spans about 194 days; longer deadlines are parked in
+the top level and re-placed as it turns.
+"""
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SLOTS - 1
+WHEEL_LEVELS = 4
+
+ALIVE = "alive"
+LATE = "late"
+DEAD = "dead"
+
+
+class HierarchicalTimingWheel:
+    """Timers keyed by hashable ids with O(1) schedule/cancel and O(expiring) ticks."""
+
+    def __init__(self, current_tick: int = 0) -> None:
+        self.current = current_tick
+        self._slots: List[List[Set[Hashable]]] = [[set() for _ in range(WHEEL_SLOTS)] for _ in range(WHEEL_LEVELS)]
+        self._deadlines: Dict[Hashable, int] = {}
+        self._locations: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def _place(self, key: Hashable, earliest: int) -> None:
+        target = max(self._deadlines[key], earliest)
+        delta = target - self.current
+        for level in range(WHEEL_LEVELS):
+            if delta < 1 << (WHEEL_BITS * (level + 1)):
+                slot = (target >> (WHEEL_BITS * level)) & WHEEL_MASK
+                break
+        else:
+            # Beyond the wheel's span: park in the top-level slot visited last.
+            level = WHEEL_LEVELS - 1
+            slot = ((self.current >> (WHEEL_BITS * level)) - 1) & WHEEL_MASK
+        self._slots[level][slot].add(key)
+        self._locations[key] = (level, slot)
+
+    def schedule(self, key: Hashable, deadline_tick: int) -> None:
+        """Fire ``key`` at ``deadline_tick`` (replacing any pending timer for it)."""
+
+        self.cancel(key)
+        self._deadlines[key] = deadline_tick
+        self._place(key, self.current + 1)
+
+    def cancel(self, key: Hashable) -> None:
+        location = self._locations.pop(key, None)
+        if location is not None:
+            level, slot = location
+            self._slots[level][slot].discard(key)
+            del self._deadlines[key]
+
+    def _step(self) -> List[Hashable]:
+        self.current += 1
+        boundaries = []
+        for level in range(1, WHEEL_LEVELS):
+            if self.current & ((1 << (WHEEL_BITS * level)) - 1):
+                break
+            boundaries.append(level)
+        for level in reversed(boundaries):
+            slot = (self.current >> (WHEEL_BITS * level)) & WHEEL_MASK
+            keys = self._slots[level][slot]
+            self._slots[level][slot] = set()
+            for key in keys:
+                self._place(key, self.current)
+
+        slot = self.current & WHEEL_MASK
+        keys = self._slots[0][slot]
+        if not keys:
+            return []
+        self._slots[0][slot] = set()
+        expired = []
+        for key in keys:
+            if self._deadlines[key] <= self.current:
+                expired.append(key)
+                del self._deadlines[key]
+                del self._locations[key]
+            else:
+                self._place(key, self.current + 1)
+        return expired
+
+    def advance(self, tick: int) -> List[Hashable]:
+        """Move the wheel forward to ``tick`` and return every timer that fired."""
+
+        expired: List[Hashable] = []
+        while self.current < tick:
+            expired.extend(self._step())
+        return expired
+
+
+class LivenessTracker:
+    """Track agent heartbeats and surface late and dead agents."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 60.0,
+        late_after: float = 1.5,
+        dead_after: float = 3.0,
+        resolution_seconds: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if dead_after <= late_after:
+            raise ValueError("dead_after must be larger than late_after")
+        self.interval_seconds = interval_seconds
+        self.late_after = late_after
+        self.dead_after = dead_after
+        self.resolution_seconds = resolution_seconds
+        self.clock = clock
+        self._last_seen: Dict[str, float] = {}
+        self._states: Dict[str, str] = {}
+        self._late: Set[str] = set()
+        self._dead: Set[str] = set()
+        self._wheel = HierarchicalTimingWheel(self._tick_for(clock()))
+
+    def _tick_for(self, timestamp: float) -> int:
+        return math.ceil(timestamp / self.resolution_seconds)
+
+    def __len__(self) -> int:
+        return len(self._last_seen)
+
+    def heartbeat(self, codename: str, at: Optional[float] = None) -> None:
+        """Record a heartbeat and re-arm the agent's late deadline."""
+
+        at = self.clock() if at is None else at
+        self._last_seen[codename] = at
+        self._states[codename] = ALIVE
+        self._late.discard(codename)
+        self._dead.discard(codename)
+        self._wheel.schedule(codename, self._tick_for(at + self.late_after * self.interval_seconds))
+
+    def heartbeats(self, codenames: Iterable[str], at: Optional[float] = None) -> None:
+        at = self.clock() if at is None else at
+        for codename in codenames:
+            self.heartbeat(codename, at)
+
+    def restore(self, last_seen: Iterable[Tuple[str, float]], now: Optional[float] = None) -> List[Tuple[str, str]]:
+        """Replay persisted ``(codename, last_seen)`` heartbeats and return the transitions they imply.
+
+        Agents whose persisted beat is already overdue come back late or dead
+        straight away instead of waiting for the next tick.
+        """
+
+        now = self.clock() if now is None else now
+        transitions = []
+        for codename, at in last_seen:
+            self.heartbeat(codename, at)
+            if at + self.dead_after * self.interval_seconds <= now:
+                self._wheel.cancel(codename)
+                self._states[codename] = DEAD
+                self._dead.add(codename)
+                transitions.append((codename, DEAD))
+            elif at + self.late_after * self.interval_seconds <= now:
+                self._states[codename] = LATE
+                self._late.add(codename)
+                self._wheel.schedule(codename, self._tick_for(at + self.dead_after * self.interval_seconds))
+                transitions.append((codename, LATE))
+        return transitions + self.tick(now)
+
+    def forget(self, codename: str) -> None:
+        self._wheel.cancel(codename)
+        for collection in (self._last_seen, self._states):
+            collection.pop(codename, None)
+        self._late.discard(codename)
+        self._dead.discard(codename)
+
+    def tick(self, now: Optional[float] = None) -> List[Tuple[str, str]]:
+        """Advance to ``now`` and return the ``(codename, new_state)`` transitions."""
+
+        now = self.clock() if now is None else now
+        transitions = []
+        for codename in self._wheel.advance(self._tick_for(now)):
+            if self._states.get(codename) == ALIVE:
+                self._states[codename] = LATE
+                self._late.add(codename)
+                dead_at = self._last_seen[codename] + self.dead_after * self.interval_seconds
+                self._wheel.schedule(codename, self._tick_for(dead_at))
+                transitions.append((codename, LATE))
+            elif self._states.get(codename) == LATE:
+                self._states[codename] = DEAD
+                self._late.discard(codename)
+                self._dead.add(codename)
+                transitions.append((codename, DEAD))
+        return transitions
+
+    def state(self, codename: str) -> Optional[str]:
+        return self._states.get(codename)
+
+    def last_seen(self, codename: str) -> Optional[float]:
+        return self._last_seen.get(codename)
+
+    def late_agents(self) -> List[str]:
+        return sorted(self._late)
+
+    def dead_agents(self) -> List[str]:
+        return sorted(self._dead)
+
+    def report(self, limit: int = 100) -> Dict[str, object]:
+        """Summarize liveness for a manifest; agent lists are capped at ``limit``."""
+
+        return {
+            "interval_seconds": self.interval_seconds,
+            "late_after_intervals": self.late_after,
+            "dead_after_intervals": self.dead_after,
+            "tracked": len(self._last_seen),
+            "alive": len(self._last_seen) - len(self._late) - len(self._dead),
+            "late_count": len(self._late),
+            "dead_count": len(self._dead),
+            "late": self.late_agents()[:limit],
+            "dead": self.dead_agents()[:limit],
+        }
+
+
+__all__ = ["HierarchicalTimingWheel", "LivenessTracker"]
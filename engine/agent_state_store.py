@@ -0,0 +1,271 @@
+"""Persistent, concurrency-safe AVOT agent state backed by SQLite.
+
+Agent status, bindings and telemetry used to live only in short-lived
+``AvotAgent`` objects and in manifests that concurrent scripts overwrote.
+:class:`AgentStateStore` keeps them in one SQLite database in WAL mode:
+writers upsert activation records in batched transactions, and readers see
+a consistent snapshot without blocking (or being blocked by) a writer.
+
+Tables:
+
+* ``agents`` - one row per codename with hive, status, last binding,
+  activation count and latest telemetry; indexed by status and binding.
+* ``bindings`` - activations per ``(codename, binding)`` with first and
+  last seen; indexed by binding.
+* ``heartbeats`` - the latest heartbeat (epoch seconds) per codename, so a
+  :class:`~engine.agent_liveness.LivenessTracker` can be restored across
+  runs.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_STATE_PATH = Path("heartbeat/state/avot_agents.db")
+DEFAULT_UPSERT_BATCH = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS agents (
+    codename TEXT PRIMARY KEY,
+    hive TEXT,
+    mission TEXT,
+    tone_signature TEXT,
+    status TEXT NOT NULL,
+    last_binding TEXT,
+    activated_at TEXT,
+    activations INTEGER NOT NULL DEFAULT 0,
+    telemetry TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS agents_by_status ON agents(status);
+CREATE INDEX IF NOT EXISTS agents_by_binding ON agents(last_binding);
+CREATE TABLE IF NOT EXISTS bindings (
+    codename TEXT NOT NULL,
+    binding TEXT NOT NULL,
+    activations INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT,
+    last_seen TEXT,
+    PRIMARY KEY (codename, binding)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS bindings_by_binding ON bindings(binding, codename);
+CREATE TABLE IF NOT EXISTS heartbeats (
+    codename TEXT PRIMARY KEY,
+    last_seen REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_UPSERT_AGENT = """
+INSERT INTO agents (codename, hive, mission, tone_signature, status, last_binding, activated_at, activations, telemetry, updated_at)
+VALUES (:codename, :hive, :mission, :tone_signature, :status, :binding, :activated_at, 1, :telemetry, :updated_at)
+ON CONFLICT(codename) DO UPDATE SET
+    hive = excluded.hive,
+    mission = excluded.mission,
+    tone_signature = excluded.tone_signature,
+    status = excluded.status,
+    last_binding = excluded.last_binding,
+    activated_at = excluded.activated_at,
+    activations = agents.activations + 1,
+    telemetry = excluded.telemetry,
+    updated_at = excluded.updated_at
+"""
+
+_UPSERT_BINDING = """
+INSERT INTO bindings (codename, binding, activations, first_seen, last_seen)
+VALUES (:codename, :binding, 1, :activated_at, :activated_at)
+ON CONFLICT(codename, binding) DO UPDATE SET
+    activations = bindings.activations + 1,
+    last_seen = excluded.last_seen
+"""
+
+_UPSERT_FAILURE = """
+INSERT INTO agents (codename, hive, status, activations, telemetry, updated_at)
+VALUES (:codename, :hive, :status, 0, :telemetry, :updated_at)
+ON CONFLICT(codename) DO UPDATE SET
+    hive = excluded.hive,
+    status = excluded.status,
+    telemetry = excluded.telemetry,
+    updated_at = excluded.updated_at
+"""
+
+_UPSERT_HEARTBEAT = """
+INSERT INTO heartbeats (codename, last_seen) VALUES (?, ?)
+ON CONFLICT(codename) DO UPDATE SET last_seen = MAX(heartbeats.last_seen, excluded.last_seen)
+"""
+
+
+class AgentStateStore:
+    """SQLite (WAL) store of AVOT agent state shared across workflows."""
+
+    def __init__(self, path: Path | str = DEFAULT_STATE_PATH, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "AgentStateStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def record_activations(
+        self,
+        records: Iterable[Dict[str, object]],
+        hive: Optional[str] = None,
+        batch_size: int = DEFAULT_UPSERT_BATCH,
+    ) -> int:
+        """Upsert activation records (as returned by ``AvotAgent.activate``) in batches.
+
+        Each batch is one ``BEGIN IMMEDIATE`` transaction, so concurrent
+        writers queue on the lock instead of interleaving half-written
+        batches. Returns the number of records written.
+        """
+
+        written = 0
+        iterator = iter(records)
+        while batch := list(islice(iterator, batch_size)):
+            now = datetime.now(UTC).isoformat()
+            rows = [
+                {
+                    "codename": record["codename"],
+                    "hive": hive,
+                    "mission": record.get("mission"),
+                    "tone_signature": record.get("tone_signature"),
+                    "status": record.get("status", "active"),
+                    "binding": record.get("binding"),
+                    "activated_at": record.get("activated_at"),
+                    "telemetry": json.dumps(record.get("probe")) if record.get("probe") else None,
+                    "updated_at": now,
+                }
+                for record in batch
+            ]
+            with self._transaction("BEGIN IMMEDIATE"):
+                self._connection.executemany(_UPSERT_AGENT, rows)
+                self._connection.executemany(_UPSERT_BINDING, [row for row in rows if row["binding"]])
+            written += len(rows)
+        return written
+
+    def record_failures(
+        self,
+        records: Iterable[Dict[str, object]],
+        hive: Optional[str] = None,
+        batch_size: int = DEFAULT_UPSERT_BATCH,
+    ) -> int:
+        """Upsert agents whose activation failed (status ``failed``, ``timeout``, ...).
+
+        The agent's status and telemetry (the recorded ``error``) are
+        replaced; its activation count, last binding and binding history
+        are left as they were. Returns the number of records written.
+        """
+
+        written = 0
+        iterator = iter(records)
+        while batch := list(islice(iterator, batch_size)):
+            now = datetime.now(UTC).isoformat()
+            rows = [
+                {
+                    "codename": record["codename"],
+                    "hive": hive,
+                    "status": record["status"],
+                    "telemetry": json.dumps({"error": record["error"]}) if record.get("error") else None,
+                    "updated_at": now,
+                }
+                for record in batch
+            ]
+            with self._transaction("BEGIN IMMEDIATE"):
+                self._connection.executemany(_UPSERT_FAILURE, rows)
+            written += len(rows)
+        return written
+
+    def record_heartbeats(self, beats: Iterable[Tuple[str, float]], batch_size: int = DEFAULT_UPSERT_BATCH) -> int:
+        """Upsert ``(codename, epoch_seconds)`` heartbeats, keeping the latest per agent."""
+
+        written = 0
+        iterator = iter(beats)
+        while batch := list(islice(iterator, batch_size)):
+            with self._transaction("BEGIN IMMEDIATE"):
+                self._connection.executemany(_UPSERT_HEARTBEAT, batch)
+            written += len(batch)
+        return written
+
+    def heartbeats(self) -> Dict[str, float]:
+        """Return the latest persisted heartbeat of every agent."""
+
+        rows = self._connection.execute("SELECT codename, last_seen FROM heartbeats")
+        return {codename: last_seen for codename, last_seen in rows}
+
+    @contextmanager
+    def _transaction(self, begin: str = "BEGIN") -> Iterator[sqlite3.Connection]:
+        self._connection.execute(begin)
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    @contextmanager
+    def snapshot(self) -> Iterator["AgentStateStore"]:
+        """Hold one read transaction so every query inside sees the same state.
+
+        Under WAL the snapshot does not block writers, and writers committing
+        meanwhile do not change what the snapshot returns.
+        """
+
+        with self._transaction("BEGIN DEFERRED"):
+            # The read snapshot starts at the first read, so pin it now.
+            self._connection.execute("SELECT 1 FROM agents LIMIT 1").fetchall()
+            yield self
+
+    @staticmethod
+    def _agent_row(row: sqlite3.Row) -> Dict[str, object]:
+        agent = dict(row)
+        agent["telemetry"] = json.loads(agent["telemetry"]) if agent["telemetry"] else {}
+        return agent
+
+    def get(self, codename: str) -> Optional[Dict[str, object]]:
+        """Return an agent's state with its per-binding history, or ``None``."""
+
+        row = self._connection.execute("SELECT * FROM agents WHERE codename = ?", (codename,)).fetchone()
+        if row is None:
+            return None
+        agent = self._agent_row(row)
+        agent["bindings"] = [
+            dict(binding)
+            for binding in self._connection.execute(
+                "SELECT binding, activations, first_seen, last_seen FROM bindings WHERE codename = ? ORDER BY last_seen",
+                (codename,),
+            )
+        ]
+        return agent
+
+    def by_status(self, status: str) -> List[Dict[str, object]]:
+        rows = self._connection.execute("SELECT * FROM agents WHERE status = ? ORDER BY codename", (status,))
+        return [self._agent_row(row) for row in rows]
+
+    def by_binding(self, binding: str) -> List[Dict[str, object]]:
+        """Return every agent ever bound to ``binding`` with its activations there."""
+
+        rows = self._connection.execute(
+            "SELECT codename, activations, first_seen, last_seen FROM bindings WHERE binding = ? ORDER BY codename",
+            (binding,),
+        )
+        return [dict(row) for row in rows]
+
+    def status_counts(self) -> Dict[str, int]:
+        rows = self._connection.execute("SELECT status, COUNT(*) FROM agents GROUP BY status")
+        return {status: count for status, count in rows}
+
+
+__all__ = ["AgentStateStore", "DEFAULT_STATE_PATH"]
@@ -1,14 +1,125 @@
 """AVOT activation utilities and Hive-Core synchronization orchestration."""
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .agent_liveness import LivenessTracker
+from .agent_state_store import AgentStateStore
+from .registry_cache import load_compiled
 
-@dataclass
+DEFAULT_SYNC_BATCH = 1024
+DEFAULT_HISTORY_DEPTH = 16
+DEFAULT_SYNC_CONCURRENCY = 32
+DEFAULT_HOOK_TIMEOUT = 10.0
+
+# An activation hook probes or prepares one agent before it is activated
+# (a hivelet process, an HTTP health endpoint, ...). It may return extra
+# telemetry for the manifest; raising or timing out marks the agent failed.
+ActivationHook = Callable[["AvotAgent"], Awaitable[Optional[Dict[str, object]]]]
+
+
+class BindingHistory:
+    """Fixed-depth ring of recent ``(binding, timestamp)`` activations.
+
+    Iterating, indexing and ``len`` behave like the plain list of binding
+    names this replaces, restricted to the newest ``depth`` activations.
+    Entries pushed out of the ring are compacted into per-binding counters
+    (activation count, first and last seen), so :meth:`summary` still
+    covers every activation while memory stays bounded. The ring and the
+    counters are only allocated once they are needed.
+    """
+
+    __slots__ = ("depth", "_ring", "_head", "_size", "_compacted")
+
+    def __init__(self, depth: int = DEFAULT_HISTORY_DEPTH) -> None:
+        if depth < 1:
+            raise ValueError("binding history depth must be at least 1")
+        self.depth = depth
+        self._ring: Optional[List[tuple]] = None
+        self._head = 0
+        self._size = 0
+        self._compacted: Optional[Dict[str, List[object]]] = None
+
+    def append(self, binding: str, timestamp: Optional[str] = None) -> None:
+        """Record an activation, compacting the oldest entry when the ring is full."""
+
+        if self._ring is None:
+            self._ring = [None] * self.depth
+        if self._size == self.depth:
+            self._compact(*self._ring[self._head])
+            self._head = (self._head + 1) % self.depth
+            self._size -= 1
+        self._ring[(self._head + self._size) % self.depth] = (binding, timestamp)
+        self._size += 1
+
+    def _compact(self, binding: str, timestamp: Optional[str]) -> None:
+        if self._compacted is None:
+            self._compacted = {}
+        counters = self._compacted.get(binding)
+        if counters is None:
+            self._compacted[binding] = [1, timestamp, timestamp]
+            return
+        counters[0] += 1
+        counters[1] = counters[1] or timestamp
+        counters[2] = timestamp or counters[2]
+
+    def _recent(self) -> Iterator[tuple]:
+        for offset in range(self._size):
+            yield self._ring[(self._head + offset) % self.depth]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        return (binding for binding, _ in self._recent())
+
+    def __getitem__(self, index: int) -> str:
+        return list(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BindingHistory):
+            return list(self) == list(other) and self.summary() == other.summary()
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BindingHistory({list(self)!r}, depth={self.depth})"
+
+    @property
+    def total(self) -> int:
+        return self._size + sum(counters[0] for counters in (self._compacted or {}).values())
+
+    def entries(self) -> List[Dict[str, Optional[str]]]:
+        """Return the retained activations, oldest first."""
+
+        return [{"binding": binding, "at": timestamp} for binding, timestamp in self._recent()]
+
+    def summary(self) -> Dict[str, Dict[str, object]]:
+        """Activations per binding with first and last seen, across compacted and retained entries."""
+
+        totals = {
+            binding: {"activations": count, "first_seen": first, "last_seen": last}
+            for binding, (count, first, last) in (self._compacted or {}).items()
+        }
+        for binding, timestamp in self._recent():
+            entry = totals.setdefault(binding, {"activations": 0, "first_seen": timestamp, "last_seen": timestamp})
+            entry["activations"] += 1
+            entry["first_seen"] = entry["first_seen"] or timestamp
+            entry["last_seen"] = timestamp or entry["last_seen"]
+        return totals
+
+
+@dataclass(slots=True)
 class AvotAgent:
     """Represents a single AVOT agent and its mission parameters."""
 
@@ -18,15 +129,18 @@ class AvotAgent:
     ethic: str
     capabilities: List[str]
     status: str = "dormant"
-    bindings: List[str] = field(default_factory=list)
+    bindings: BindingHistory = field(default_factory=BindingHistory)
     telemetry: Dict[str, str] = field(default_factory=dict)
 
-    def activate(self, core_binding: str) -> Dict[str, str]:
-        """Bind the agent to the provided core and emit activation telemetry."""
+    def activate(self, core_binding: str, timestamp: Optional[str] = None) -> Dict[str, str]:
+        """Bind the agent to the provided core and emit activation telemetry.
+
+        Bulk callers pass one shared ``timestamp`` for a whole batch.
+        """
 
-        timestamp = datetime.now(UTC).isoformat()
+        timestamp = timestamp or datetime.now(UTC).isoformat()
         self.status = "active"
-        self.bindings.append(core_binding)
+        self.bindings.append(core_binding, timestamp)
         self.telemetry["activated_at"] = timestamp
         self.telemetry["last_binding"] = core_binding
         return {
@@ -47,12 +161,42 @@ class HiveCoreProtocol:
     tyme_core_binding: str
     protocol_name: str
 
-    def synchronize(self, agents: Iterable[AvotAgent]) -> Dict[str, object]:
-        """Activate all agents and produce a synchronization manifest."""
+    @staticmethod
+    def _record_heartbeats(
+        beats: List[Tuple[str, float]],
+        state_store: Optional[AgentStateStore],
+        liveness: Optional[LivenessTracker],
+    ) -> None:
+        """Feed ``(codename, epoch_seconds)`` beats to ``liveness`` and persist them in ``state_store``."""
+
+        if liveness is not None:
+            for codename, at in beats:
+                liveness.heartbeat(codename, at)
+        if state_store is not None:
+            state_store.record_heartbeats(beats)
+
+    def synchronize(
+        self,
+        agents: Iterable[AvotAgent],
+        state_store: Optional[AgentStateStore] = None,
+        liveness: Optional[LivenessTracker] = None,
+    ) -> Dict[str, object]:
+        """Activate all agents and produce a synchronization manifest.
+
+        With a ``state_store`` the activations are also upserted into the
+        shared agent state database. Every activation counts as a heartbeat:
+        it is recorded in the ``liveness`` tracker and persisted in the
+        ``state_store``. With a tracker the manifest carries its late and
+        dead agents.
+        """
 
         activation_log = []
         for agent in agents:
             activation_log.append(agent.activate(self.tyme_core_binding))
+        if state_store is not None:
+            state_store.record_activations(activation_log, hive=self.hive_id)
+        beaten_at = time.time()
+        self._record_heartbeats([(record["codename"], beaten_at) for record in activation_log], state_store, liveness)
 
         heartbeat = {
             "hive": self.hive_id,
@@ -61,8 +205,138 @@ class HiveCoreProtocol:
             "synchronized_at": datetime.now(UTC).isoformat(),
             "agents": activation_log,
         }
+        if liveness is not None:
+            liveness.tick()
+            heartbeat["liveness"] = liveness.report()
         return heartbeat
 
+    def synchronize_stream(
+        self,
+        agents: Iterable[AvotAgent],
+        output_path: Path,
+        batch_size: int = DEFAULT_SYNC_BATCH,
+        state_store: Optional[AgentStateStore] = None,
+        liveness: Optional[LivenessTracker] = None,
+    ) -> Dict[str, object]:
+        """Activate agents in batches and stream the manifest straight to disk.
+
+        Every agent in a batch shares one activation timestamp, and each
+        batch's records are written as soon as they are produced, so memory
+        holds one batch plus counters however many agents are synchronized.
+        The file has the same shape as :meth:`persist_manifest` output with
+        ``agent_count`` and ``batches`` appended; the returned summary
+        carries those counters instead of the agent list. A ``state_store``
+        receives each batch as one upsert transaction. Each batch's
+        activations are heartbeats for ``liveness`` and the store, as in
+        :meth:`synchronize`, and the liveness report is appended after the
+        agents. The manifest is staged next to ``output_path`` and replaces
+        it only once complete; the staging file is removed if the sync fails.
+        """
+
+        header = {
+            "hive": self.hive_id,
+            "binding": self.tyme_core_binding,
+            "protocol": self.protocol_name,
+            "synchronized_at": datetime.now(UTC).isoformat(),
+        }
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = output_path.with_name(output_path.name + ".tmp")
+        count = 0
+        batches = 0
+        iterator = iter(agents)
+        try:
+            with staging.open("w", encoding="utf-8") as handle:
+                handle.write(json.dumps(header)[:-1] + ', "agents": [')
+                while batch := list(islice(iterator, batch_size)):
+                    timestamp = datetime.now(UTC).isoformat()
+                    activations = [agent.activate(self.tyme_core_binding, timestamp) for agent in batch]
+                    if state_store is not None:
+                        state_store.record_activations(activations, hive=self.hive_id, batch_size=batch_size)
+                    beaten_at = time.time()
+                    self._record_heartbeats([(agent.codename, beaten_at) for agent in batch], state_store, liveness)
+                    handle.write((",\n" if count else "\n") + ",\n".join(json.dumps(record) for record in activations))
+                    count += len(batch)
+                    batches += 1
+                trailer: Dict[str, object] = {"agent_count": count, "batches": batches}
+                if liveness is not None:
+                    liveness.tick()
+                    trailer["liveness"] = liveness.report()
+                handle.write("\n], " + json.dumps(trailer)[1:] + "\n")
+            staging.replace(output_path)
+        except BaseException:
+            # A failed sync leaves the previous manifest in place and no partial file.
+            staging.unlink(missing_ok=True)
+            raise
+        return {**header, **trailer, "output": str(output_path)}
+
+    async def synchronize_async(
+        self,
+        agents: Iterable[AvotAgent],
+        hook: Optional[ActivationHook] = None,
+        concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+        timeout: float = DEFAULT_HOOK_TIMEOUT,
+        state_store: Optional[AgentStateStore] = None,
+        liveness: Optional[LivenessTracker] = None,
+    ) -> Dict[str, object]:
+        """Run ``hook`` for every agent concurrently, then activate the ones that pass.
+
+        At most ``concurrency`` hooks are in flight at once and each gets
+        ``timeout`` seconds, so the sync takes roughly as long as the slowest
+        agent rather than the sum of all of them. Agents whose hook raises
+        or times out stay unactivated and are listed under ``failures``.
+        Every outcome is written to ``state_store``: activations through
+        :meth:`AgentStateStore.record_activations` and failures, with their
+        ``failed`` or ``timeout`` status, through
+        :meth:`AgentStateStore.record_failures`. Each activation counts as
+        a heartbeat, taken when its hook returned, for the ``liveness``
+        tracker and the store.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+        beats: List[Tuple[str, float]] = []
+
+        async def activate_one(agent: AvotAgent) -> Dict[str, object]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    probe = await asyncio.wait_for(hook(agent), timeout) if hook else None
+                except asyncio.TimeoutError:
+                    return {"codename": agent.codename, "status": "timeout", "error": f"no response within {timeout}s"}
+                except Exception as exc:  # noqa: BLE001 - reported per agent
+                    return {"codename": agent.codename, "status": "failed", "error": f"{type(exc).__name__}: {exc}"}
+                beats.append((agent.codename, time.time()))
+                record: Dict[str, object] = agent.activate(self.tyme_core_binding)
+                record["hook_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                if probe:
+                    record["probe"] = probe
+                return record
+
+        results = await asyncio.gather(*(activate_one(agent) for agent in agents))
+        activated = [record for record in results if record["status"] == "active"]
+        failures = [record for record in results if record["status"] != "active"]
+        if state_store is not None:
+            state_store.record_activations(activated, hive=self.hive_id)
+            state_store.record_failures(failures, hive=self.hive_id)
+        self._record_heartbeats(beats, state_store, liveness)
+        manifest: Dict[str, object] = {
+            "hive": self.hive_id,
+            "binding": self.tyme_core_binding,
+            "protocol": self.protocol_name,
+            "synchronized_at": datetime.now(UTC).isoformat(),
+            "agents": activated,
+            "failures": failures,
+            "summary": {
+                "requested": len(results),
+                "activated": len(activated),
+                "failed": sum(1 for record in failures if record["status"] == "failed"),
+                "timed_out": sum(1 for record in failures if record["status"] == "timeout"),
+            },
+        }
+        if liveness is not None:
+            liveness.tick()
+            manifest["liveness"] = liveness.report()
+        return manifest
+
     @staticmethod
     def persist_manifest(manifest: Dict[str, object], output_path: Path) -> Path:
         """Write the synchronization manifest to disk."""
@@ -72,46 +346,266 @@ class HiveCoreProtocol:
         return output_path
 
 
-def load_registry(registry_path: Path) -> Dict[str, object]:
-    """Load the AVOT registry data from disk."""
-
-    registry_data = json.loads(registry_path.read_text())
-    agents = [
-        AvotAgent(
-          codename=agent["codename"],
-          mission=agent["mission"],
-          tone_signature=agent["tone_signature"],
-          ethic=agent.get("ethic", ""),
-          capabilities=agent.get("capabilities", []),
+class AvotRegistry:
+    """Indexed AVOT agent collection with constant-time lookups.
+
+    Agents keep their registry order (positional access stays available for
+    round-robin role assignment). Codenames map to positions in a hash
+    index, and inverted indexes map each capability and tone signature to
+    the positions of the agents carrying it.
+
+    A registry loaded from a compiled snapshot keeps the agents as columns
+    and only builds an :class:`AvotAgent` when it is first accessed, so a
+    single lookup does not pay for the whole registry.
+    """
+
+    __slots__ = ("protocol", "history_depth", "_agents", "_columns", "_by_codename", "_by_capability", "_by_tone")
+
+    def __init__(
+        self,
+        protocol: HiveCoreProtocol,
+        agents: Iterable[AvotAgent] = (),
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+    ) -> None:
+        self.protocol = protocol
+        self.history_depth = history_depth
+        self._agents: List[Optional[AvotAgent]] = []
+        self._columns: Optional[tuple] = None
+        self._by_codename: Dict[str, int] = {}
+        self._by_capability: Dict[str, List[int]] = {}
+        self._by_tone: Dict[str, List[int]] = {}
+        for agent in agents:
+            self.add(agent)
+
+    @classmethod
+    def from_compiled(cls, compiled: tuple, history_depth: int = DEFAULT_HISTORY_DEPTH) -> "AvotRegistry":
+        """Rebuild a registry from :func:`compile_registry` output without creating agents."""
+
+        hive_meta, columns, by_codename, by_capability, by_tone = compiled
+        registry = cls(_protocol_from_meta(hive_meta), history_depth=history_depth)
+        registry._columns = columns
+        registry._agents = [None] * len(columns[1])
+        registry._by_codename = by_codename
+        registry._by_capability = by_capability
+        registry._by_tone = by_tone
+        return registry
+
+    def _build(self, position: int) -> AvotAgent:
+        strings, codenames, missions, tones, ethics, capabilities = self._columns
+        return AvotAgent(
+            codename=codenames[position],
+            mission=strings[missions[position]],
+            tone_signature=strings[tones[position]],
+            ethic=strings[ethics[position]],
+            capabilities=[strings[index] for index in capabilities[position]],
+            bindings=BindingHistory(self.history_depth),
         )
-        for agent in registry_data.get("agents", [])
-    ]
 
-    hive_meta = registry_data.get("hive_core", {})
-    protocol = HiveCoreProtocol(
+    def _agent(self, position: int) -> AvotAgent:
+        agent = self._agents[position]
+        if agent is None:
+            agent = self._agents[position] = self._build(position)
+        return agent
+
+    def iter_uncached(self) -> Iterator[AvotAgent]:
+        """Yield every agent in registry order without keeping the ones it builds.
+
+        Agents already materialized are yielded as they are; the rest are
+        built from the compiled columns and not stored in the registry, so a
+        single pass holds only the agents its caller keeps.
+        """
+
+        for position, agent in enumerate(self._agents):
+            yield agent if agent is not None else self._build(position)
+
+    @property
+    def agents(self) -> List[AvotAgent]:
+        """All agents in registry order (building any not yet materialized)."""
+
+        if self._columns is not None:
+            for position in range(len(self._agents)):
+                self._agent(position)
+            self._columns = None
+        return self._agents
+
+    def add(self, agent: AvotAgent) -> None:
+        """Append an agent and index it; a repeated codename raises ``ValueError``."""
+
+        if agent.codename in self._by_codename:
+            raise ValueError(f"duplicate AVOT codename {agent.codename!r}")
+        position = len(self._agents)
+        self._agents.append(agent)
+        self._by_codename[agent.codename] = position
+        self._by_tone.setdefault(agent.tone_signature, []).append(position)
+        for capability in agent.capabilities:
+            self._by_capability.setdefault(capability, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def __iter__(self) -> Iterator[AvotAgent]:
+        return (self._agent(position) for position in range(len(self._agents)))
+
+    def __contains__(self, codename: object) -> bool:
+        return codename in self._by_codename
+
+    def get(self, codename: str) -> Optional[AvotAgent]:
+        """Return the agent registered under ``codename``, or ``None``."""
+
+        position = self._by_codename.get(codename)
+        return None if position is None else self._agent(position)
+
+    def at(self, position: int) -> AvotAgent:
+        return self._agent(range(len(self._agents))[position])
+
+    def with_capability(self, capability: str) -> List[AvotAgent]:
+        return [self._agent(position) for position in self._by_capability.get(capability, ())]
+
+    def with_tone(self, tone_signature: str) -> List[AvotAgent]:
+        return [self._agent(position) for position in self._by_tone.get(tone_signature, ())]
+
+    def capabilities(self) -> List[str]:
+        return sorted(self._by_capability)
+
+    def tone_signatures(self) -> List[str]:
+        return sorted(self._by_tone)
+
+
+def _protocol_from_meta(hive_meta: Dict[str, str]) -> HiveCoreProtocol:
+    return HiveCoreProtocol(
         hive_id=hive_meta.get("id", "Sovereign-Hive-Core"),
         tyme_core_binding=hive_meta.get("binding", "Tyme-Core"),
         protocol_name=hive_meta.get("protocol", "Hive-Core Synchronization"),
     )
 
-    return {"agents": agents, "protocol": protocol}
 
+def compile_registry(raw: bytes) -> tuple:
+    """Compile registry JSON into the columnar, pre-indexed form cached on disk.
+
+    Strings are stored once in a table and referenced by index; the codename,
+    capability and tone indexes are built here so loading only unmarshals.
+    """
+
+    registry_data = json.loads(raw)
+    table: Dict[str, int] = {}
+    codenames: List[str] = []
+    missions: List[int] = []
+    tones: List[int] = []
+    ethics: List[int] = []
+    capabilities: List[tuple] = []
+    by_codename: Dict[str, int] = {}
+    by_capability: Dict[str, List[int]] = {}
+    by_tone: Dict[str, List[int]] = {}
+    for position, entry in enumerate(registry_data.get("agents", [])):
+        codename = entry["codename"]
+        if codename in by_codename:
+            raise ValueError(f"duplicate AVOT codename {codename!r}")
+        by_codename[codename] = position
+        codenames.append(codename)
+        missions.append(table.setdefault(entry["mission"], len(table)))
+        tones.append(table.setdefault(entry["tone_signature"], len(table)))
+        ethics.append(table.setdefault(entry.get("ethic", ""), len(table)))
+        capabilities.append(tuple(table.setdefault(capability, len(table)) for capability in entry.get("capabilities", [])))
+        by_tone.setdefault(entry["tone_signature"], []).append(position)
+        for capability in entry.get("capabilities", []):
+            by_capability.setdefault(capability, []).append(position)
+
+    columns = (tuple(table), tuple(codenames), tuple(missions), tuple(tones), tuple(ethics), tuple(capabilities))
+    return registry_data.get("hive_core", {}), columns, by_codename, by_capability, by_tone
+
+
+def load_avot_registry(registry_path: Path, history_depth: int = DEFAULT_HISTORY_DEPTH) -> AvotRegistry:
+    """Load the AVOT registry into an indexed :class:`AvotRegistry`.
+
+    ``history_depth`` bounds how many recent activations each agent keeps.
+    The compiled form is served from the snapshot cache in
+    :mod:`engine.registry_cache` and rebuilt whenever the JSON changes.
+    """
+
+    compiled = load_compiled(registry_path, "registry", compile_registry)
+    return AvotRegistry.from_compiled(compiled, history_depth)
+
+
+def load_registry(registry_path: Path) -> Dict[str, object]:
+    """Load the AVOT registry data from disk.
+
+    ``agents`` and ``protocol`` keep their historical shape; ``registry``
+    carries the indexed :class:`AvotRegistry` over the same agent objects.
+    """
+
+    registry = load_avot_registry(registry_path)
+    return {"agents": registry.agents, "protocol": registry.protocol, "registry": registry}
+
+
+def http_health_hook(
+    url_template: str,
+    timeout: float = DEFAULT_HOOK_TIMEOUT,
+    concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+) -> ActivationHook:
+    """Build a hook that GETs ``url_template`` (formatted with ``codename``) per agent.
+
+    The blocking requests run on a dedicated pool of ``concurrency`` worker
+    threads rather than the loop's default executor, which is capped at
+    ``min(32, cpus + 4)`` threads. Pass the same ``concurrency`` to
+    :meth:`HiveCoreProtocol.synchronize_async` so a probe never waits for a
+    free thread while its timeout is already running. The pool is exposed
+    as ``hook.executor``; shut it down once the sync is done. Any non-2xx
+    response or connection error fails the agent.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="avot-probe")
+
+    def probe(url: str) -> Dict[str, object]:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return {"url": url, "http_status": response.status}
 
-def build_hive_sync(registry_path: Path, output_path: Path) -> Dict[str, object]:
-    """Load registry entries, activate all AVOT agents, and persist the manifest."""
+    async def hook(agent: AvotAgent) -> Dict[str, object]:
+        url = url_template.format(codename=agent.codename)
+        return await asyncio.get_running_loop().run_in_executor(executor, probe, url)
+
+    hook.executor = executor
+    return hook
+
+
+def build_hive_sync(
+    registry_path: Path,
+    output_path: Path,
+    stream: bool = False,
+    state_store: Optional[AgentStateStore] = None,
+    liveness: Optional[LivenessTracker] = None,
+) -> Dict[str, object]:
+    """Load registry entries, activate all AVOT agents, and persist the manifest.
+
+    With ``stream=True`` the manifest is written batch by batch through
+    :meth:`HiveCoreProtocol.synchronize_stream` and only its summary is
+    returned; agents are built from the compiled registry as they are
+    synchronized and not kept afterwards. Activations are also recorded in ``state_store`` when given,
+    and as heartbeats in ``liveness``.
+    """
+
+    if stream:
+        compiled = load_avot_registry(registry_path)
+        return compiled.protocol.synchronize_stream(
+            compiled.iter_uncached(), output_path, state_store=state_store, liveness=liveness
+        )
 
     registry = load_registry(registry_path)
     protocol: HiveCoreProtocol = registry["protocol"]
     agents: List[AvotAgent] = registry["agents"]
 
-    manifest = protocol.synchronize(agents)
+    manifest = protocol.synchronize(agents, state_store=state_store, liveness=liveness)
     protocol.persist_manifest(manifest, output_path)
     return manifest
 
 
 __all__ = [
     "AvotAgent",
+    "AvotRegistry",
+    "ActivationHook",
     "HiveCoreProtocol",
     "build_hive_sync",
+    "compile_registry",
+    "http_health_hook",
+    "load_avot_registry",
     "load_registry",
 ]
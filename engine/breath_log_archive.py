@@ -0,0 +1,215 @@
+"""Compressed full-log retention and keyword search for Breath Cycle runs.
+
+The Breath Cycle importer only keeps a short ``log_excerpt`` per run inside
+the genesis payload. The archive defined here retains the complete log of
+each run as a gzip member on disk and maintains an inverted token index
+across every archived run, so searches resolve to run ids and line numbers
+from the index alone. The index is sharded by token hash, so a query only
+reads the shards holding its own tokens. Archives are only decompressed
+when the caller asks for the matching line text, and only for runs that
+actually matched.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import threading
+import zlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]{2,}")
+INDEX_SCHEMA = "tyme-breath-log-index/v1"
+SHARD_COUNT = 256
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a log line or query into lowercase index tokens."""
+
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def shard_for(token: str) -> str:
+    """Return the postings shard name holding ``token``."""
+
+    return f"{zlib.crc32(token.encode('utf-8')) % SHARD_COUNT:02x}"
+
+
+@dataclass
+class LogSearchHit:
+    """A single archived run matching a search query."""
+
+    run_id: int
+    line_numbers: List[int]
+    lines: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        payload: Dict[str, object] = {"run_id": self.run_id, "line_numbers": self.line_numbers}
+        if self.lines:
+            payload["lines"] = self.lines
+        return payload
+
+
+class BreathLogArchive:
+    """Store full run logs compressed per run alongside an inverted token index."""
+
+    def __init__(self, root: Path | str = Path("chronicle/breath_logs")) -> None:
+        self.root = Path(root)
+        self.index_path = self.root / "index.json"
+        self.postings_dir = self.root / "postings"
+        self._runs: Dict[str, Dict[str, object]] | None = None
+        self._shards: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def _load_runs(self) -> Dict[str, Dict[str, object]]:
+        if self._runs is None:
+            if self.index_path.exists():
+                self._runs = json.loads(self.index_path.read_text(encoding="utf-8")).get("runs", {})
+            else:
+                self._runs = {}
+        return self._runs
+
+    def _load_shard(self, name: str) -> Dict[str, Dict[str, List[int]]]:
+        shard = self._shards.get(name)
+        if shard is None:
+            path = self.postings_dir / f"{name}.json"
+            shard = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+            self._shards[name] = shard
+        return shard
+
+    def _postings(self, token: str) -> Dict[str, List[int]]:
+        return self._load_shard(shard_for(token)).get(token, {})
+
+    def archive_path(self, run_id: int) -> Path:
+        """Return the on-disk location of a run's compressed log."""
+
+        return self.root / f"{run_id}.log.gz"
+
+    def run_ids(self) -> List[int]:
+        """Return the ids of every archived run."""
+
+        return sorted(int(run_id) for run_id in self._load_runs())
+
+    def add_run(self, run_id: int, lines: Iterable[str]) -> Path:
+        """Compress a run's log to disk and index its tokens.
+
+        Re-archiving an existing run replaces both the compressed log and
+        its postings. Safe to call from several threads for distinct runs.
+        Call :meth:`save` to persist the index afterwards.
+        """
+
+        key = str(run_id)
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.archive_path(run_id)
+        line_count = 0
+        run_postings: Dict[str, List[int]] = {}
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            for line_count, line in enumerate(lines, start=1):
+                handle.write(line + "\n")
+                for token in set(tokenize(line)):
+                    run_postings.setdefault(token, []).append(line_count)
+
+        with self._lock:
+            runs = self._load_runs()
+            if key in runs:
+                self._drop_postings(key, runs[key]["shards"])
+            shards: Set[str] = set()
+            for token, line_numbers in run_postings.items():
+                name = shard_for(token)
+                self._load_shard(name).setdefault(token, {})[key] = line_numbers
+                shards.add(name)
+            self._dirty.update(shards)
+            runs[key] = {
+                "archive": path.name,
+                "lines": line_count,
+                "tokens": len(run_postings),
+                "shards": sorted(shards),
+                "archived_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            }
+        return path
+
+    def _drop_postings(self, key: str, shards: Iterable[str]) -> None:
+        """Remove a run's postings from the ``shards`` its index entry lists."""
+
+        for name in shards:
+            shard = self._load_shard(name)
+            for token in list(shard):
+                if shard[token].pop(key, None) is not None:
+                    self._dirty.add(name)
+                    if not shard[token]:
+                        del shard[token]
+
+    def save(self) -> Path:
+        """Persist the run index and every modified postings shard."""
+
+        with self._lock:
+            runs = self._load_runs()
+            self.postings_dir.mkdir(parents=True, exist_ok=True)
+            for name in sorted(self._dirty):
+                path = self.postings_dir / f"{name}.json"
+                path.write_text(json.dumps(self._shards[name], separators=(",", ":")) + "\n", encoding="utf-8")
+            self._dirty.clear()
+
+        payload = {
+            "schema": INDEX_SCHEMA,
+            "updated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "shards": SHARD_COUNT,
+            "runs": runs,
+        }
+        self.index_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        return self.index_path
+
+    def read_lines(self, run_id: int) -> List[str]:
+        """Decompress and return the full log of an archived run."""
+
+        path = self.archive_path(run_id)
+        if not path.exists():
+            return []
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            return [line.rstrip("\n") for line in handle]
+
+    def search(self, query: str, include_lines: bool = False, limit: Optional[int] = None) -> List[LogSearchHit]:
+        """Return runs whose log lines contain every token in ``query``.
+
+        Matching is resolved from the inverted index; compressed logs are
+        only opened for matching runs when ``include_lines`` is set.
+        """
+
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        postings = [self._postings(token) for token in tokens]
+        if any(not runs for runs in postings):
+            return []
+        postings.sort(key=len)
+
+        candidate_runs: Set[str] = set(postings[0])
+        for runs in postings[1:]:
+            candidate_runs &= runs.keys()
+
+        hits: List[LogSearchHit] = []
+        for key in sorted(candidate_runs, key=int, reverse=True):
+            matched: Set[int] = set(postings[0][key])
+            for runs in postings[1:]:
+                matched.intersection_update(runs[key])
+                if not matched:
+                    break
+            if not matched:
+                continue
+            line_numbers = sorted(matched)
+            hit = LogSearchHit(run_id=int(key), line_numbers=line_numbers)
+            if include_lines:
+                full_log = self.read_lines(hit.run_id)
+                hit.lines = [full_log[number - 1] for number in line_numbers if number <= len(full_log)]
+            hits.append(hit)
+            if limit is not None and len(hits) >= limit:
+                break
+        return hits
+
+
+__all__ = ["BreathLogArchive", "LogSearchHit", "tokenize"]
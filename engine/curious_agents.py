@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Dict, Iterable, List
 
-from engine.avot_engine import load_registry
+from engine.avot_engine import load_avot_registry
 from engine.metabolic_loop import MetabolicLoop
 
 
@@ -128,13 +128,11 @@ class CuriousAgentScanner:
         return traces
 
     def assign_avot_roles(self, traces: Iterable[CuriousAgentTrace]) -> None:
-        registry = load_registry(self.avot_registry)
-        avot_agents = registry.get("agents", [])
-        if not avot_agents:
+        registry = load_avot_registry(self.avot_registry)
+        if not len(registry):
             return
         for idx, trace in enumerate(traces):
-            avot_agent = avot_agents[idx % len(avot_agents)]
-            trace.avot_role = avot_agent.codename
+            trace.avot_role = registry.at(idx % len(registry)).codename
 
     def bind_breath_rhythm(self, traces: Iterable[CuriousAgentTrace]) -> Dict[str, object]:
         """Attach metabolic loop pacing data to each trace."""
@@ -0,0 +1,199 @@
+"""Vectorized outlier and change-point detection over breath cycle durations.
+
+A single stuck run can drag the metabolic loop's pacing far from what the
+Breath Cycle usually takes. This module scores every duration with a robust
+z-score (median and median absolute deviation, so the outliers themselves do
+not inflate the scale) and locates level shifts with binary segmentation on
+cumulative sums. Both passes are NumPy array operations and stay well under
+a second for a million cycles.
+
+NumPy is optional for the rest of the engine; when it is not installed the
+detector reports itself as unavailable instead of failing the caller.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+try:  # pragma: no cover - exercised implicitly by the import environment
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+MAD_SCALE = 0.6745
+DEFAULT_THRESHOLD = 3.5
+
+
+def numpy_available() -> bool:
+    """Report whether the vectorized detector can run."""
+
+    return np is not None
+
+
+def robust_zscores(durations: "np.ndarray") -> "tuple[np.ndarray, float, float]":
+    """Return modified z-scores plus the median and MAD they were scaled by."""
+
+    median = float(np.median(durations))
+    deviations = np.abs(durations - median)
+    mad = float(np.median(deviations))
+    if mad == 0.0:
+        # More than half the cycles share one duration; fall back to the mean
+        # absolute deviation so genuine outliers still stand out.
+        mad = float(deviations.mean()) * 0.7979
+    if mad == 0.0:
+        return np.zeros_like(durations), median, 0.0
+    return MAD_SCALE * (durations - median) / mad, median, mad
+
+
+def _best_split(segment: "np.ndarray", min_size: int) -> "tuple[int, float]":
+    n = segment.size
+    sums = np.cumsum(segment)[:-1]
+    left = np.arange(1, n, dtype=np.float64)
+    right = n - left
+    gap = sums / left - (sums[-1] + segment[-1] - sums) / right
+    gain = left * right / n * gap * gap
+    gain[: min_size - 1] = -1.0
+    gain[n - min_size :] = -1.0
+    index = int(np.argmax(gain))
+    return index + 1, float(gain[index])
+
+
+def detect_change_points(
+    durations: "np.ndarray",
+    max_change_points: int = 5,
+    min_size: int = 5,
+    penalty: Optional[float] = None,
+) -> List[int]:
+    """Locate level shifts in a duration series by binary segmentation.
+
+    A split is accepted when the reduction in squared error exceeds
+    ``penalty`` times the noise variance, estimated robustly from
+    first differences. Returns sorted indices where a new level starts.
+    """
+
+    n = durations.size
+    if n < 2 * min_size:
+        return []
+    noise = float(np.median(np.abs(np.diff(durations)))) / (MAD_SCALE * math.sqrt(2))
+    if noise == 0.0:
+        noise = float(durations.std()) or 1.0
+    threshold = (penalty if penalty is not None else 3.0 * math.log(n)) * noise * noise
+
+    change_points: List[int] = []
+    segments = [(0, n)]
+    while segments and len(change_points) < max_change_points:
+        candidates = []
+        for start, stop in segments:
+            if stop - start >= 2 * min_size:
+                offset, gain = _best_split(durations[start:stop], min_size)
+                if gain > threshold:
+                    candidates.append((gain, start, stop, start + offset))
+        if not candidates:
+            break
+        gain, start, stop, split = max(candidates)
+        change_points.append(split)
+        segments.remove((start, stop))
+        segments.extend([(start, split), (split, stop)])
+    return sorted(change_points)
+
+
+@dataclass
+class AnomalyReport:
+    """Outlier and change-point findings for a duration history."""
+
+    available: bool
+    threshold: float
+    cycles: int = 0
+    median_seconds: Optional[float] = None
+    mad_seconds: Optional[float] = None
+    flagged: List[Dict[str, object]] = field(default_factory=list)
+    change_points: List[Dict[str, object]] = field(default_factory=list)
+
+    @property
+    def flagged_run_ids(self) -> List[object]:
+        return [entry["run_id"] for entry in self.flagged if entry.get("run_id") is not None]
+
+    def to_dict(self, flagged_limit: int = 50) -> Dict[str, object]:
+        if not self.available:
+            return {"available": False, "reason": "numpy is not installed"}
+        return {
+            "available": True,
+            "method": "robust-z (median/MAD) + binary-segmentation change points",
+            "threshold": self.threshold,
+            "cycles": self.cycles,
+            "median_seconds": self.median_seconds,
+            "mad_seconds": self.mad_seconds,
+            "flagged_count": len(self.flagged),
+            "flagged": self.flagged[:flagged_limit],
+            "change_points": self.change_points,
+        }
+
+
+def detect_anomalies(
+    durations: Sequence[float],
+    run_ids: Optional[Sequence[object]] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    max_change_points: int = 5,
+) -> AnomalyReport:
+    """Flag outlier durations and level shifts across a cycle history.
+
+    ``durations`` should be in chronological order; ``run_ids`` (same
+    length) label the findings. Change points are searched on durations
+    clipped to the robust band so a single outlier cannot fake a shift.
+    """
+
+    if np is None:
+        return AnomalyReport(available=False, threshold=threshold)
+
+    values = np.asarray(durations, dtype=np.float64)
+    report = AnomalyReport(available=True, threshold=threshold, cycles=int(values.size))
+    if not values.size:
+        return report
+
+    scores, median, mad = robust_zscores(values)
+    report.median_seconds = round(median, 2)
+    report.mad_seconds = round(mad, 2)
+
+    def label(index: int) -> object:
+        return run_ids[index] if run_ids is not None else index
+
+    outliers = np.flatnonzero(np.abs(scores) > threshold)
+    order = outliers[np.argsort(-np.abs(scores[outliers]), kind="stable")]
+    report.flagged = [
+        {
+            "run_id": label(int(index)),
+            "duration_seconds": float(values[index]),
+            "score": round(float(scores[index]), 2),
+        }
+        for index in order
+    ]
+
+    if mad:
+        band = threshold * mad / MAD_SCALE
+        clipped = np.clip(values, median - band, median + band)
+    else:
+        clipped = values
+    splits = detect_change_points(clipped, max_change_points=max_change_points)
+    bounds = [0, *splits, values.size]
+    for position, split in enumerate(splits, start=1):
+        before = clipped[bounds[position - 1] : split]
+        after = clipped[split : bounds[position + 1]]
+        report.change_points.append(
+            {
+                "run_id": label(split),
+                "index": split,
+                "mean_before_seconds": round(float(before.mean()), 2),
+                "mean_after_seconds": round(float(after.mean()), 2),
+            }
+        )
+    return report
+
+
+__all__ = [
+    "AnomalyReport",
+    "detect_anomalies",
+    "detect_change_points",
+    "numpy_available",
+    "robust_zscores",
+]
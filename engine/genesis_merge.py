@@ -0,0 +1,88 @@
+"""Merge the breath cycles of several genesis payloads into one stream.
+
+Each repository (or shard of one) produces its own
+``TYME-PULSE-GENESIS.json`` with ``breath_cycles`` sorted newest first by
+``started_at``; a file that is not raises :class:`ValueError` while it is
+merged.
+:func:`merge_genesis_cycles` walks every file lazily through
+:func:`engine.selective_json.iter_array` and combines them with a heap-based
+k-way merge, so only one projected cycle per source is held at a time.
+Cycles are keyed by ``(repo, run_id)``; the repo comes from each file's
+``source`` block, and copies of the same run (a shard exported twice, an
+overlapping fetch window, a re-run attempt) are emitted once: the first,
+newest copy wins.
+"""
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from .selective_json import iter_array, read_keys
+
+UNKNOWN_REPO = "unknown"
+# Most recently emitted run keys remembered to drop later copies of a run.
+DEFAULT_DEDUP_WINDOW = 65536
+
+
+def source_repo(path: Path | str) -> str:
+    """Return ``owner/repo`` from a genesis file's ``source`` block."""
+
+    source = read_keys(path, ["source"]).get("source")
+    if not isinstance(source, dict):
+        return UNKNOWN_REPO
+    owner, repo = source.get("owner"), source.get("repo")
+    if owner and repo:
+        return f"{owner}/{repo}"
+    return repo or UNKNOWN_REPO
+
+
+def _started_at(cycle: dict) -> str:
+    return cycle.get("started_at") or ""
+
+
+def _tagged_cycles(path: Path | str, fields: Optional[Sequence[str]]) -> Iterator[dict]:
+    repo = source_repo(path)
+    wanted = None if fields is None else [*fields, "run_id", "started_at"]
+    previous: Optional[str] = None
+    for cycle in iter_array(path, "breath_cycles", wanted):
+        started_at = _started_at(cycle)
+        if previous is not None and started_at > previous:
+            raise ValueError(f"{path}: breath_cycles are not sorted newest first by started_at")
+        previous = started_at
+        cycle["repo"] = repo
+        yield cycle
+
+
+def merge_genesis_cycles(
+    paths: Iterable[Path | str],
+    fields: Optional[Sequence[str]] = None,
+    dedup_window: int = DEFAULT_DEDUP_WINDOW,
+) -> Iterator[dict]:
+    """Yield the cycles of every genesis file in ``paths``, newest first.
+
+    Each cycle gains a ``repo`` field. ``fields`` limits the members decoded
+    per cycle (``run_id`` and ``started_at`` are always read because the
+    merge orders and deduplicates on them). Every file must be sorted newest
+    first by ``started_at``, otherwise :class:`ValueError` is raised. A run
+    is emitted once per ``(repo, run_id)``, as its first (newest) copy; the
+    last ``dedup_window`` keys are remembered, so copies further apart than
+    that in the merged stream are not recognized.
+    """
+
+    streams = [_tagged_cycles(path, fields) for path in paths]
+    seen: "OrderedDict[Tuple[str, int], None]" = OrderedDict()
+    for cycle in heapq.merge(*streams, key=_started_at, reverse=True):
+        if cycle.get("run_id"):
+            identity = (cycle["repo"], int(cycle["run_id"]))
+            if identity in seen:
+                seen.move_to_end(identity)
+                continue
+            seen[identity] = None
+            if len(seen) > dedup_window:
+                seen.popitem(last=False)
+        yield cycle
+
+
+__all__ = ["DEFAULT_DEDUP_WINDOW", "merge_genesis_cycles", "source_repo"]
@@ -0,0 +1,96 @@
+"""Per-group breath cycle statistics computed in one vectorized pass.
+
+Failed runs, feature branches and secondary workflows take very different
+amounts of time, so a single global pacing value hides them. Each grouping
+dimension (workflow name, ``head_branch`` and ``conclusion`` by default) is
+factorized into integer codes; the codes of all dimensions are offset into
+one shared range and a single ``bincount`` pass produces counts, sums and
+sums of squares for every group at once.
+
+NumPy is optional; without it the same figures are accumulated in a plain
+dictionary pass.
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+try:  # pragma: no cover - exercised implicitly by the import environment
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+DEFAULT_DIMENSIONS = {"workflow": "name", "branch": "head_branch", "conclusion": "conclusion"}
+UNKNOWN_GROUP = "unknown"
+
+
+def _summaries(counts: List[float], sums: List[float], squares: List[float]) -> List[Dict[str, Optional[float]]]:
+    summaries = []
+    for count, total, square in zip(counts, sums, squares):
+        mean = total / count
+        variance = max(square - count * mean * mean, 0.0) / (count - 1) if count > 1 else 0.0
+        summaries.append({"cycles": int(count), "mean": mean, "stddev": math.sqrt(variance)})
+    return summaries
+
+
+def group_duration_stats(
+    cycles: Iterable[dict],
+    dimensions: Optional[Dict[str, str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+    """Return ``{dimension: {group: {cycles, mean, stddev}}}`` over cycle durations.
+
+    ``dimensions`` maps an output name to the cycle field it groups by;
+    cycles missing the field fall into the ``"unknown"`` group.
+    """
+
+    dimensions = dict(DEFAULT_DIMENSIONS if dimensions is None else dimensions)
+    timed = [cycle for cycle in cycles if isinstance(cycle.get("duration_seconds"), (int, float))]
+    labels = {
+        name: [str(cycle.get(field) or UNKNOWN_GROUP) for cycle in timed] for name, field in dimensions.items()
+    }
+    if not timed:
+        return {name: {} for name in dimensions}
+
+    if np is None:
+        grouped: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+        durations = [float(cycle["duration_seconds"]) for cycle in timed]
+        for name, values in labels.items():
+            totals: Dict[str, List[float]] = {}
+            for label, duration in zip(values, durations):
+                bucket = totals.setdefault(label, [0.0, 0.0, 0.0])
+                bucket[0] += 1
+                bucket[1] += duration
+                bucket[2] += duration * duration
+            keys = sorted(totals)
+            stats = _summaries(*zip(*(totals[key] for key in keys)))
+            grouped[name] = dict(zip(keys, stats))
+        return grouped
+
+    durations = np.fromiter((cycle["duration_seconds"] for cycle in timed), dtype=np.float64, count=len(timed))
+    names: List[str] = []
+    keys_per_dimension: List[np.ndarray] = []
+    codes: List[np.ndarray] = []
+    offset = 0
+    for name, values in labels.items():
+        keys, inverse = np.unique(np.asarray(values, dtype=object), return_inverse=True)
+        names.append(name)
+        keys_per_dimension.append(keys)
+        codes.append(inverse + offset)
+        offset += keys.size
+
+    all_codes = np.concatenate(codes)
+    stacked = np.tile(durations, len(codes))
+    counts = np.bincount(all_codes, minlength=offset)
+    sums = np.bincount(all_codes, weights=stacked, minlength=offset)
+    squares = np.bincount(all_codes, weights=stacked * stacked, minlength=offset)
+    stats = _summaries(counts.tolist(), sums.tolist(), squares.tolist())
+
+    grouped = {}
+    start = 0
+    for name, keys in zip(names, keys_per_dimension):
+        grouped[name] = {str(key): stats[start + index] for index, key in enumerate(keys)}
+        start += keys.size
+    return grouped
+
+
+__all__ = ["DEFAULT_DIMENSIONS", "group_duration_stats"]
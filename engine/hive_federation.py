@@ -0,0 +1,164 @@
+"""Federated synchronization across several AVOT hives.
+
+Each registry carries its own ``hive_core`` block and agent roster. A
+federation loads every registry in its own worker process, synchronizes
+that hive there (so activation work scales with the available cores), and
+merges the per-hive manifests into one federated manifest. Codenames that
+appear in more than one hive are reported as conflicts, since downstream
+lookups by codename would otherwise resolve to an arbitrary hive.
+
+Workers write their hive's manifest to disk and send back only a summary
+(hive metadata, codenames and the manifest path), so full agent rosters are
+never pickled between processes. The parent streams the agents from those
+files into the federated manifest one hive at a time.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .avot_engine import HiveCoreProtocol, load_avot_registry
+
+
+def hive_manifest_path(hive_output_dir: Path | str, index: int, registry_path: Path | str) -> Path:
+    """Where the manifest of the ``index``-th registry is written.
+
+    Files are named by position and registry stem rather than hive id, so
+    registries that share a hive id do not overwrite each other.
+    """
+
+    return Path(hive_output_dir) / f"{index:03d}-{Path(registry_path).stem}.json"
+
+
+def _hive_entry(manifest: Dict[str, object], manifest_path: Optional[Path] = None) -> Dict[str, object]:
+    roster = manifest.get("agents", [])
+    return {
+        "hive": manifest["hive"],
+        "binding": manifest["binding"],
+        "protocol": manifest["protocol"],
+        "registry": manifest.get("registry"),
+        "synchronized_at": manifest["synchronized_at"],
+        "agent_count": len(roster),
+        "manifest": str(manifest_path) if manifest_path is not None else None,
+        "codenames": [record["codename"] for record in roster],
+    }
+
+
+def synchronize_hive(registry_path: Path | str, hive_output_dir: Path | str, index: int = 0) -> Dict[str, object]:
+    """Load one registry, synchronize its hive and persist the manifest.
+
+    Runs inside a worker process. The manifest is written to
+    :func:`hive_manifest_path` and only its summary is returned: the hive
+    metadata, agent count, codenames and ``manifest`` path.
+    """
+
+    registry = load_avot_registry(Path(registry_path))
+    manifest = registry.protocol.synchronize(registry.agents)
+    manifest["registry"] = str(registry_path)
+    manifest_path = hive_manifest_path(hive_output_dir, index, registry_path)
+    HiveCoreProtocol.persist_manifest(manifest, manifest_path)
+    return _hive_entry(manifest, manifest_path)
+
+
+def summarize_federation(entries: Sequence[Dict[str, object]]) -> Dict[str, object]:
+    """Combine per-hive summaries and flag codenames claimed by several hives."""
+
+    hives: List[Dict[str, object]] = []
+    claimed: Dict[str, List[str]] = {}
+    for entry in entries:
+        hives.append({key: value for key, value in entry.items() if key != "codenames"})
+        for codename in entry["codenames"]:
+            claimed.setdefault(codename, []).append(entry["hive"])
+
+    conflicts = [{"codename": codename, "hives": owners} for codename, owners in claimed.items() if len(owners) > 1]
+    hive_ids = [hive["hive"] for hive in hives]
+    return {
+        "federation": sorted(set(hive_ids)),
+        "synchronized_at": datetime.now(UTC).isoformat(),
+        "hives": hives,
+        "conflicts": conflicts,
+        "summary": {
+            "hives": len(hives),
+            "agents": sum(hive["agent_count"] for hive in hives),
+            "unique_codenames": len(claimed),
+            "conflicting_codenames": len(conflicts),
+            "duplicate_hive_ids": sorted({hive for hive in hive_ids if hive_ids.count(hive) > 1}),
+        },
+    }
+
+
+def merge_hive_manifests(manifests: Sequence[Dict[str, object]]) -> Dict[str, object]:
+    """Combine in-memory per-hive manifests into one federated manifest with every agent."""
+
+    federated = summarize_federation([_hive_entry(manifest) for manifest in manifests])
+    federated["agents"] = [
+        {**record, "hive": manifest["hive"]} for manifest in manifests for record in manifest.get("agents", [])
+    ]
+    return federated
+
+
+def _write_federated(federated: Dict[str, object], manifest_paths: Sequence[Path | str], output_path: Path) -> None:
+    """Write ``federated`` with the agents streamed from each hive manifest in turn."""
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    staging = output_path.with_name(output_path.name + ".tmp")
+    header = {key: federated[key] for key in ("federation", "synchronized_at", "hives")}
+    trailer = {key: federated[key] for key in ("conflicts", "summary")}
+    written = 0
+    with staging.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps(header)[:-1] + ', "agents": [')
+        for hive, manifest_path in zip(federated["hives"], manifest_paths):
+            manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+            for record in manifest.get("agents", []):
+                handle.write((",\n" if written else "\n") + json.dumps({**record, "hive": hive["hive"]}))
+                written += 1
+        handle.write("\n], " + json.dumps(trailer)[1:] + "\n")
+    staging.replace(output_path)
+
+
+def build_federated_sync(
+    registry_paths: Sequence[Path | str],
+    output_path: Path,
+    workers: Optional[int] = None,
+    hive_output_dir: Optional[Path | str] = None,
+) -> Dict[str, object]:
+    """Synchronize every hive in parallel and persist the federated manifest.
+
+    ``workers`` defaults to one process per registry, capped at the CPU
+    count; a single registry is synchronized in-process. Per-hive manifests
+    are kept in ``hive_output_dir`` when given, otherwise in a temporary
+    directory removed afterwards. The returned manifest carries everything
+    but the agent list, plus the ``output`` path.
+    """
+
+    count = len(registry_paths)
+    workers = workers or min(count, os.cpu_count() or 1)
+    keep = hive_output_dir is not None
+    with nullcontext(hive_output_dir) if keep else tempfile.TemporaryDirectory(prefix="hive-federation-") as directory:
+        if workers <= 1 or count <= 1:
+            entries = [synchronize_hive(path, directory, index) for index, path in enumerate(registry_paths)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                entries = list(pool.map(synchronize_hive, registry_paths, [directory] * count, range(count)))
+        manifest_paths = [entry["manifest"] for entry in entries]
+        if not keep:
+            for entry in entries:
+                entry["manifest"] = None
+        federated = summarize_federation(entries)
+        _write_federated(federated, manifest_paths, output_path)
+    return {**federated, "output": str(output_path)}
+
+
+__all__ = [
+    "build_federated_sync",
+    "hive_manifest_path",
+    "merge_hive_manifests",
+    "summarize_federation",
+    "synchronize_hive",
+]
@@ -0,0 +1,338 @@
+"""Parallel, memoized execution of ``LayerBridge`` integrity checks.
+
+Every bridge names its integrity checks (``coherence-check``,
+``signal-to-intent``, ``guardrail-bind`` and so on). This module resolves
+those names against a registry of check functions and runs every
+(bridge, check) pair in a worker pool.
+
+Results are memoized under a SHA-256 of five things:
+
+* the bridge definition,
+* the inputs the bridge was verified against,
+* the check name,
+* the function registered for that name, by qualified name and by a
+  fingerprint of its bytecode and constants, so editing a check
+  invalidates its cached results,
+* the names registered with the executor.
+
+Re-verifying an unchanged bridge is therefore a dictionary lookup. Pass
+``cache_path`` to keep that memo across processes. Results of checks that
+raised are never memoized, so a transient failure is retried next time.
+
+A check receives the bridge and a read-only mapping of inputs. It returns
+either a bool or a ``(passed, detail)`` pair. An exception raised by a
+check is recorded as a failure, and so is a name nothing is registered
+under. Neither stops the other checks. While a check runs,
+:func:`active_registry` returns the registry of the executor running it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import CodeType, MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    from .quill_lattice import LayerBridge
+
+CheckReturn = Union[bool, Tuple[bool, str]]
+IntegrityCheck = Callable[["LayerBridge", Mapping[str, object]], CheckReturn]
+
+CHECK_REGISTRY: Dict[str, IntegrityCheck] = {}
+_ACTIVE_REGISTRY: ContextVar[Mapping[str, IntegrityCheck]] = ContextVar("integrity_registry", default=CHECK_REGISTRY)
+_CHANNEL_NAME = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+# Retention above 1 means a bridge amplified the signal it carried.
+_RETENTION_CEILING = 1.05
+
+
+def register_check(name: str) -> Callable[[IntegrityCheck], IntegrityCheck]:
+    """Decorator registering ``function`` as the integrity check called ``name``."""
+
+    def decorator(function: IntegrityCheck) -> IntegrityCheck:
+        CHECK_REGISTRY[name] = function
+        return function
+
+    return decorator
+
+
+def active_registry() -> Mapping[str, IntegrityCheck]:
+    """The registry of the executor running the current check (``CHECK_REGISTRY`` outside one)."""
+
+    return _ACTIVE_REGISTRY.get()
+
+
+def bridge_key(bridge: "LayerBridge") -> str:
+    return f"{bridge.source_layer}->{bridge.target_layer}"
+
+
+def _layers(inputs: Mapping[str, object]) -> Mapping[str, Sequence[str]]:
+    return inputs.get("layers") or {}
+
+
+@register_check("coherence-check")
+def coherence_check(bridge: "LayerBridge", inputs: Mapping[str, object]) -> CheckReturn:
+    if bridge.source_layer == bridge.target_layer:
+        return False, "bridge loops back onto its source layer"
+    if not bridge.channels:
+        return False, "bridge carries no channels"
+    if len(set(bridge.channels)) != len(bridge.channels):
+        return False, "duplicate channels"
+    return True, f"{len(bridge.channels)} distinct channels"
+
+
+@register_check("resonance-alignment")
+def resonance_alignment(bridge: "LayerBridge", inputs: Mapping[str, object]) -> CheckReturn:
+    layers = _layers(inputs)
+    missing = [layer for layer in (bridge.source_layer, bridge.target_layer) if layers and layer not in layers]
+    if missing:
+        return False, f"undeclared layers: {', '.join(missing)}"
+    return True, "endpoints declared"
+
+
+@register_check("signal-to-intent")
+def signal_to_intent(bridge: "LayerBridge", inputs: Mapping[str, object]) -> CheckReturn:
+    malformed = [channel for channel in bridge.channels if not _CHANNEL_NAME.match(channel)]
+    if malformed:
+        return False, f"malformed channels: {', '.join(malformed)}"
+    if _layers(inputs) and not _layers(inputs).get(bridge.target_layer):
+        return False, "target layer has no members to carry intent"
+    return True, "channels well-formed"
+
+
+@register_check("lineage-preserve")
+def lineage_preserve(bridge: "LayerBridge", inputs: Mapping[str, object]) -> CheckReturn:
+    if _layers(inputs) and not _layers(inputs).get(bridge.source_layer):
+        return False, "source layer has no members to inherit from"
+    return True, "source lineage present"
+
+
+@register_check("harmonic-safety")
+def harmonic_safety(bridge: "LayerBridge", inputs: Mapping[str, object]) -> CheckReturn:
+    retention = inputs.get("retention")
+    if retention is None:
+        return True, "no simulation attached"
+    retention = float(retention)
+    if not retention == retention or retention > _RETENTION_CEILING:
+        return False, f"bridge amplifies signal (retention {retention:.3f})"
+    return True, f"retention {retention:.3f}"
+
+
+@register_check("guardrail-bind")
+def guardrail_bind(bridge: "LayerBridge", inputs: Mapping[str, object]) -> CheckReturn:
+    registry = active_registry()
+    unbound = [name for name in bridge.integrity_checks if name not in registry]
+    if unbound:
+        return False, f"unregistered checks: {', '.join(unbound)}"
+    return True, "every declared check is registered"
+
+
+@dataclass
+class CheckResult:
+    """The outcome of one integrity check on one bridge."""
+
+    name: str
+    passed: bool
+    detail: str
+    latency_seconds: float
+    cached: bool = False
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "detail": self.detail,
+            "latency_seconds": self.latency_seconds,
+            "cached": self.cached,
+        }
+
+
+def _canonical(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _code_parts(code: CodeType) -> Iterator[bytes]:
+    yield code.co_code
+    yield repr(code.co_names).encode("utf-8")
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _code_parts(const)
+        elif isinstance(const, frozenset):
+            # Set iteration order depends on string hashing, which varies per process.
+            yield repr(sorted(map(repr, const))).encode("utf-8")
+        else:
+            yield repr(const).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint(function: IntegrityCheck) -> str:
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return ""
+    digest = hashlib.sha256()
+    for part in _code_parts(code):
+        digest.update(part)
+    return digest.hexdigest()[:16]
+
+
+def _function_id(function: Optional[IntegrityCheck]) -> str:
+    if function is None:
+        return "<unregistered>"
+    name = f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', repr(function))}"
+    return f"{name}@{_code_fingerprint(function)}"
+
+
+class IntegrityExecutor:
+    """Run registered integrity checks for many bridges concurrently, memoizing results."""
+
+    def __init__(
+        self,
+        registry: Optional[Mapping[str, IntegrityCheck]] = None,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Path | str] = None,
+    ) -> None:
+        self.registry = registry if registry is not None else CHECK_REGISTRY
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._memo: Dict[str, Dict[str, object]] = {}
+        if self.cache_path is not None and self.cache_path.exists():
+            try:
+                self._memo = json.loads(self.cache_path.read_text())
+            except (OSError, ValueError):
+                self._memo = {}
+
+    def memo_key(self, bridge: "LayerBridge", name: str, inputs: Mapping[str, object]) -> str:
+        payload = _canonical(
+            [bridge.to_dict(), dict(inputs), name, _function_id(self.registry.get(name)), sorted(self.registry)]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _run(self, bridge: "LayerBridge", name: str, inputs: Mapping[str, object]) -> Tuple[CheckResult, bool]:
+        """Run one check; return its result and whether it may be memoized."""
+
+        function = self.registry.get(name)
+        started = time.perf_counter()
+        cacheable = True
+        if function is None:
+            passed, detail = False, "no check registered under this name"
+        else:
+            token = _ACTIVE_REGISTRY.set(self.registry)
+            try:
+                outcome = function(bridge, inputs)
+            except Exception as exc:  # a failing check must not sink the rest
+                passed, detail = False, f"{type(exc).__name__}: {exc}"
+                cacheable = False
+            else:
+                passed, detail = outcome if isinstance(outcome, tuple) else (bool(outcome), "")
+            finally:
+                _ACTIVE_REGISTRY.reset(token)
+        return CheckResult(name, bool(passed), str(detail), time.perf_counter() - started), cacheable
+
+    def verify(
+        self,
+        bridges: Iterable["LayerBridge"],
+        inputs: Optional[Mapping[str, object]] = None,
+        bridge_inputs: Optional[Mapping[str, Mapping[str, object]]] = None,
+    ) -> Dict[str, object]:
+        """Verify every bridge and return per-bridge results plus a latency summary.
+
+        ``inputs`` are shared by all bridges. ``bridge_inputs`` adds entries
+        for single bridges, keyed ``"source->target"``.
+
+        ``latency_seconds_by_check`` lists every check with its total
+        ``seconds`` across bridges. Memoized results count with the latency
+        stored when they last ran, and ``cached`` is true when no bridge
+        executed the check in this call.
+        """
+
+        started = time.perf_counter()
+        bridges = list(bridges)
+        shared = dict(inputs or {})
+        per_bridge = bridge_inputs or {}
+        plan: List[Tuple[int, str, str, Mapping[str, object]]] = []
+        results: Dict[Tuple[int, str], CheckResult] = {}
+        for index, bridge in enumerate(bridges):
+            merged = MappingProxyType({**shared, **per_bridge.get(bridge_key(bridge), {})})
+            for name in bridge.integrity_checks:
+                key = self.memo_key(bridge, name, merged)
+                hit = self._memo.get(key)
+                if hit is not None:
+                    results[(index, name)] = CheckResult(
+                        name, bool(hit["passed"]), str(hit["detail"]), float(hit["latency_seconds"]), cached=True
+                    )
+                else:
+                    plan.append((index, name, key, merged))
+
+        if plan:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(plan))) as pool:
+                futures = [pool.submit(self._run, bridges[index], name, merged) for index, name, _, merged in plan]
+                for (index, name, key, _), future in zip(plan, futures):
+                    result, cacheable = future.result()
+                    results[(index, name)] = result
+                    if cacheable:
+                        self._memo[key] = {
+                            "passed": result.passed,
+                            "detail": result.detail,
+                            "latency_seconds": result.latency_seconds,
+                        }
+            self._save()
+
+        reports = []
+        latency: Dict[str, Dict[str, object]] = {}
+        for index, bridge in enumerate(bridges):
+            checks = [results[(index, name)] for name in bridge.integrity_checks]
+            for check in checks:
+                entry = latency.setdefault(check.name, {"seconds": 0.0, "cached": True})
+                entry["seconds"] += check.latency_seconds
+                entry["cached"] = entry["cached"] and check.cached
+            reports.append(
+                {
+                    "source": bridge.source_layer,
+                    "target": bridge.target_layer,
+                    "passed": all(check.passed for check in checks),
+                    "checks": [check.to_dict() for check in checks],
+                }
+            )
+
+        every = list(results.values())
+        return {
+            "bridges": reports,
+            "summary": {
+                "checks": len(every),
+                "passed": sum(check.passed for check in every),
+                "failed": sum(not check.passed for check in every),
+                "executed": len(plan),
+                "cached": len(every) - len(plan),
+                "latency_seconds_by_check": latency,
+                "elapsed_seconds": time.perf_counter() - started,
+            },
+        }
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        staged = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        staged.write_text(json.dumps(self._memo))
+        staged.replace(self.cache_path)
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+
+__all__ = [
+    "CHECK_REGISTRY",
+    "CheckResult",
+    "IntegrityCheck",
+    "IntegrityExecutor",
+    "active_registry",
+    "bridge_key",
+    "register_check",
+]
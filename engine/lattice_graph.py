@@ -0,0 +1,308 @@
+"""Indexed graph view over the Quill lattice's layers and bridges.
+
+``QuillLatticePrototype`` keeps layers as string lists and bridges as a
+flat list, so a question like "which channels connect harmonic to
+computational" used to mean a manual scan. :class:`LatticeGraph` indexes the
+same definition. Each layer gets an integer node id. Each bridge is an edge
+with an id, and per-node out/in adjacency arrays hold those edge ids.
+
+Path and channel-set queries are memoized. Distances and BFS parents are
+cached per source layer, and reverse distances per target layer. Channel sets
+are cached per ``(source, target)`` pair. Adding a bridge updates these
+caches in place instead of clearing them:
+
+* Cached distance trees that the new edge shortens are relaxed from the
+  edge outward.
+* A channel set is dropped only when the new edge lies between its source
+  and target.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .quill_lattice import LayerBridge, QuillLatticePrototype
+
+
+class _DistanceTree:
+    """BFS distances and parent edges from one root, in one direction."""
+
+    __slots__ = ("distance", "parent_edge")
+
+    def __init__(self) -> None:
+        self.distance: Dict[int, int] = {}
+        self.parent_edge: Dict[int, int] = {}
+
+
+class LatticeGraph:
+    """Layers as nodes and bridges as directed edges, with memoized queries."""
+
+    def __init__(self) -> None:
+        self._node_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._members: List[List[str]] = []
+        self._out_edges: List[List[int]] = []
+        self._in_edges: List[List[int]] = []
+        self._edge_source: List[int] = []
+        self._edge_target: List[int] = []
+        self._edge_bridges: List["LayerBridge"] = []
+        self._edges_by_pair: Dict[Tuple[int, int], List[int]] = {}
+        self._forward: Dict[int, _DistanceTree] = {}
+        self._backward: Dict[int, _DistanceTree] = {}
+        self._channel_sets: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+
+    @classmethod
+    def from_prototype(cls, lattice: "QuillLatticePrototype") -> "LatticeGraph":
+        graph = cls()
+        for name, members in lattice.layers().items():
+            graph.add_layer(name, members)
+        graph.add_bridges(lattice.bridges)
+        return graph
+
+    # -- structure -----------------------------------------------------
+
+    @property
+    def node_count(self) -> int:
+        return len(self._names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edge_bridges)
+
+    def __contains__(self, layer: object) -> bool:
+        return layer in self._node_ids
+
+    def node_id(self, layer: str) -> int:
+        try:
+            return self._node_ids[layer]
+        except KeyError:
+            raise KeyError(f"Unknown lattice layer: {layer}") from None
+
+    def layer(self, node_id: int) -> str:
+        return self._names[node_id]
+
+    def layers(self) -> List[str]:
+        return list(self._names)
+
+    def members(self, layer: str) -> List[str]:
+        return list(self._members[self.node_id(layer)])
+
+    def add_layer(self, name: str, members: Iterable[str] = ()) -> int:
+        """Register ``name`` (or extend its members) and return its node id."""
+
+        node = self._node_ids.get(name)
+        if node is None:
+            node = len(self._names)
+            self._node_ids[name] = node
+            self._names.append(name)
+            self._members.append([])
+            self._out_edges.append([])
+            self._in_edges.append([])
+        known = self._members[node]
+        known.extend(member for member in members if member not in known)
+        return node
+
+    def add_bridge(self, bridge: "LayerBridge") -> int:
+        """Index ``bridge`` as a new edge and update memoized queries; return its edge id."""
+
+        source = self.add_layer(bridge.source_layer)
+        target = self.add_layer(bridge.target_layer)
+        edge = len(self._edge_bridges)
+        self._edge_source.append(source)
+        self._edge_target.append(target)
+        self._edge_bridges.append(bridge)
+        self._out_edges[source].append(edge)
+        self._in_edges[target].append(edge)
+        self._edges_by_pair.setdefault((source, target), []).append(edge)
+
+        # The edge joins a channel set only if its source is reachable from the
+        # set's source and the set's target is reachable from its target. Any
+        # path that uses the new edge has already reached those nodes, so the
+        # trees that have not been relaxed yet answer this correctly.
+        stale = [
+            pair
+            for pair in self._channel_sets
+            if self._reaches(pair[0], source) and self._reaches_back(pair[1], target)
+        ]
+        for pair in stale:
+            del self._channel_sets[pair]
+        for tree in self._forward.values():
+            self._relax(tree, source, target, edge, self._out_edges, self._edge_target)
+        for tree in self._backward.values():
+            self._relax(tree, target, source, edge, self._in_edges, self._edge_source)
+        return edge
+
+    def add_bridges(self, bridges: Iterable["LayerBridge"]) -> None:
+        for bridge in bridges:
+            self.add_bridge(bridge)
+
+    def bridge(self, edge: int) -> "LayerBridge":
+        return self._edge_bridges[edge]
+
+    def bridges_between(self, source: str, target: str) -> List["LayerBridge"]:
+        """Bridges that connect ``source`` directly to ``target``."""
+
+        key = (self.node_id(source), self.node_id(target))
+        return [self._edge_bridges[edge] for edge in self._edges_by_pair.get(key, ())]
+
+    def successors(self, layer: str) -> List[str]:
+        return list(dict.fromkeys(self._names[self._edge_target[edge]] for edge in self._out_edges[self.node_id(layer)]))
+
+    def predecessors(self, layer: str) -> List[str]:
+        return list(dict.fromkeys(self._names[self._edge_source[edge]] for edge in self._in_edges[self.node_id(layer)]))
+
+    # -- memoized queries ----------------------------------------------
+
+    def _bfs(self, root: int, adjacency: Sequence[List[int]], far_end: Sequence[int]) -> _DistanceTree:
+        tree = _DistanceTree()
+        tree.distance[root] = 0
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            step = tree.distance[node] + 1
+            for edge in adjacency[node]:
+                neighbour = far_end[edge]
+                if neighbour not in tree.distance:
+                    tree.distance[neighbour] = step
+                    tree.parent_edge[neighbour] = edge
+                    queue.append(neighbour)
+        return tree
+
+    @staticmethod
+    def _relax(
+        tree: _DistanceTree,
+        near: int,
+        far: int,
+        edge: int,
+        adjacency: Sequence[List[int]],
+        far_end: Sequence[int],
+    ) -> None:
+        """Propagate the distance decrease a newly added ``near -> far`` edge causes."""
+
+        base = tree.distance.get(near)
+        if base is None or tree.distance.get(far, base + 2) <= base + 1:
+            return
+        tree.distance[far] = base + 1
+        tree.parent_edge[far] = edge
+        queue = deque([far])
+        while queue:
+            node = queue.popleft()
+            step = tree.distance[node] + 1
+            for out in adjacency[node]:
+                neighbour = far_end[out]
+                if tree.distance.get(neighbour, step + 1) > step:
+                    tree.distance[neighbour] = step
+                    tree.parent_edge[neighbour] = out
+                    queue.append(neighbour)
+
+    def _forward_tree(self, source: int) -> _DistanceTree:
+        tree = self._forward.get(source)
+        if tree is None:
+            tree = self._forward[source] = self._bfs(source, self._out_edges, self._edge_target)
+        return tree
+
+    def _backward_tree(self, target: int) -> _DistanceTree:
+        tree = self._backward.get(target)
+        if tree is None:
+            tree = self._backward[target] = self._bfs(target, self._in_edges, self._edge_source)
+        return tree
+
+    def _reaches(self, source: int, node: int) -> bool:
+        return node in self._forward_tree(source).distance
+
+    def _reaches_back(self, target: int, node: int) -> bool:
+        return node in self._backward_tree(target).distance
+
+    def distance(self, source: str, target: str) -> Optional[int]:
+        """Number of bridges on the shortest path, or ``None`` if unreachable."""
+
+        return self._forward_tree(self.node_id(source)).distance.get(self.node_id(target))
+
+    def reachable(self, source: str) -> List[str]:
+        """Layers reachable from ``source`` (itself included), nearest first."""
+
+        tree = self._forward_tree(self.node_id(source))
+        return [self._names[node] for node in sorted(tree.distance, key=tree.distance.__getitem__)]
+
+    def path_edges(self, source: str, target: str) -> Optional[List[int]]:
+        """Edge ids along one shortest path, or ``None`` if unreachable."""
+
+        source_id, node = self.node_id(source), self.node_id(target)
+        tree = self._forward_tree(source_id)
+        if node not in tree.distance:
+            return None
+        edges: List[int] = []
+        while node != source_id:
+            edge = tree.parent_edge[node]
+            edges.append(edge)
+            node = self._edge_source[edge]
+        edges.reverse()
+        return edges
+
+    def path(self, source: str, target: str) -> Optional[List[str]]:
+        """Layer names along one shortest path, or ``None`` if unreachable."""
+
+        edges = self.path_edges(source, target)
+        if edges is None:
+            return None
+        return [source] + [self._names[self._edge_target[edge]] for edge in edges]
+
+    def path_bridges(self, source: str, target: str) -> Optional[List["LayerBridge"]]:
+        edges = self.path_edges(source, target)
+        return None if edges is None else [self._edge_bridges[edge] for edge in edges]
+
+    def all_pairs_distances(self) -> Iterator[Tuple[str, str, int]]:
+        """Yield ``(source, target, distance)`` for every connected pair."""
+
+        for source in range(len(self._names)):
+            for target, distance in self._forward_tree(source).distance.items():
+                if target != source:
+                    yield self._names[source], self._names[target], distance
+
+    def channels_between(self, source: str, target: str) -> Tuple[str, ...]:
+        """Channels of every bridge on any path from ``source`` to ``target``.
+
+        Channels are deduplicated in edge-insertion order. Bridges off every
+        ``source`` -> ``target`` path are excluded, even when they touch an
+        intermediate layer.
+        """
+
+        key = (self.node_id(source), self.node_id(target))
+        cached = self._channel_sets.get(key)
+        if cached is not None:
+            return cached
+
+        ahead = self._forward_tree(key[0]).distance
+        behind = self._backward_tree(key[1]).distance
+        edges = sorted(
+            edge
+            for node in ahead
+            for edge in self._out_edges[node]
+            if self._edge_target[edge] in behind
+        )
+        channels = tuple(dict.fromkeys(channel for edge in edges for channel in self._edge_bridges[edge].channels))
+        self._channel_sets[key] = channels
+        return channels
+
+    def clear_cache(self) -> None:
+        self._forward.clear()
+        self._backward.clear()
+        self._channel_sets.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        return {
+            "forward_trees": len(self._forward),
+            "backward_trees": len(self._backward),
+            "channel_sets": len(self._channel_sets),
+        }
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "layers": self.node_count,
+            "bridges": self.edge_count,
+            "layer_pairs": len(self._edges_by_pair),
+        }
+
+
+__all__ = ["LatticeGraph"]
@@ -0,0 +1,188 @@
+"""Structural hashing and incremental deltas for lattice manifests.
+
+``bootstrap_quill_core`` regenerates the same lattice on almost every run.
+The only differences are timestamps, timings and cache flags. This module
+separates those *volatile* fields from the manifest's structure:
+
+* :func:`structural_hash` fingerprints the structure only.
+* :func:`diff_manifests` produces a compact list of JSON-Patch style
+  operations (``add`` / ``remove`` / ``replace`` with ``/``-separated
+  paths). Lists are compared element by element, so appending one bridge
+  costs one ``add`` instead of a rewritten ``bridges`` array.
+* :func:`write_incremental` uses both to skip rewriting an unchanged
+  manifest. When the structure did change, it appends a delta record to a
+  ``.deltas.jsonl`` log beside the manifest.
+
+Consumers that hold the manifest for ``from_hash`` can bring it up to
+``to_hash`` with :func:`apply_manifest_delta` instead of reparsing the full
+file. Deltas describe structure only; the latest timestamps live in the
+full manifest.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+VOLATILE_KEYS = frozenset(
+    {
+        "installed_at",
+        "activated_at",
+        "timestamp",
+        "latency_seconds",
+        "latency_seconds_by_check",
+        "elapsed_seconds",
+        "cached",
+        "executed",
+        "incremental",
+    }
+)
+
+UNCHANGED = "unchanged"
+WRITTEN = "written"
+INITIAL = "initial"
+
+
+def structural_view(value: object) -> object:
+    """Return ``value`` with every volatile key removed, recursively."""
+
+    if isinstance(value, dict):
+        return {key: structural_view(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [structural_view(item) for item in value]
+    return value
+
+
+def structural_hash(manifest: Dict[str, object]) -> str:
+    canonical = json.dumps(structural_view(manifest), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _pointer(path: List[object]) -> str:
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+
+def _diff(old: object, new: object, path: List[object], ops: List[Dict[str, object]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path + [key])})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": _pointer(path + [key]), "value": value})
+            else:
+                _diff(old[key], value, path + [key], ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        shared = min(len(old), len(new))
+        for index in range(shared):
+            _diff(old[index], new[index], path + [index], ops)
+        for index in range(shared, len(new)):
+            ops.append({"op": "add", "path": _pointer(path + [index]), "value": new[index]})
+        # Remove from the end so earlier indexes stay valid while applying.
+        for index in range(len(old) - 1, shared - 1, -1):
+            ops.append({"op": "remove", "path": _pointer(path + [index])})
+    elif old != new or type(old) is not type(new):
+        ops.append({"op": "replace", "path": _pointer(path), "value": new})
+
+
+def diff_manifests(old: Dict[str, object], new: Dict[str, object]) -> List[Dict[str, object]]:
+    """Structural operations that turn ``old`` into ``new``."""
+
+    ops: List[Dict[str, object]] = []
+    _diff(structural_view(old), structural_view(new), [], ops)
+    return ops
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer.split("/")[1:]]
+
+
+def apply_manifest_delta(manifest: Dict[str, object], delta: Dict[str, object]) -> Dict[str, object]:
+    """Return a copy of ``manifest`` with the delta's operations applied."""
+
+    patched = copy.deepcopy(manifest)
+    for op in delta["ops"]:
+        parts = _parse_pointer(op["path"])
+        if not parts:
+            patched = copy.deepcopy(op["value"])
+            continue
+        parent: object = patched
+        for part in parts[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        last = parts[-1]
+        if isinstance(parent, list):
+            index = int(last)
+            if op["op"] == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op["value"])
+    return patched
+
+
+def delta_path_for(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}.deltas.jsonl")
+
+
+def _read_previous(output_path: Path) -> Optional[Dict[str, object]]:
+    try:
+        return json.loads(output_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_incremental(manifest: Dict[str, object], output_path: Path) -> Dict[str, object]:
+    """Persist ``manifest`` only if its structure changed, logging a delta when it did.
+
+    Returns the status record (``unchanged`` / ``written`` / ``initial``).
+    The record is also stored under the manifest's ``incremental`` key.
+    """
+
+    new_hash = structural_hash(manifest)
+    previous = _read_previous(output_path) if output_path.exists() else None
+    status: Dict[str, object] = {"structural_hash": new_hash, "delta_path": None}
+    if previous is None:
+        status.update(status=INITIAL, previous_hash=None, operations=0)
+    else:
+        previous_hash = structural_hash(previous)
+        status["previous_hash"] = previous_hash
+        if previous_hash == new_hash:
+            status.update(status=UNCHANGED, operations=0)
+            manifest["incremental"] = status
+            return status
+        ops = diff_manifests(previous, manifest)
+        delta_path = delta_path_for(output_path)
+        record = {
+            "from_hash": previous_hash,
+            "to_hash": new_hash,
+            "generated_at": datetime.now(UTC).isoformat(),
+            "ops": ops,
+        }
+        delta_path.parent.mkdir(parents=True, exist_ok=True)
+        with delta_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        status.update(status=WRITTEN, operations=len(ops), delta_path=str(delta_path))
+
+    manifest["incremental"] = status
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(manifest, indent=2))
+    return status
+
+
+__all__ = [
+    "VOLATILE_KEYS",
+    "apply_manifest_delta",
+    "delta_path_for",
+    "diff_manifests",
+    "structural_hash",
+    "structural_view",
+    "write_incremental",
+]
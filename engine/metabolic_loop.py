@@ -3,15 +3,69 @@
 The metabolic loop consumes normalized breath cycle runs and produces a
 pacing snapshot that downstream automation can reference. It is designed
 to operate on top of the TYME-PULSE-GENESIS.json payload produced by the
-Breath Cycle importer, but it can also accept in-memory data.
+Breath Cycle importer, but it can also accept in-memory data. Snapshots
+carry a bounded ``pacing_state`` (see :mod:`engine.pacing_stats`) so the
+pacing statistics only fold in runs they have not seen before, for example
+a cycle pushed by the webhook receiver. Runs are recognized by
+``(repo, run_id)``: a persisted watermark marks the time before which every
+run has been folded, and a bounded set of keys covers the runs after it, so
+a run is never folded twice however long it stays in genesis. Only runs
+whose ``status`` is ``completed`` are folded in. The partial duration
+of an in-progress run is never counted; the run is picked up once it
+completes.
+Rolling windows (last hour, day and week by default) are reported in
+``windowed_pacing`` so a recent slowdown is not hidden by a long history;
+windows only accept cycles in timestamp order and count late arrivals.
+The most recent folded cycles are kept in ``pacing_state`` as well, so
+anomaly detection, grouped pacing and the forecast score a history that
+outlives the genesis payload.
+With ``merge_sources`` the loop paces the k-way merge of several genesis
+payloads (see :mod:`engine.genesis_merge`) instead of a single one.
 """
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .cycle_anomalies import DEFAULT_THRESHOLD, AnomalyReport, detect_anomalies
+from .cycle_forecast import DEFAULT_HORIZON, DEFAULT_SEASON_LENGTH, CycleForecast, forecast_durations
+from .genesis_merge import UNKNOWN_REPO, merge_genesis_cycles, source_repo
+from .grouped_pacing import DEFAULT_DIMENSIONS, group_duration_stats
+from .pacing_stats import DEFAULT_WINDOW_CAPACITY, DEFAULT_WINDOWS, RollingWindow, StreamingPacingStats
+from .selective_json import iter_array
+
+# The only cycle fields pacing reads; everything else in the genesis payload
+# (log excerpts, timing breakdowns) is skipped without being decoded.
+CYCLE_FIELDS = (
+    "run_id",
+    "repo",
+    "status",
+    "duration_seconds",
+    "started_at",
+    "completed_at",
+    "name",
+    "head_branch",
+    "conclusion",
+)
+# Fields of a folded cycle kept in the persisted history.
+HISTORY_FIELDS = tuple(field for field in CYCLE_FIELDS if field != "status")
+# Snapshot sections scored from the persisted history rather than the
+# streaming state; only observe(history=True) recomputes them, and they are
+# carried forward otherwise.
+HISTORY_SECTIONS = ("anomalies", "grouped_pacing", "forecast", "history_cycles", "history_capacity")
+COMPLETED = "completed"
+# Folded (repo, run_id) keys at or after the watermark kept in the snapshot to
+# recognize redelivered or re-imported runs. Far more than one import window.
+DEFAULT_SEEN_CAPACITY = 4096
+# How far behind the newest folded run the watermark trails; runs that
+# complete more than this before the newest one are taken as already folded.
+DEFAULT_LATENESS_SECONDS = 7 * 24 * 3600.0
+# Most recent folded cycles persisted for anomaly detection, grouped pacing
+# and the forecast; far more than the detector's minimum of two segments.
+DEFAULT_HISTORY_CAPACITY = 512
 
 
 @dataclass
@@ -22,65 +76,380 @@ class BreathPacing:
     inhale_seconds: float
     exhale_seconds: float
     beats_per_minute: float
+    stddev_seconds: float | None = None
+    ewma_seconds: float | None = None
+    p50_seconds: float | None = None
+    p90_seconds: float | None = None
+    p99_seconds: float | None = None
 
 
 class MetabolicLoop:
-    """Compute and install breath pacing based on recent cycle durations."""
+    """Compute and install breath pacing from streaming cycle statistics."""
 
     def __init__(
         self,
         genesis_path: Path | str = Path("chronicle/TYME-PULSE-GENESIS.json"),
         output_path: Path | str = Path("heartbeat/logs/metabolic_loop.json"),
         baseline_seconds: float = 90.0,
+        windows: Optional[Dict[str, float]] = None,
+        window_capacity: int = DEFAULT_WINDOW_CAPACITY,
+        anomaly_threshold: float = DEFAULT_THRESHOLD,
+        exclude_anomalies: bool = False,
+        group_dimensions: Optional[Dict[str, str]] = None,
+        merge_sources: Sequence[Path | str] = (),
+        forecast_horizon: int = DEFAULT_HORIZON,
+        season_length: int = DEFAULT_SEASON_LENGTH,
+        seen_capacity: int = DEFAULT_SEEN_CAPACITY,
+        lateness_seconds: float = DEFAULT_LATENESS_SECONDS,
+        history_capacity: int = DEFAULT_HISTORY_CAPACITY,
     ) -> None:
         self.genesis_path = Path(genesis_path)
         self.output_path = Path(output_path)
         self.baseline_seconds = baseline_seconds
+        self.windows = dict(DEFAULT_WINDOWS if windows is None else windows)
+        self.window_capacity = window_capacity
+        self.anomaly_threshold = anomaly_threshold
+        self.exclude_anomalies = exclude_anomalies
+        self.forecast_horizon = forecast_horizon
+        self.season_length = season_length
+        self.seen_capacity = seen_capacity
+        self.lateness_seconds = lateness_seconds
+        self.history_capacity = history_capacity
+        self.merge_sources = [Path(path) for path in merge_sources]
+        if group_dimensions is None:
+            group_dimensions = {"repo": "repo", **DEFAULT_DIMENSIONS} if self.merge_sources else DEFAULT_DIMENSIONS
+        self.group_dimensions = dict(group_dimensions)
+
+    def _load_cycles(self, cycles: Iterable[dict] | None) -> Iterator[dict]:
+        """Yield the cycles to pace, streaming them from genesis unless ``cycles`` is given."""
 
-    def _load_cycles(self, cycles: Iterable[dict] | None) -> List[dict]:
         if cycles is not None:
-            return list(cycles)
+            yield from cycles
+        elif self.merge_sources:
+            yield from merge_genesis_cycles(self.source_paths, CYCLE_FIELDS)
+        else:
+            repo = source_repo(self.genesis_path) if self.genesis_path.exists() else UNKNOWN_REPO
+            for cycle in iter_array(self.genesis_path, "breath_cycles", CYCLE_FIELDS):
+                cycle.setdefault("repo", repo)
+                yield cycle
 
-        if not self.genesis_path.exists():
-            return []
+    @staticmethod
+    def _completed(cycle: dict) -> bool:
+        """Whether ``cycle`` finished; cycles without a ``status`` are taken as finished."""
 
-        raw = json.loads(self.genesis_path.read_text(encoding="utf-8"))
-        return raw.get("breath_cycles", [])
+        return (cycle.get("status") or COMPLETED) == COMPLETED
 
-    def _compute_pacing(self, cycles: List[dict]) -> BreathPacing:
-        durations = [cycle.get("duration_seconds") for cycle in cycles if isinstance(cycle.get("duration_seconds"), (int, float))]
-        if durations:
-            average = sum(durations) / len(durations)
-        else:
-            average = self.baseline_seconds
+    @staticmethod
+    def _run_key(cycle: dict) -> Optional[Tuple[str, int]]:
+        """Return the ``(repo, run_id)`` identity of ``cycle``, or ``None`` without a run id."""
+
+        if not cycle.get("run_id"):
+            return None
+        return str(cycle.get("repo") or UNKNOWN_REPO), int(cycle["run_id"])
+
+    @property
+    def source_paths(self) -> List[Path]:
+        """Genesis files this loop reads: the primary one plus any merge sources."""
+
+        return [self.genesis_path, *self.merge_sources]
+
+    @staticmethod
+    def _durations(cycles: Iterable[dict]) -> List[float]:
+        return [cycle.get("duration_seconds") for cycle in cycles if isinstance(cycle.get("duration_seconds"), (int, float))]
+
+    @staticmethod
+    def _cycle_timestamp(cycle: dict) -> Optional[float]:
+        value = cycle.get("completed_at") or cycle.get("started_at")
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+
+    def _restore_windows(self, state: dict) -> Dict[str, RollingWindow]:
+        """Rebuild every window from the shared ``window_entries`` of the snapshot.
+
+        All windows share one capacity, so the widest window's entries contain
+        every narrower window's and are persisted once; each window replays
+        them and evicts by its own span.
+        """
+
+        entries = state.get("window_entries", [])
+        persisted = state.get("windows", {})
+        restored: Dict[str, RollingWindow] = {}
+        for name, span in self.windows.items():
+            late = int(persisted.get(name, {}).get("late", 0))
+            restored[name] = RollingWindow(span, self.window_capacity, late)
+            restored[name].extend(entries)
+        return restored
 
-        inhale = round(average * 0.4, 2)
-        exhale = round(average * 0.6, 2)
-        bpm = round(60.0 / average, 2) if average else 0.0
-        return BreathPacing(cycle_seconds=round(average, 2), inhale_seconds=inhale, exhale_seconds=exhale, beats_per_minute=bpm)
+    def _persist_windows(self, windows: Dict[str, RollingWindow]) -> Dict[str, object]:
+        widest = max(windows.values(), key=lambda window: window.span_seconds, default=None)
+        return {
+            "windows": {
+                name: {"span_seconds": window.span_seconds, "capacity": window.capacity, "late": window.late}
+                for name, window in windows.items()
+            },
+            "window_entries": widest.entries() if widest is not None else [],
+        }
+
+    @staticmethod
+    def _phases(average: float) -> Dict[str, float]:
+        return {
+            "inhale_seconds": round(average * 0.4, 2),
+            "exhale_seconds": round(average * 0.6, 2),
+            "beats_per_minute": round(60.0 / average, 2) if average else 0.0,
+        }
 
-    def install(self, cycles: Iterable[dict] | None = None) -> dict:
-        """Compute pacing and write the metabolic loop snapshot to disk."""
+    def _windowed_pacing(self, windows: Dict[str, RollingWindow]) -> Dict[str, dict]:
+        now = datetime.now(UTC).timestamp()
+        report: Dict[str, dict] = {}
+        for name, window in windows.items():
+            window.evict(now)
+            average = window.mean()
+            entry: Dict[str, object] = {
+                "window_seconds": window.span_seconds,
+                "cycles": len(window),
+                "late_cycles": window.late,
+            }
+            if average is None:
+                entry.update({"cycle_seconds": None, "inhale_seconds": None, "exhale_seconds": None, "beats_per_minute": None})
+            else:
+                entry["cycle_seconds"] = round(average, 2)
+                entry.update(self._phases(average))
+            report[name] = entry
+        return report
 
-        observed_cycles = self._load_cycles(cycles)
-        pacing = self._compute_pacing(observed_cycles)
+    def _compute_pacing(self, stats: StreamingPacingStats) -> BreathPacing:
+        average = stats.mean if stats.count else self.baseline_seconds
+        phases = self._phases(average)
+        inhale = phases["inhale_seconds"]
+        exhale = phases["exhale_seconds"]
+        bpm = phases["beats_per_minute"]
 
+        def rounded(value: float | None) -> float | None:
+            return round(value, 2) if value is not None else None
+
+        return BreathPacing(
+            cycle_seconds=round(average, 2),
+            inhale_seconds=inhale,
+            exhale_seconds=exhale,
+            beats_per_minute=bpm,
+            stddev_seconds=round(stats.stddev, 2) if stats.count else None,
+            ewma_seconds=rounded(stats.ewma),
+            p50_seconds=rounded(stats.quantile(0.5)),
+            p90_seconds=rounded(stats.quantile(0.9)),
+            p99_seconds=rounded(stats.quantile(0.99)),
+        )
+
+    def _write_snapshot(
+        self,
+        cycles_observed: int,
+        cycles_total: int,
+        pacing: BreathPacing,
+        sections: Dict[str, object],
+        state: dict,
+    ) -> dict:
         snapshot = {
             "updated_at": datetime.now(UTC).isoformat(timespec="seconds"),
-            "source": str(self.genesis_path),
+            "source": str(self.genesis_path) if not self.merge_sources else [str(path) for path in self.source_paths],
             "baseline_seconds": self.baseline_seconds,
-            "cycles_observed": len(observed_cycles),
-            "breath_pacing": {
-                "cycle_seconds": pacing.cycle_seconds,
-                "inhale_seconds": pacing.inhale_seconds,
-                "exhale_seconds": pacing.exhale_seconds,
-                "beats_per_minute": pacing.beats_per_minute,
-            },
+            "cycles_observed": cycles_observed,
+            "cycles_total": cycles_total,
+            "breath_pacing": asdict(pacing),
+            **sections,
+            "pacing_state": state,
         }
 
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         self.output_path.write_text(json.dumps(snapshot, indent=2) + "\n", encoding="utf-8")
         return snapshot
 
+    def load_snapshot(self) -> dict:
+        """Return the last written snapshot, or an empty dict if none exists."""
+
+        if not self.output_path.exists():
+            return {}
+        return json.loads(self.output_path.read_text(encoding="utf-8"))
+
+    def install(self, cycles: Iterable[dict] | None = None, rebuild: bool = False, history: bool = False) -> dict:
+        """Compute pacing and write the metabolic loop snapshot to disk.
+
+        Only completed cycles are considered. Cycles already folded into the
+        persisted ``pacing_state`` (recognized by ``(repo, run_id)``) are
+        not folded into the pacing statistics again, and the loaded cycles
+        are streamed through :meth:`observe` without being held in memory.
+        ``cycles_observed`` counts the cycles loaded for this call and
+        ``cycles_total`` every cycle folded in so far. Pass ``rebuild=True``
+        to discard the persisted state and start over, and ``history=True``
+        to recompute the anomaly, grouped pacing and forecast sections (see
+        :meth:`observe`).
+        """
+
+        return self.observe(self._load_cycles(cycles), rebuild=rebuild, history=history)
+
+    def _timed_in_run_order(self, cycles: Iterable[dict]) -> List[dict]:
+        """Cycles with a duration, in the order they ran.
+
+        Run ids only order runs of one repository, so merged histories are
+        ordered by timestamp first and by run id among equal timestamps.
+        """
+
+        timed = [cycle for cycle in cycles if isinstance(cycle.get("duration_seconds"), (int, float))]
+        timed.sort(key=lambda cycle: (self._cycle_timestamp(cycle) or 0.0, int(cycle.get("run_id") or 0)))
+        return timed
+
+    def detect_anomalies(self, cycles: Iterable[dict]) -> AnomalyReport:
+        """Score the durations of ``cycles`` in run order for outliers and shifts.
+
+        Findings are labelled with the ``(repo, run_id)`` key of their run.
+        """
+
+        timed = self._timed_in_run_order(cycles)
+        return detect_anomalies(
+            [cycle["duration_seconds"] for cycle in timed],
+            run_ids=[self._run_key(cycle) for cycle in timed],
+            threshold=self.anomaly_threshold,
+        )
+
+    def forecast(self, cycles: Iterable[dict]) -> CycleForecast:
+        """Forecast the durations of the next ``forecast_horizon`` cycles."""
+
+        durations = [cycle["duration_seconds"] for cycle in self._timed_in_run_order(cycles)]
+        return forecast_durations(durations, horizon=self.forecast_horizon, season_length=self.season_length)
+
+    def grouped_pacing(self, cycles: Iterable[dict]) -> Dict[str, Dict[str, dict]]:
+        """Return pacing per workflow, branch and conclusion for ``cycles``."""
+
+        grouped: Dict[str, Dict[str, dict]] = {}
+        for dimension, groups in group_duration_stats(cycles, self.group_dimensions).items():
+            grouped[dimension] = {
+                label: {
+                    "cycles": figures["cycles"],
+                    "cycle_seconds": round(figures["mean"], 2),
+                    **self._phases(figures["mean"]),
+                    "stddev_seconds": round(figures["stddev"], 2),
+                }
+                for label, figures in groups.items()
+            }
+        return grouped
+
+    def _advance_watermark(self, seen: Dict[Tuple[str, int], float], watermark: Optional[float]) -> Optional[float]:
+        """Raise ``watermark`` and drop the ``seen`` keys that fall before it.
+
+        The watermark trails the newest folded run by ``lateness_seconds``
+        and is raised further whenever more than ``seen_capacity`` keys
+        remain, so the set stays bounded. It never moves backwards, and
+        every folded run at or after it keeps its key in ``seen``.
+        """
+
+        if not seen:
+            return watermark
+        timestamps = sorted(seen.values())
+        floor = timestamps[-1] - self.lateness_seconds
+        if len(timestamps) > self.seen_capacity:
+            floor = max(floor, timestamps[len(timestamps) - self.seen_capacity])
+        if watermark is None or floor > watermark:
+            watermark = floor
+        for key in [key for key, timestamp in seen.items() if timestamp < watermark]:
+            del seen[key]
+        return watermark
+
+    def _history_sections(self, scored: List[dict]) -> Tuple[Dict[str, object], Set[Tuple[str, int]]]:
+        """Score ``scored`` and return the history sections with the runs to exclude."""
+
+        anomalies = self.detect_anomalies(scored)
+        excluded = set(anomalies.flagged_run_ids) if self.exclude_anomalies else set()
+        retained = [cycle for cycle in scored if self._run_key(cycle) not in excluded]
+        sections = {
+            "anomalies": {**anomalies.to_dict(), "excluded_from_pacing": self.exclude_anomalies},
+            "grouped_pacing": self.grouped_pacing(retained),
+            "forecast": self.forecast(retained).to_dict(),
+            "history_cycles": len(scored),
+            "history_capacity": self.history_capacity,
+        }
+        return sections, excluded
+
+    def observe(self, cycles: Iterable[dict], rebuild: bool = False, history: bool = False) -> dict:
+        """Fold newly completed cycles into the existing snapshot.
+
+        A completed cycle is new unless its run finished before the
+        persisted watermark or its ``(repo, run_id)`` is among the keys seen
+        since. Runs with a ``run_id`` but no usable timestamp cannot be
+        placed against the watermark and are skipped; cycles without a
+        ``run_id`` cannot be recognized again and are always treated as new.
+        The streaming statistics persisted in the previous snapshot's
+        ``pacing_state`` stand in for the history, together with the last
+        ``history_capacity`` folded cycles.
+
+        With ``history=True`` those persisted cycles and the new ones are
+        screened for outliers and level shifts (see
+        :mod:`engine.cycle_anomalies`); findings land in ``anomalies`` and,
+        with ``exclude_anomalies``, flagged new runs are marked as seen but
+        not folded into the pacing statistics. Per-workflow, per-branch and
+        per-conclusion figures over the same cycles are written to
+        ``grouped_pacing``, and a Holt-Winters projection of the next cycles
+        (see :mod:`engine.cycle_forecast`) to ``forecast``. These sections
+        cover at most the last ``history_capacity`` cycles plus the new
+        ones; ``history_cycles`` records how many were scored. Without
+        ``history`` the previous snapshot's sections are carried forward.
+        """
+
+        previous = {} if rebuild else self.load_snapshot()
+        state = previous.get("pacing_state") or {}
+        stats = StreamingPacingStats.from_dict(state.get("stats"))
+        windows = self._restore_windows(state)
+        persisted = list(state.get("history", []))
+        watermark = state.get("watermark")
+        seen: Dict[Tuple[str, int], float] = {
+            (str(repo), int(run_id)): float(timestamp) for repo, run_id, timestamp in state.get("seen_runs", [])
+        }
+
+        loaded = 0
+        fresh = []
+        for cycle in cycles:
+            loaded += 1
+            if not self._completed(cycle):
+                continue
+            key = self._run_key(cycle)
+            if key is not None:
+                timestamp = self._cycle_timestamp(cycle)
+                if timestamp is None or (watermark is not None and timestamp < watermark) or key in seen:
+                    continue
+                seen[key] = timestamp
+            fresh.append(cycle)
+        # Windows evict by timestamp, so fold cycles in the order they ran.
+        fresh.sort(key=lambda cycle: (self._cycle_timestamp(cycle) or 0.0, int(cycle.get("run_id") or 0)))
+        watermark = self._advance_watermark(seen, watermark)
+        scored = self._timed_in_run_order([*persisted, *fresh])
+        if history:
+            sections, excluded = self._history_sections(scored)
+        else:
+            sections, excluded = {key: previous[key] for key in HISTORY_SECTIONS if key in previous}, set()
+        for cycle in fresh:
+            duration = cycle.get("duration_seconds")
+            if not isinstance(duration, (int, float)) or self._run_key(cycle) in excluded:
+                continue
+            stats.update(duration)
+            timestamp = self._cycle_timestamp(cycle)
+            if timestamp is not None:
+                for window in windows.values():
+                    window.push(timestamp, duration)
+
+        sections = {"windowed_pacing": self._windowed_pacing(windows), **sections}
+        state = {
+            "watermark": watermark,
+            "seen_runs": [[repo, run_id, timestamp] for (repo, run_id), timestamp in seen.items()],
+            "stats": stats.to_dict(),
+            "history": [
+                {field: cycle[field] for field in HISTORY_FIELDS if cycle.get(field) is not None}
+                for cycle in scored[max(len(scored) - self.history_capacity, 0) :]
+            ],
+            **self._persist_windows(windows),
+        }
+        cycles_total = int(previous.get("cycles_total", 0)) + len(fresh)
+        return self._write_snapshot(loaded, cycles_total, self._compute_pacing(stats), sections, state)
+
 
 __all__ = ["MetabolicLoop", "BreathPacing"]
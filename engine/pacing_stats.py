@@ -0,0 +1,290 @@
+"""Online pacing statistics for the metabolic loop.
+
+Each breath cycle duration is folded into a small, JSON-serializable state
+in constant time: a Welford running mean and variance, an exponentially
+weighted moving average of cycle time, and P² quantile markers (Jain &
+Chlamtac) for p50, p90 and p99. Array-backed ring buffers keep time-bounded
+windows (for example the last hour, day and week) with O(1) amortized
+insertion and eviction; late cycles are counted rather than inserted. The
+state is persisted inside the metabolic loop snapshot, so pacing never needs
+the full duration history again.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+DEFAULT_WINDOWS = {"1h": 3600.0, "24h": 86400.0, "7d": 604800.0}
+DEFAULT_WINDOW_CAPACITY = 4096
+
+
+@dataclass
+class P2Quantile:
+    """Streaming estimate of a single quantile using five P² markers."""
+
+    probability: float
+    heights: List[float] = field(default_factory=list)
+    positions: List[int] = field(default_factory=list)
+    desired: List[float] = field(default_factory=list)
+
+    def _increments(self) -> List[float]:
+        p = self.probability
+        return [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def update(self, value: float) -> None:
+        """Fold one observation into the marker set."""
+
+        if len(self.heights) < 5:
+            self.heights.append(value)
+            self.heights.sort()
+            if len(self.heights) == 5:
+                p = self.probability
+                self.positions = [1, 2, 3, 4, 5]
+                self.desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+            return
+
+        q, n = self.heights, self.positions
+        if value < q[0]:
+            q[0] = value
+            cell = 0
+        elif value >= q[4]:
+            q[4] = value
+            cell = 3
+        else:
+            cell = next(index for index in range(4) if q[index] <= value < q[index + 1])
+
+        for index in range(cell + 1, 5):
+            n[index] += 1
+        for index, increment in enumerate(self._increments()):
+            self.desired[index] += increment
+
+        for index in range(1, 4):
+            drift = self.desired[index] - n[index]
+            if (drift >= 1 and n[index + 1] - n[index] > 1) or (drift <= -1 and n[index - 1] - n[index] < -1):
+                step = 1 if drift > 0 else -1
+                candidate = self._parabolic(index, step)
+                if not q[index - 1] < candidate < q[index + 1]:
+                    candidate = q[index] + step * (q[index + step] - q[index]) / (n[index + step] - n[index])
+                q[index] = candidate
+                n[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[index] + step / (n[index + 1] - n[index - 1]) * (
+            (n[index] - n[index - 1] + step) * (q[index + 1] - q[index]) / (n[index + 1] - n[index])
+            + (n[index + 1] - n[index] - step) * (q[index] - q[index - 1]) / (n[index] - n[index - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        """Return the current quantile estimate, or ``None`` before any data."""
+
+        if not self.heights:
+            return None
+        if len(self.heights) < 5:
+            rank = max(math.ceil(self.probability * len(self.heights)) - 1, 0)
+            return self.heights[rank]
+        return self.heights[2]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "probability": self.probability,
+            "heights": self.heights,
+            "positions": self.positions,
+            "desired": self.desired,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "P2Quantile":
+        return cls(
+            probability=float(data["probability"]),
+            heights=[float(value) for value in data.get("heights", [])],
+            positions=[int(value) for value in data.get("positions", [])],
+            desired=[float(value) for value in data.get("desired", [])],
+        )
+
+
+@dataclass
+class StreamingPacingStats:
+    """Constant-time running statistics over breath cycle durations."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    ewma: Optional[float] = None
+    ewma_alpha: float = 0.2
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    quantiles: List[P2Quantile] = field(default_factory=lambda: [P2Quantile(p) for p in DEFAULT_QUANTILES])
+
+    def update(self, duration: float) -> None:
+        """Fold a single cycle duration into every statistic."""
+
+        self.count += 1
+        delta = duration - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (duration - self.mean)
+        self.ewma = duration if self.ewma is None else self.ewma + self.ewma_alpha * (duration - self.ewma)
+        self.minimum = duration if self.minimum is None else min(self.minimum, duration)
+        self.maximum = duration if self.maximum is None else max(self.maximum, duration)
+        for estimator in self.quantiles:
+            estimator.update(duration)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, probability: float) -> Optional[float]:
+        for estimator in self.quantiles:
+            if estimator.probability == probability:
+                return estimator.value()
+        return None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "ewma": self.ewma,
+            "ewma_alpha": self.ewma_alpha,
+            "min": self.minimum,
+            "max": self.maximum,
+            "quantiles": [estimator.to_dict() for estimator in self.quantiles],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, object]]) -> "StreamingPacingStats":
+        """Restore state written by :meth:`to_dict`; empty state starts over."""
+
+        if not data:
+            return cls()
+        stats = cls(
+            count=int(data["count"]),
+            mean=float(data["mean"]),
+            m2=float(data.get("m2", 0.0)),
+            ewma=data.get("ewma"),
+            ewma_alpha=float(data.get("ewma_alpha", 0.2)),
+            minimum=data.get("min"),
+            maximum=data.get("max"),
+        )
+        if data.get("quantiles"):
+            stats.quantiles = [P2Quantile.from_dict(entry) for entry in data["quantiles"]]
+        return stats
+
+
+class RollingWindow:
+    """Fixed-capacity ring buffer of ``(timestamp, duration)`` pairs.
+
+    Entries older than ``span_seconds`` are evicted from the head as newer
+    ones arrive, and a running total keeps the mean available in O(1). When
+    the buffer is full the oldest entry is dropped even if it is still in
+    the window, so capacity bounds memory regardless of cycle frequency.
+
+    Insertion and eviction are O(1) amortized because entries only ever
+    arrive at the tail: a cycle older than the newest entry (a late
+    delivery) is not inserted but counted in :attr:`late`. The arrays start
+    empty and double up to ``capacity`` as entries arrive, so a restored
+    window costs time and memory proportional to its live entries.
+    """
+
+    def __init__(self, span_seconds: float, capacity: int = DEFAULT_WINDOW_CAPACITY, late: int = 0) -> None:
+        self.span_seconds = span_seconds
+        self.capacity = capacity
+        self.late = late
+        self._times = array("d")
+        self._values = array("d")
+        self._head = 0
+        self._size = 0
+        self._total = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slot(self, offset: int) -> int:
+        return (self._head + offset) % len(self._times)
+
+    def _grow(self) -> None:
+        """Re-lay the full ring from slot 0 into arrays twice as long (at most ``capacity``)."""
+
+        length = min(max(2 * len(self._times), 16), self.capacity)
+        slots = [self._slot(offset) for offset in range(self._size)]
+        padding = [0.0] * (length - self._size)
+        self._times = array("d", [self._times[slot] for slot in slots] + padding)
+        self._values = array("d", [self._values[slot] for slot in slots] + padding)
+        self._head = 0
+
+    def _pop_oldest(self) -> None:
+        self._total -= self._values[self._head]
+        self._head = (self._head + 1) % len(self._times)
+        self._size -= 1
+        if not self._size:
+            self._total = 0.0
+
+    def evict(self, now: float) -> None:
+        """Drop entries that fell out of the window ending at ``now``."""
+
+        cutoff = now - self.span_seconds
+        while self._size and self._times[self._head] < cutoff:
+            self._pop_oldest()
+
+    def push(self, timestamp: float, duration: float) -> bool:
+        """Append a cycle, evicting expired or overflowing entries first.
+
+        Returns ``False`` (and counts the cycle in :attr:`late`) when
+        ``timestamp`` is older than the newest entry.
+        """
+
+        if self._size and timestamp < self._times[self._slot(self._size - 1)]:
+            self.late += 1
+            return False
+        self.evict(timestamp)
+        if self._size == self.capacity:
+            self._pop_oldest()
+        elif self._size == len(self._times):
+            self._grow()
+        slot = self._slot(self._size)
+        self._times[slot] = timestamp
+        self._values[slot] = duration
+        self._size += 1
+        self._total += duration
+        return True
+
+    def mean(self) -> Optional[float]:
+        return self._total / self._size if self._size else None
+
+    def entries(self) -> List[List[float]]:
+        slots = (self._slot(offset) for offset in range(self._size))
+        return [[self._times[slot], self._values[slot]] for slot in slots]
+
+    def extend(self, entries: Iterable[Sequence[float]]) -> None:
+        """Push persisted ``[timestamp, duration]`` pairs, oldest first."""
+
+        for timestamp, duration in entries:
+            self.push(float(timestamp), float(duration))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "span_seconds": self.span_seconds,
+            "capacity": self.capacity,
+            "late": self.late,
+            "entries": self.entries(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "RollingWindow":
+        window = cls(
+            float(data["span_seconds"]),
+            int(data.get("capacity", DEFAULT_WINDOW_CAPACITY)),
+            int(data.get("late", 0)),
+        )
+        window.extend(data.get("entries", []))
+        return window
+
+
+__all__ = ["P2Quantile", "RollingWindow", "StreamingPacingStats"]
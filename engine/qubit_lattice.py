@@ -0,0 +1,406 @@
+"""CPU state-vector simulator behind the lattice's ``qubit-lattice`` primitive.
+
+:class:`StateVectorSimulator` keeps a batch of ``n``-qubit state vectors as
+one ``(batch, 2**n)`` complex array. Qubit ``q`` is bit ``q`` of the basis
+index. A gate reshapes the array into a view whose middle axis is the
+target qubit and updates the two halves in place. Diagonal gates (Z, S, T,
+RZ, phase) scale one or both halves directly. Other gates use two
+preallocated half-size scratch buffers, so no per-gate allocation scales
+with the state.
+
+Controlled gates apply the same update on the control-is-one slice only.
+Parametric gates accept one angle or one angle per batch member, so a batch
+can run a family of circuits in a single sweep.
+
+Memory is bounded up front: the state plus scratch take
+``2 * batch * 2**n * itemsize`` bytes, and :func:`max_qubits` turns the
+available memory into the largest ``n`` that fits. Asking for more raises
+``MemoryError`` before anything is allocated.
+
+Two lattice channels are mapped onto the simulator:
+
+* ``phase-lock`` puts every qubit into superposition and locks its phase to
+  an input signal (a ``(batch, qubits)`` array of turns).
+* ``state-sampling`` measures the register and returns sampled basis states.
+
+:func:`run_qubit_channels` walks a lattice's bridges and applies whichever
+of these channels each bridge carries.
+"""
+from __future__ import annotations
+
+import math
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - exercised implicitly by the import environment
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .quill_lattice import QuillLatticePrototype
+
+DEFAULT_MEMORY_FRACTION = 0.5
+DEFAULT_SHOTS = 1024
+# State vector plus two half-size scratch buffers.
+_BUFFER_FACTOR = 2
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for the state-vector simulator")
+
+
+def available_memory_bytes() -> Optional[int]:
+    """Physical memory currently available, or ``None`` where it cannot be read."""
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def max_qubits(
+    batch: int = 1,
+    dtype: object = None,
+    memory_bytes: Optional[int] = None,
+    fraction: float = DEFAULT_MEMORY_FRACTION,
+) -> int:
+    """Largest qubit count whose batch fits in ``fraction`` of ``memory_bytes``."""
+
+    _require_numpy()
+    itemsize = np.dtype(dtype or np.complex128).itemsize
+    memory_bytes = memory_bytes if memory_bytes is not None else available_memory_bytes()
+    if memory_bytes is None:
+        memory_bytes = 1 << 30
+    budget = memory_bytes * fraction / (_BUFFER_FACTOR * itemsize * max(batch, 1))
+    return max(int(math.floor(math.log2(budget))), 0) if budget >= 1 else 0
+
+
+# -- gates ---------------------------------------------------------------
+
+_SQRT_HALF = math.sqrt(0.5)
+
+
+def _fixed_gates() -> Dict[str, "np.ndarray"]:
+    return {
+        "i": np.eye(2, dtype=np.complex128),
+        "h": np.array([[_SQRT_HALF, _SQRT_HALF], [_SQRT_HALF, -_SQRT_HALF]], dtype=np.complex128),
+        "x": np.array([[0, 1], [1, 0]], dtype=np.complex128),
+        "y": np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+        "z": np.diag([1, -1]).astype(np.complex128),
+        "s": np.diag([1, 1j]).astype(np.complex128),
+        "t": np.diag([1, np.exp(1j * math.pi / 4)]).astype(np.complex128),
+    }
+
+
+def _angles(theta: object) -> "np.ndarray":
+    return np.asarray(theta, dtype=np.float64)
+
+
+def _stack(a: object, b: object, c: object, d: object) -> "np.ndarray":
+    """Build a ``(2, 2)`` or ``(batch, 2, 2)`` matrix from broadcast entries."""
+
+    a, b, c, d = np.broadcast_arrays(a, b, c, d)
+    return np.stack([np.stack([a, b], axis=-1), np.stack([c, d], axis=-1)], axis=-2).astype(np.complex128)
+
+
+def rx(theta: object) -> "np.ndarray":
+    half = _angles(theta) / 2
+    return _stack(np.cos(half), -1j * np.sin(half), -1j * np.sin(half), np.cos(half))
+
+
+def ry(theta: object) -> "np.ndarray":
+    half = _angles(theta) / 2
+    return _stack(np.cos(half), -np.sin(half), np.sin(half), np.cos(half))
+
+
+def rz(theta: object) -> "np.ndarray":
+    half = _angles(theta) / 2
+    return _stack(np.exp(-1j * half), 0, 0, np.exp(1j * half))
+
+
+def phase(theta: object) -> "np.ndarray":
+    return _stack(1, 0, 0, np.exp(1j * _angles(theta)))
+
+
+PARAMETRIC_GATES: Dict[str, Callable[[object], "np.ndarray"]] = {"rx": rx, "ry": ry, "rz": rz, "p": phase}
+# Controlled gates and the single-qubit gate applied to their target.
+CONTROLLED_GATES = {"cx": "x", "cy": "y", "cz": "z", "cp": "p", "crz": "rz"}
+_DIAGONAL = {"i", "z", "s", "t", "rz", "p"}
+
+
+class StateVectorSimulator:
+    """A batch of ``num_qubits``-qubit state vectors with in-place gate updates."""
+
+    def __init__(
+        self,
+        num_qubits: int,
+        batch: int = 1,
+        dtype: object = None,
+        memory_bytes: Optional[int] = None,
+        memory_fraction: float = DEFAULT_MEMORY_FRACTION,
+    ) -> None:
+        _require_numpy()
+        if num_qubits < 1 or batch < 1:
+            raise ValueError("num_qubits and batch must be positive")
+        self.dtype = np.dtype(dtype or np.complex128)
+        limit = max_qubits(batch, self.dtype, memory_bytes, memory_fraction)
+        if num_qubits > limit:
+            raise MemoryError(f"{num_qubits} qubits x batch {batch} exceed the memory budget ({limit} qubits fit)")
+        self.num_qubits = num_qubits
+        self.batch = batch
+        self.gates_applied = 0
+        self._fixed = _fixed_gates()
+        self.state = np.zeros((batch, 1 << num_qubits), dtype=self.dtype)
+        half = (batch << num_qubits) >> 1
+        self._scratch = (np.empty(half, dtype=self.dtype), np.empty(half, dtype=self.dtype))
+        self.reset()
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.state.nbytes + sum(buffer.nbytes for buffer in self._scratch)
+
+    def reset(self) -> "StateVectorSimulator":
+        """Return every batch member to ``|0...0>``."""
+
+        self.state[...] = 0
+        self.state[:, 0] = 1
+        self.gates_applied = 0
+        return self
+
+    def _check_qubit(self, qubit: int) -> None:
+        if not 0 <= qubit < self.num_qubits:
+            raise ValueError(f"Qubit {qubit} outside a {self.num_qubits}-qubit register")
+
+    def _matrix(self, gate: object, theta: object = None) -> Tuple["np.ndarray", bool]:
+        if isinstance(gate, str):
+            name = gate.lower()
+            if name in PARAMETRIC_GATES:
+                if theta is None:
+                    raise ValueError(f"Gate {gate} needs an angle")
+                return PARAMETRIC_GATES[name](theta), name in _DIAGONAL
+            if name in self._fixed:
+                return self._fixed[name], name in _DIAGONAL
+            raise ValueError(f"Unknown gate: {gate}")
+        matrix = np.asarray(gate, dtype=np.complex128)
+        return matrix, bool(np.all(matrix[..., 0, 1] == 0) and np.all(matrix[..., 1, 0] == 0))
+
+    def _entries(self, matrix: "np.ndarray", ndim: int) -> List[object]:
+        if matrix.ndim == 2:
+            return [matrix[0, 0], matrix[0, 1], matrix[1, 0], matrix[1, 1]]
+        if matrix.shape[0] != self.batch:
+            raise ValueError(f"Batched gate has {matrix.shape[0]} entries for a batch of {self.batch}")
+        # One entry per batch member, broadcast over the remaining axes.
+        extra = (1,) * (ndim - 1)
+        return [matrix[:, i, j].reshape((self.batch,) + extra) for i, j in ((0, 0), (0, 1), (1, 0), (1, 1))]
+
+    def _update(self, zero: "np.ndarray", one: "np.ndarray", matrix: "np.ndarray", diagonal: bool) -> None:
+        a, b, c, d = self._entries(matrix, zero.ndim)
+        if diagonal:
+            zero *= a
+            one *= d
+            return
+        size = zero.size
+        first = self._scratch[0][:size].reshape(zero.shape)
+        second = self._scratch[1][:size].reshape(zero.shape)
+        np.multiply(zero, a, out=first)
+        np.multiply(one, b, out=second)
+        first += second
+        np.multiply(zero, c, out=second)
+        one *= d
+        one += second
+        zero[...] = first
+
+    def apply(self, gate: object, qubit: int, theta: object = None, control: Optional[int] = None) -> "StateVectorSimulator":
+        """Apply ``gate`` (a name or a 2x2 / batch x 2x2 matrix) to ``qubit``.
+
+        With ``control`` the gate only acts where the control qubit is one.
+        """
+
+        self._check_qubit(qubit)
+        matrix, diagonal = self._matrix(gate, theta)
+        n = self.num_qubits
+        if control is None:
+            view = self.state.reshape(self.batch, 1 << (n - qubit - 1), 2, 1 << qubit)
+            self._update(view[:, :, 0, :], view[:, :, 1, :], matrix, diagonal)
+        else:
+            self._check_qubit(control)
+            if control == qubit:
+                raise ValueError("Control and target must differ")
+            high, low = max(control, qubit), min(control, qubit)
+            view = self.state.reshape(self.batch, 1 << (n - high - 1), 2, 1 << (high - low - 1), 2, 1 << low)
+            if control == high:
+                active = view[:, :, 1]
+                self._update(active[:, :, :, 0], active[:, :, :, 1], matrix, diagonal)
+            else:
+                active = view[:, :, :, :, 1]
+                self._update(active[:, :, 0], active[:, :, 1], matrix, diagonal)
+        self.gates_applied += 1
+        return self
+
+    def run(self, circuit: Iterable[Sequence[object]]) -> "StateVectorSimulator":
+        """Apply a circuit given as ``(gate, qubit[, angle])`` / ``(cgate, control, target[, angle])`` ops."""
+
+        for op in circuit:
+            name = str(op[0]).lower()
+            if name in CONTROLLED_GATES:
+                theta = op[3] if len(op) > 3 else None
+                self.apply(CONTROLLED_GATES[name], int(op[2]), theta, control=int(op[1]))
+            else:
+                theta = op[2] if len(op) > 2 else None
+                self.apply(name, int(op[1]), theta)
+        return self
+
+    def probabilities(self) -> "np.ndarray":
+        return np.abs(self.state) ** 2
+
+    def sample(self, shots: int = DEFAULT_SHOTS, seed: Optional[int] = None) -> "np.ndarray":
+        """Draw ``shots`` basis-state outcomes per batch member, shaped ``(batch, shots)``."""
+
+        rng = np.random.default_rng(seed)
+        cumulative = np.cumsum(self.probabilities(), axis=1)
+        cumulative /= cumulative[:, -1:]
+        draws = rng.random((self.batch, shots))
+        outcomes = np.empty((self.batch, shots), dtype=np.int64)
+        for member in range(self.batch):
+            outcomes[member] = np.searchsorted(cumulative[member], draws[member], side="right")
+        return np.minimum(outcomes, (1 << self.num_qubits) - 1)
+
+
+# -- lattice channels ----------------------------------------------------
+
+
+def phase_lock(simulator: StateVectorSimulator, phases: "np.ndarray") -> Dict[str, object]:
+    """Superpose every qubit and lock its phase to ``phases`` (turns, ``(batch, qubits)``)."""
+
+    phases = np.asarray(phases, dtype=np.float64)
+    if phases.shape != (simulator.batch, simulator.num_qubits):
+        raise ValueError(f"Expected phases shaped {(simulator.batch, simulator.num_qubits)}, got {phases.shape}")
+    for qubit in range(simulator.num_qubits):
+        simulator.apply("h", qubit)
+        simulator.apply("p", qubit, 2 * math.pi * phases[:, qubit])
+    return {"locked_qubits": simulator.num_qubits, "mean_phase": float(phases.mean()) if phases.size else 0.0}
+
+
+def state_sampling(simulator: StateVectorSimulator, shots: int = DEFAULT_SHOTS, seed: Optional[int] = None) -> Dict[str, object]:
+    """Measure the register ``shots`` times per batch member and summarize the outcomes."""
+
+    outcomes = simulator.sample(shots, seed)
+    counts = np.bincount(outcomes.ravel(), minlength=1 << simulator.num_qubits)
+    distribution = counts / counts.sum()
+    entropy = -float(np.sum(distribution[distribution > 0] * np.log2(distribution[distribution > 0])))
+    top = np.argsort(counts)[::-1][:8]
+    return {
+        "shots": shots,
+        "outcomes": outcomes,
+        "entropy_bits": entropy,
+        "top_states": [{"state": format(int(state), f"0{simulator.num_qubits}b"), "share": float(distribution[state])} for state in top if counts[state]],
+    }
+
+
+QUBIT_CHANNELS = ("phase-lock", "state-sampling")
+
+
+def run_qubit_channels(
+    lattice: QuillLatticePrototype,
+    phases: "np.ndarray",
+    shots: int = DEFAULT_SHOTS,
+    seed: Optional[int] = None,
+    num_qubits: Optional[int] = None,
+) -> Dict[str, object]:
+    """Drive the simulator through the lattice's ``phase-lock`` and ``state-sampling`` channels.
+
+    The register has one qubit per quantum primitive unless ``num_qubits``
+    is given. ``phases`` is a ``(batch, qubits)`` array, for instance the
+    quantum-layer state from :mod:`engine.lattice_simulation`. Bridges are
+    visited in lattice order, and each mapped channel acts on the shared
+    register. Sampled outcomes are returned once, under ``outcomes``.
+    """
+
+    _require_numpy()
+    phases = np.atleast_2d(np.asarray(phases, dtype=np.float64))
+    qubits = num_qubits or max(len(lattice.quantum_primitives), 1)
+    simulator = StateVectorSimulator(qubits, batch=phases.shape[0])
+    reports: List[Dict[str, object]] = []
+    outcomes = None
+    for bridge in lattice.bridges:
+        applied: Dict[str, object] = {}
+        for channel in bridge.channels:
+            if channel == "phase-lock":
+                applied[channel] = phase_lock(simulator, phases)
+            elif channel == "state-sampling":
+                sampled = state_sampling(simulator, shots, seed)
+                outcomes = sampled.pop("outcomes")
+                applied[channel] = sampled
+        if applied:
+            reports.append({"source": bridge.source_layer, "target": bridge.target_layer, "channels": applied})
+    return {
+        "qubits": qubits,
+        "batch": simulator.batch,
+        "gates_applied": simulator.gates_applied,
+        "bridges": reports,
+        "outcomes": outcomes,
+    }
+
+
+def benchmark_gates(
+    qubit_counts: Sequence[int] = (4, 8, 12, 16, 20),
+    gates: int = 200,
+    batch: int = 1,
+    seed: int = 0,
+) -> List[Dict[str, object]]:
+    """Time a random H/RZ/CX mix at each qubit count and report gates per second."""
+
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    results = []
+    for qubits in qubit_counts:
+        try:
+            simulator = StateVectorSimulator(qubits, batch=batch)
+        except MemoryError as exc:
+            results.append({"qubits": qubits, "batch": batch, "skipped": str(exc)})
+            continue
+        circuit: List[Tuple[object, ...]] = []
+        for _ in range(gates):
+            kind = rng.integers(3) if qubits > 1 else rng.integers(2)
+            target = int(rng.integers(qubits))
+            if kind == 0:
+                circuit.append(("h", target))
+            elif kind == 1:
+                circuit.append(("rz", target, float(rng.random() * 2 * math.pi)))
+            else:
+                control = int((target + 1 + rng.integers(qubits - 1)) % qubits)
+                circuit.append(("cx", control, target))
+        started = time.perf_counter()
+        simulator.run(circuit)
+        elapsed = time.perf_counter() - started
+        results.append(
+            {
+                "qubits": qubits,
+                "batch": batch,
+                "gates": gates,
+                "seconds": elapsed,
+                "gates_per_second": gates / elapsed if elapsed else math.inf,
+                "state_bytes": simulator.memory_bytes,
+            }
+        )
+    return results
+
+
+__all__ = [
+    "CONTROLLED_GATES",
+    "PARAMETRIC_GATES",
+    "QUBIT_CHANNELS",
+    "StateVectorSimulator",
+    "available_memory_bytes",
+    "benchmark_gates",
+    "max_qubits",
+    "phase",
+    "phase_lock",
+    "run_qubit_channels",
+    "rx",
+    "ry",
+    "rz",
+    "state_sampling",
+]
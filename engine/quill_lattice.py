@@ -5,9 +5,12 @@ import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from .avot_engine import AvotAgent, HiveCoreProtocol, load_registry
+from .avot_engine import AvotAgent, HiveCoreProtocol, load_avot_registry
+from .integrity_checks import IntegrityExecutor
+from .manifest_delta import write_incremental
+from .lattice_graph import LatticeGraph
 
 
 @dataclass
@@ -37,6 +40,47 @@ class QuillLatticePrototype:
     conceptual_frames: List[str]
     computational_forms: List[str]
     bridges: List[LayerBridge]
+    _graph: Optional[LatticeGraph] = field(default=None, init=False, repr=False, compare=False)
+
+    def layers(self) -> Dict[str, List[str]]:
+        return {
+            "harmonic": self.harmonic_signals,
+            "quantum": self.quantum_primitives,
+            "conceptual": self.conceptual_frames,
+            "computational": self.computational_forms,
+        }
+
+    @property
+    def graph(self) -> LatticeGraph:
+        """Indexed graph of the lattice, kept in step with ``bridges``.
+
+        Bridges appended to ``bridges`` since the last access are indexed
+        incrementally. The graph is rebuilt if the list shrank or its last
+        indexed bridge was replaced.
+        """
+
+        graph = self._graph
+        indexed = graph.edge_count if graph is not None else 0
+        if graph is None or indexed > len(self.bridges) or (
+            indexed and graph.bridge(indexed - 1) is not self.bridges[indexed - 1]
+        ):
+            graph = self._graph = LatticeGraph.from_prototype(self)
+        else:
+            graph.add_bridges(self.bridges[indexed:])
+        return graph
+
+    def add_bridge(self, bridge: LayerBridge) -> LayerBridge:
+        """Append ``bridge`` and index it without rebuilding the graph."""
+
+        self.bridges.append(bridge)
+        if self._graph is not None:
+            self._graph.add_bridge(bridge)
+        return bridge
+
+    def channels_between(self, source: str, target: str) -> List[str]:
+        """Channels on the bridges that connect ``source`` to ``target``."""
+
+        return list(self.graph.channels_between(source, target))
 
     def to_dict(self) -> Dict[str, object]:
         return {
@@ -84,19 +128,34 @@ def build_quill_lattice_prototype() -> QuillLatticePrototype:
 def load_avot_quill(registry_path: Path) -> Dict[str, object]:
     """Load the AVOT registry and return the Quill agent plus protocol."""
 
-    registry = load_registry(registry_path)
-    protocol: HiveCoreProtocol = registry["protocol"]
-    agents: List[AvotAgent] = registry["agents"]
-
-    quill_agent = next((agent for agent in agents if agent.codename == "AVOT-Quill"), None)
+    registry = load_avot_registry(registry_path)
+    quill_agent = registry.get("AVOT-Quill")
     if quill_agent is None:
         raise ValueError("AVOT-Quill not found in registry")
 
-    return {"agent": quill_agent, "protocol": protocol}
+    return {"agent": quill_agent, "protocol": registry.protocol}
+
 
+def bootstrap_quill_core(
+    registry_path: Path,
+    output_path: Path,
+    executor: Optional[IntegrityExecutor] = None,
+    incremental: bool = False,
+    integrity_cache: Optional[Path] = None,
+) -> Dict[str, object]:
+    """Bootstrap the Quill-core lattice engine and persist the manifest.
 
-def bootstrap_quill_core(registry_path: Path, output_path: Path) -> Dict[str, object]:
-    """Bootstrap the Quill-core lattice engine and persist the manifest."""
+    Every bridge's integrity checks run through ``executor``. By default a
+    fresh :class:`IntegrityExecutor` is built, memoizing its results in
+    ``integrity_cache`` when given so unchanged bridges are not re-checked
+    on the next run. The manifest's ``integrity`` block records each
+    result and its latency.
+
+    With ``incremental`` an existing manifest is left untouched when only
+    timestamps and timings changed. Otherwise a structural delta is appended
+    beside it (see :mod:`engine.manifest_delta`). The outcome is recorded
+    under the returned manifest's ``incremental`` key.
+    """
 
     quill_bundle = load_avot_quill(registry_path)
     quill_agent: AvotAgent = quill_bundle["agent"]
@@ -104,16 +163,22 @@ def bootstrap_quill_core(registry_path: Path, output_path: Path) -> Dict[str, ob
 
     activation = quill_agent.activate(f"{protocol.tyme_core_binding}::Lattice-Engine")
     lattice = build_quill_lattice_prototype()
+    executor = executor or IntegrityExecutor(cache_path=integrity_cache)
 
     manifest = {
         "engine": "Quill-core", 
         "binding": protocol.tyme_core_binding,
         "agent": activation,
         "lattice": lattice.to_dict(),
+        "integrity": executor.verify(lattice.bridges, {"layers": lattice.layers()}),
         "protocol": protocol.protocol_name,
         "installed_at": datetime.now(UTC).isoformat(),
     }
 
+    if incremental:
+        write_incremental(manifest, output_path)
+        return manifest
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps(manifest, indent=2))
     return manifest
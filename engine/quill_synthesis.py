@@ -6,7 +6,7 @@ import re
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Set, Tuple
 
 from .quill_lattice import QuillLatticePrototype, build_quill_lattice_prototype, load_avot_quill
 
@@ -43,6 +43,9 @@ STOPWORDS = {
     "core",
 }
 
+KEYWORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9\-]{3,}")
+DEFAULT_KEYWORD_LIMIT = 12
+
 
 @dataclass
 class RepositorySignal:
@@ -62,23 +65,26 @@ class RepositorySignal:
         }
 
 
-def extract_keywords(text: str, limit: int = 12) -> List[str]:
-    """Collect normalized keyword candidates from text blocks."""
+def _collect_keywords(text: str, keywords: List[str], seen: Set[str], limit: int) -> None:
+    """Append unseen, non-stopword tokens of ``text`` until ``limit`` is reached."""
 
-    tokens = re.findall(r"[A-Za-z][A-Za-z0-9\-]{3,}", text)
-    normalized = []
-    for token in tokens:
-        lowered = token.lower()
-        if lowered in STOPWORDS:
+    for match in KEYWORD_PATTERN.finditer(text):
+        lowered = match.group().lower()
+        if lowered in seen or lowered in STOPWORDS:
             continue
-        normalized.append(lowered)
-    seen = []
-    for keyword in normalized:
-        if keyword not in seen:
-            seen.append(keyword)
-        if len(seen) >= limit:
-            break
-    return seen
+        seen.add(lowered)
+        keywords.append(lowered)
+        if len(keywords) >= limit:
+            return
+
+
+def extract_keywords(text: str, limit: int = DEFAULT_KEYWORD_LIMIT) -> List[str]:
+    """Collect normalized keyword candidates from text blocks."""
+
+    keywords: List[str] = []
+    if limit > 0:
+        _collect_keywords(text, keywords, set(), limit)
+    return keywords
 
 
 def read_headings(path: Path) -> List[str]:
@@ -95,6 +101,29 @@ def read_headings(path: Path) -> List[str]:
     return headings
 
 
+def scan_readme(path: Path, limit: int = DEFAULT_KEYWORD_LIMIT) -> Tuple[List[str], List[str]]:
+    """Stream ``path`` once, returning its Markdown headings and first ``limit`` keywords.
+
+    Tokenizing stops as soon as ``limit`` unique keywords are found; the
+    rest of the file is only checked for headings.
+    """
+
+    headings: List[str] = []
+    keywords: List[str] = []
+    if not path.exists():
+        return headings, keywords
+    seen: Set[str] = set()
+    with path.open() as handle:
+        for line in handle:
+            if line.lstrip().startswith("#"):
+                title = line.lstrip("# ").strip()
+                if title:
+                    headings.append(title)
+            if len(keywords) < limit:
+                _collect_keywords(line, keywords, seen, limit)
+    return headings, keywords
+
+
 def scan_repository(root: Path) -> RepositorySignal:
     """Scan a repository root for headings and lightweight keywords."""
 
@@ -104,9 +133,7 @@ def scan_repository(root: Path) -> RepositorySignal:
         if fallback:
             readme_path = fallback
 
-    headings = read_headings(readme_path)
-    keyword_source = readme_path.read_text() if readme_path.exists() else ""
-    keywords = extract_keywords(keyword_source)
+    headings, keywords = scan_readme(readme_path)
 
     return RepositorySignal(name=root.name or str(root), root=root, headings=headings, keywords=keywords)
 
@@ -230,5 +257,6 @@ __all__ = [
     "cross_reference_signals",
     "expand_quill_engine",
     "extract_keywords",
+    "scan_readme",
     "scan_repository",
 ]
@@ -0,0 +1,106 @@
+"""Compiled binary cache for JSON registries such as ``avot_registry.json``.
+
+Every AVOT script used to parse the registry JSON and rebuild its agents on
+start-up. The first load now also writes a compact ``marshal`` snapshot of
+a compiled form (for the AVOT registry: string table, agent columns and
+lookup indexes) to ``__pycache__`` beside the source; later loads unmarshal
+the snapshot instead. The snapshot header records the interpreter's
+``sys.implementation.cache_tag`` (``marshal`` output is only guaranteed to
+load on the interpreter that wrote it, so a snapshot from another one is
+treated as missing) and the source's mtime, size and SHA-256:
+
+* matching mtime and size: the payload is used as-is, without reading the
+  source at all;
+* changed mtime but identical content hash (a ``touch`` or checkout): the
+  header is refreshed and the payload reused;
+* anything else: the source is compiled again and the snapshot rewritten.
+
+A missing, stale or unreadable snapshot, or a read-only tree, simply falls
+back to compiling the source, so callers never see the cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+CACHE_MAGIC = b"AVOTC\x02"
+CACHE_TAG = (sys.implementation.cache_tag or "").encode("ascii")[:16]
+_HEADER = struct.Struct(f"<{len(CACHE_MAGIC)}s16sqq32s")
+
+
+def cache_path_for(source: Path, kind: str = "json") -> Path:
+    """Return where the ``kind`` snapshot of ``source`` is stored."""
+
+    return source.parent / "__pycache__" / f"{source.name}.{kind}.avotc"
+
+
+def _read_cache(cache_path: Path) -> Optional[Tuple[int, int, bytes, bytes]]:
+    try:
+        blob = cache_path.read_bytes()
+    except OSError:
+        return None
+    if len(blob) < _HEADER.size:
+        return None
+    magic, tag, mtime_ns, size, digest = _HEADER.unpack_from(blob)
+    if magic != CACHE_MAGIC or tag.rstrip(b"\0") != CACHE_TAG:
+        return None
+    return mtime_ns, size, digest, blob[_HEADER.size :]
+
+
+def _write_cache(cache_path: Path, stat: os.stat_result, digest: bytes, payload: bytes) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        staging.write_bytes(_HEADER.pack(CACHE_MAGIC, CACHE_TAG, stat.st_mtime_ns, stat.st_size, digest) + payload)
+        staging.replace(cache_path)
+    except OSError:
+        pass
+
+
+def load_compiled(source: Path | str, kind: str, compile: Callable[[bytes], Any]) -> Any:
+    """Return ``compile(source bytes)``, served from the ``kind`` snapshot when valid.
+
+    ``compile`` must return a value ``marshal`` can serialize.
+    """
+
+    source = Path(source)
+    stat = source.stat()
+    cache_path = cache_path_for(source, kind)
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        mtime_ns, size, digest, payload = cached
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            try:
+                return marshal.loads(payload)
+            except (EOFError, ValueError, TypeError):
+                cached = None
+
+    raw = source.read_bytes()
+    current = hashlib.sha256(raw).digest()
+    if cached is not None and cached[2] == current:
+        try:
+            compiled = marshal.loads(cached[3])
+        except (EOFError, ValueError, TypeError):
+            pass
+        else:
+            _write_cache(cache_path, stat, current, cached[3])
+            return compiled
+
+    compiled = compile(raw)
+    _write_cache(cache_path, stat, current, marshal.dumps(compiled))
+    return compiled
+
+
+def load_json_cached(source: Path | str) -> Dict[str, Any]:
+    """Return the parsed JSON object in ``source`` through the snapshot cache."""
+
+    return load_compiled(source, "json", json.loads)
+
+
+__all__ = ["cache_path_for", "load_compiled", "load_json_cached"]
@@ -0,0 +1,184 @@
+"""Hot-reloadable AVOT registry with copy-on-write snapshot swaps.
+
+Long-running consumers hold a :class:`HotRegistry` instead of a registry.
+A background thread watches ``avot_registry.json`` (inotify on Linux when
+libc exposes it, otherwise by polling the file's mtime and size). On a
+change it builds a complete new :class:`~engine.avot_engine.AvotRegistry`,
+with every agent materialized, and then publishes it by rebinding a single
+attribute. Readers just read :attr:`HotRegistry.current`. They never take a
+lock and always get either the previous or the new registry in full.
+
+An edit that leaves an unloadable registry behind (a partial save, or
+valid JSON of the wrong shape) keeps the previous registry in place and
+records the error in :attr:`HotRegistry.last_error`; the next change is
+tried again. A listener that raises is recorded the same way and does not
+stop the other listeners or the watcher thread.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .avot_engine import DEFAULT_HISTORY_DEPTH, AvotRegistry, load_avot_registry
+
+DEFAULT_POLL_INTERVAL = 1.0
+# inotify(7) masks for the events that can change the registry file.
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+
+def _open_inotify(directory: Path) -> Optional[int]:
+    """Return an inotify descriptor watching ``directory``, or ``None`` if unavailable."""
+
+    library = ctypes.util.find_library("c")
+    if not library:
+        return None
+    try:
+        libc = ctypes.CDLL(library, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    except (AttributeError, OSError):
+        return None
+    if fd < 0:
+        return None
+    mask = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class HotRegistry:
+    """An AVOT registry that is rebuilt and swapped in when its file changes."""
+
+    def __init__(
+        self,
+        registry_path: Path | str = Path("engine/avot_registry.json"),
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+        use_inotify: bool = True,
+    ) -> None:
+        self.registry_path = Path(registry_path)
+        self.poll_interval = poll_interval
+        self.history_depth = history_depth
+        self.use_inotify = use_inotify
+        self.version = 0
+        self.loaded_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._listeners: List[Callable[[AvotRegistry], None]] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify_fd: Optional[int] = None
+        self.current: AvotRegistry = self._build()
+        self._publish(self.current)
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.registry_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _build(self) -> AvotRegistry:
+        self._signature = self._file_signature()
+        registry = load_avot_registry(self.registry_path, self.history_depth)
+        registry.agents  # materialize every agent before anyone can see the registry
+        return registry
+
+    def _publish(self, registry: AvotRegistry) -> None:
+        self.current = registry
+        self.version += 1
+        self.loaded_at = time.time()
+        for listener in list(self._listeners):
+            try:
+                listener(registry)
+            except Exception as exc:  # noqa: BLE001 - one listener must not stop the others
+                name = getattr(listener, "__qualname__", repr(listener))
+                self.last_error = f"listener {name} failed: {type(exc).__name__}: {exc}"
+
+    def subscribe(self, listener: Callable[[AvotRegistry], None]) -> None:
+        """Call ``listener`` with each newly published registry."""
+
+        self._listeners.append(listener)
+
+    def check(self) -> bool:
+        """Reload now if the file changed; return whether a new registry was published."""
+
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            registry = self._build()
+        except Exception as exc:  # noqa: BLE001 - a malformed registry keeps the previous one
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            return False
+        self.last_error = None
+        self._publish(registry)
+        return True
+
+    @property
+    def watching_with_inotify(self) -> bool:
+        return self._inotify_fd is not None
+
+    def _wait_for_change(self) -> None:
+        if self._inotify_fd is None:
+            self._stop.wait(self.poll_interval)
+            return
+        readable, _, _ = select.select([self._inotify_fd], [], [], self.poll_interval)
+        if readable:
+            try:
+                while os.read(self._inotify_fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._wait_for_change()
+                if not self._stop.is_set():
+                    self.check()
+            except Exception as exc:  # noqa: BLE001 - the watcher must outlive any single failure
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                self._stop.wait(self.poll_interval)
+
+    def start(self) -> "HotRegistry":
+        """Start the background watcher thread (idempotent)."""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            if self.use_inotify:
+                self._inotify_fd = _open_inotify(self.registry_path.resolve().parent)
+            self._thread = threading.Thread(target=self._run, name="avot-registry-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+    def __enter__(self) -> "HotRegistry":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+__all__ = ["HotRegistry"]
@@ -0,0 +1,232 @@
+"""Streaming, key-selective reads from large JSON artifacts.
+
+Chronicle payloads such as ``TYME-PULSE-GENESIS.json`` carry bulky fields
+(every run's ``log_excerpt``, timing breakdowns) that most consumers never
+look at. ``json.loads`` still builds the full object graph for them. The
+helpers here memory-map the file and walk it with compiled byte patterns:
+values that were not requested are skipped without being decoded, so parse
+time and memory follow the fields used instead of the file size.
+
+The scanner assumes well-formed JSON (as written by the Tyme scripts); it
+raises :class:`ValueError` when the structure it expects is not there.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+_STRING_BODY = rb'[^"\\]*(?:\\.[^"\\]*)*'
+_STRING = re.compile(rb'"' + _STRING_BODY + rb'"', re.S)
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+# Everything up to the next bracket outside a string: whole runs of keys,
+# strings and scalars (such as a ``log_excerpt`` list) skip in one match.
+_BRACKET_FREE_RUN = re.compile(rb'(?:"' + _STRING_BODY + rb'"|[^"\[\]{}]+)*+', re.S)
+_OPEN_OBJECT = re.compile(rb"\s*\{\s*(\}?)")
+_OPEN_ARRAY = re.compile(rb"\s*\[\s*(\]?)\s*")
+_MEMBER = re.compile(rb'\s*"(' + _STRING_BODY + rb')"\s*:\s*', re.S)
+_OBJECT_SEPARATOR = re.compile(rb"\s*([,}])")
+_ARRAY_SEPARATOR = re.compile(rb"\s*([,\]])\s*")
+_DECODER = json.JSONDecoder()
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[Optional[mmap.mmap]]:
+    if not path.exists() or path.stat().st_size == 0:
+        yield None
+        return
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def _match(pattern: re.Pattern, buffer: mmap.mmap, pos: int) -> re.Match:
+    match = pattern.match(buffer, pos)
+    if match is None:
+        raise ValueError(f"malformed JSON near offset {pos}")
+    return match
+
+
+def _skip_container(buffer: mmap.mmap, pos: int) -> int:
+    depth = 0
+    while True:
+        symbol = buffer[pos]
+        if symbol in b"{[":
+            depth += 1
+        elif symbol in b"}]":
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos = _BRACKET_FREE_RUN.match(buffer, pos + 1).end()
+        if pos >= len(buffer):
+            raise ValueError("unterminated container at end of file")
+
+
+def _skip_value(buffer: mmap.mmap, pos: int) -> int:
+    """Return the offset just past the JSON value starting at ``pos``."""
+
+    lead = buffer[pos : pos + 1]
+    if lead == b'"':
+        return _match(_STRING, buffer, pos).end()
+    if lead in (b"{", b"["):
+        return _skip_container(buffer, pos)
+    return _match(_SCALAR, buffer, pos).end()
+
+
+def _decode(buffer: mmap.mmap, pos: int) -> Tuple[Any, int]:
+    end = _skip_value(buffer, pos)
+    return _DECODER.decode(buffer[pos:end].decode("utf-8")), end
+
+
+def _members(buffer: mmap.mmap, pos: int) -> Iterator[Tuple[str, int]]:
+    """Yield ``(key, value_offset)`` for each member of the object at ``pos``.
+
+    The consumer must hand back the offset after the value through
+    ``generator.send``; the walker resumes from there. The offset just past
+    the closing brace is returned as the generator's ``StopIteration`` value.
+    """
+
+    opening = _match(_OPEN_OBJECT, buffer, pos)
+    if opening.group(1):
+        return opening.end()
+    pos = opening.end()
+    while True:
+        member = _match(_MEMBER, buffer, pos)
+        raw = member.group(1)
+        key = raw.decode("utf-8") if b"\\" not in raw else json.loads(b'"' + raw + b'"')
+        end = yield key, member.end()
+        separator = _match(_OBJECT_SEPARATOR, buffer, end)
+        pos = separator.end()
+        if separator.group(1) == b"}":
+            return pos
+
+
+def _walk_object(buffer: mmap.mmap, pos: int, wanted: Optional[set]) -> Tuple[Dict[str, Any], int]:
+    """Decode only the ``wanted`` members of the object at ``pos``."""
+
+    selected: Dict[str, Any] = {}
+    members = _members(buffer, pos)
+    try:
+        key, value_pos = next(members)
+        while True:
+            if wanted is None or key in wanted:
+                selected[key], end = _decode(buffer, value_pos)
+            else:
+                end = _skip_value(buffer, value_pos)
+            key, value_pos = members.send(end)
+    except StopIteration as finished:
+        return selected, finished.value
+
+
+def _find_member(buffer: mmap.mmap, key: str) -> Optional[int]:
+    """Return the value offset of a top-level member, or ``None``."""
+
+    members = _members(buffer, 0)
+    try:
+        name, value_pos = next(members)
+        while True:
+            if name == key:
+                return value_pos
+            name, value_pos = members.send(_skip_value(buffer, value_pos))
+    except StopIteration:
+        return None
+
+
+def _elements(buffer: mmap.mmap, pos: int) -> Iterator[int]:
+    """Yield the offset of each element of the array at ``pos`` (see :func:`_members`)."""
+
+    opening = _match(_OPEN_ARRAY, buffer, pos)
+    if opening.group(1):
+        return
+    pos = opening.end()
+    while True:
+        end = yield pos
+        separator = _match(_ARRAY_SEPARATOR, buffer, end)
+        pos = separator.end()
+        if separator.group(1) == b"]":
+            return
+
+
+def iter_array(path: Path | str, key: str, fields: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield elements of the top-level array ``key`` holding only ``fields``.
+
+    With ``fields=None`` each element is decoded in full. Missing files,
+    missing keys, and non-array values yield nothing.
+    """
+
+    wanted = set(fields) if fields is not None else None
+    with _mapped(Path(path)) as buffer:
+        if buffer is None:
+            return
+        start = _find_member(buffer, key)
+        if start is None or buffer[start : start + 1] != b"[":
+            return
+        elements = _elements(buffer, start)
+        try:
+            element_pos = next(elements)
+            while True:
+                if buffer[element_pos : element_pos + 1] == b"{":
+                    item, end = _walk_object(buffer, element_pos, wanted)
+                else:
+                    item, end = _decode(buffer, element_pos)
+                yield item
+                element_pos = elements.send(end)
+        except StopIteration:
+            return
+
+
+def count_array(path: Path | str, key: str) -> Optional[int]:
+    """Count elements of the top-level array ``key`` without decoding them.
+
+    Returns ``None`` when the file or key is missing or the value is not
+    an array.
+    """
+
+    with _mapped(Path(path)) as buffer:
+        if buffer is None:
+            return None
+        start = _find_member(buffer, key)
+        if start is None or buffer[start : start + 1] != b"[":
+            return None
+        count = 0
+        elements = _elements(buffer, start)
+        try:
+            element_pos = next(elements)
+            while True:
+                count += 1
+                element_pos = elements.send(_skip_value(buffer, element_pos))
+        except StopIteration:
+            return count
+
+
+def read_keys(path: Path | str, keys: Iterable[str]) -> Dict[str, Any]:
+    """Decode only the requested top-level members of a JSON object file.
+
+    Scanning stops as soon as every requested key has been found.
+    """
+
+    wanted = set(keys)
+    selected: Dict[str, Any] = {}
+    with _mapped(Path(path)) as buffer:
+        if buffer is None or not wanted:
+            return selected
+        members = _members(buffer, 0)
+        try:
+            key, value_pos = next(members)
+            while True:
+                if key in wanted:
+                    selected[key], end = _decode(buffer, value_pos)
+                    if len(selected) == len(wanted):
+                        break
+                else:
+                    end = _skip_value(buffer, value_pos)
+                key, value_pos = members.send(end)
+        except StopIteration:
+            pass
+        members.close()
+    return selected
+
+
+__all__ = ["count_array", "iter_array", "read_keys"]
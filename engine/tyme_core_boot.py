@@ -7,6 +7,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .selective_json import count_array
+
 
 @dataclass
 class BootStep:
@@ -61,11 +63,10 @@ def _artifact_status(path: Path, online_label: str, missing_label: str, count_ke
         return {"status": "pending", "artifact": str(path), "note": missing_label}
 
     payload: Dict[str, Any] = {"status": "online", "artifact": str(path), "note": online_label}
-    data = json.loads(path.read_text())
-    if count_keys:
-        for key in count_keys:
-            if key in data and isinstance(data[key], list):
-                payload[f"{key}_count"] = len(data[key])
+    for key in count_keys or []:
+        count = count_array(path, key)
+        if count is not None:
+            payload[f"{key}_count"] = count
     return payload
 
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import sys
 from pathlib import Path
@@ -11,7 +12,9 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from engine.avot_engine import build_hive_sync
+from engine.agent_liveness import LivenessTracker
+from engine.agent_state_store import DEFAULT_STATE_PATH, AgentStateStore
+from engine.avot_engine import build_hive_sync, http_health_hook, load_avot_registry
 
 
 DEFAULT_REGISTRY = Path("engine/avot_registry.json")
@@ -32,12 +35,68 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_OUTPUT,
         help="Where to write the Hive-Core synchronization manifest.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream activation records to the manifest in batches and print only the summary.",
+    )
+    parser.add_argument(
+        "--probe-url",
+        default=None,
+        help="Health endpoint to GET per agent before activation; '{codename}' is substituted.",
+    )
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent probes when --probe-url is set.")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-agent probe timeout in seconds.")
+    parser.add_argument(
+        "--state-db",
+        type=Path,
+        default=DEFAULT_STATE_PATH,
+        help="SQLite agent state store to record activations in.",
+    )
+    parser.add_argument("--no-state", action="store_true", help="Do not record activations in the state store.")
+    parser.add_argument(
+        "--heartbeat-interval",
+        type=float,
+        default=60.0,
+        help="Expected seconds between agent heartbeats; agents silent for 1.5x are late and 3x dead.",
+    )
+    args = parser.parse_args()
+    if args.probe_url and args.stream:
+        parser.error("--stream cannot be combined with --probe-url; probed syncs write the full manifest")
+    return args
 
 
 def main() -> Dict[str, Any]:
     args = parse_args()
-    manifest = build_hive_sync(args.registry, args.output)
+    state_store = None if args.no_state else AgentStateStore(args.state_db)
+    liveness = LivenessTracker(interval_seconds=args.heartbeat_interval)
+    try:
+        if state_store is not None:
+            liveness.restore(state_store.heartbeats().items())
+        if args.probe_url:
+            registry = load_avot_registry(args.registry)
+            hook = http_health_hook(args.probe_url, timeout=args.timeout, concurrency=args.concurrency)
+            try:
+                manifest = asyncio.run(
+                    registry.protocol.synchronize_async(
+                        registry,
+                        hook,
+                        concurrency=args.concurrency,
+                        timeout=args.timeout,
+                        state_store=state_store,
+                        liveness=liveness,
+                    )
+                )
+            finally:
+                hook.executor.shutdown(wait=False, cancel_futures=True)
+            registry.protocol.persist_manifest(manifest, args.output)
+        else:
+            manifest = build_hive_sync(
+                args.registry, args.output, stream=args.stream, state_store=state_store, liveness=liveness
+            )
+    finally:
+        if state_store is not None:
+            state_store.close()
     print(json.dumps(manifest, indent=2))
     return manifest
 
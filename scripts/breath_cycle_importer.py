@@ -8,11 +8,14 @@ normalizes timestamp and duration data, and emits two artifacts:
 
 It also installs breath pacing into the internal metabolic loop by
 writing a pacing snapshot to ``heartbeat/logs/metabolic_loop.json``.
+With ``--archive-logs`` the full log of every run is also retained in a
+compressed, keyword-indexed archive (see ``scripts/breath_log_search.py``).
 """
 from __future__ import annotations
 
 import argparse
 import io
+import itertools
 import json
 import os
 import sys
@@ -20,20 +23,23 @@ import textwrap
 import urllib.error
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from engine.breath_log_archive import BreathLogArchive
 from engine.metabolic_loop import MetabolicLoop
 
 API_BASE = "https://api.github.com"
 DEFAULT_OWNER = "sovereign-codex"
 DEFAULT_REPO = "SICC"
 DEFAULT_WORKFLOW = "breath"
+DEFAULT_LIMIT = 10
 
 
 def github_request(path: str) -> Optional[dict]:
@@ -109,8 +115,8 @@ def fetch_workflow_runs(owner: str, repo: str, workflow_id: int, limit: int) ->
     return response.get("workflow_runs", [])
 
 
-def fetch_run_log_excerpt(owner: str, repo: str, run_id: int, line_limit: int) -> List[str]:
-    """Download a workflow run's logs and return a truncated list of lines."""
+def download_run_logs(owner: str, repo: str, run_id: int) -> Optional[bytes]:
+    """Download the zipped log bundle for a workflow run."""
 
     url = f"{API_BASE}/repos/{owner}/{repo}/actions/runs/{run_id}/logs"
     headers = {
@@ -125,28 +131,132 @@ def fetch_run_log_excerpt(owner: str, repo: str, run_id: int, line_limit: int) -
     try:
         request = urllib.request.Request(url, headers=headers)
         with urllib.request.urlopen(request) as response:
-            archive = response.read()
+            return response.read()
     except urllib.error.HTTPError as exc:  # pragma: no cover - network dependent
         print(f"[WARN] Unable to download logs for run {run_id}: {exc}")
-        return []
+        return None
     except urllib.error.URLError as exc:  # pragma: no cover - network dependent
         print(f"[WARN] Network error while fetching logs for run {run_id}: {exc}")
-        return []
+        return None
+
+
+def iter_log_lines(archive: bytes) -> Iterator[str]:
+    """Yield stripped log lines from a zipped log bundle in file order."""
 
-    lines: List[str] = []
     with zipfile.ZipFile(io.BytesIO(archive)) as zipped:
         for name in sorted(zipped.namelist()):
             with zipped.open(name) as payload:
                 content = payload.read().decode("utf-8", errors="replace")
                 for line in content.splitlines():
-                    lines.append(line.strip())
-                    if len(lines) >= line_limit:
-                        return lines
-    return lines
+                    yield line.strip()
+
+
+def fetch_run_log_excerpt(owner: str, repo: str, run_id: int, line_limit: int) -> List[str]:
+    """Download a workflow run's logs and return a truncated list of lines."""
+
+    archive = download_run_logs(owner, repo, run_id)
+    if archive is None:
+        return []
+    return list(itertools.islice(iter_log_lines(archive), line_limit))
+
 
+def fetch_run_jobs(owner: str, repo: str, run_id: int) -> List[dict]:
+    """Fetch the jobs (with their steps) executed by a workflow run."""
+
+    response = github_request(f"/repos/{owner}/{repo}/actions/runs/{run_id}/jobs?per_page=100")
+    if not response:
+        return []
+    return response.get("jobs", [])
 
-def normalize_run(run: dict, owner: str, repo: str, line_limit: int) -> dict:
-    """Normalize run metadata and include a log excerpt."""
+
+def seconds_between(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
+    """Return the non-negative number of seconds between two timestamps."""
+
+    if not start or not end:
+        return None
+    return max((end - start).total_seconds(), 0.0)
+
+
+def build_run_timing(run: dict, jobs: Iterable[dict]) -> dict:
+    """Break a run's wall time down into queue, job, and step durations."""
+
+    created_at = parse_timestamp(run.get("created_at"))
+    started_at = parse_timestamp(run.get("run_started_at") or run.get("created_at"))
+
+    job_timings: List[dict] = []
+    for job in jobs:
+        job_created = parse_timestamp(job.get("created_at"))
+        job_started = parse_timestamp(job.get("started_at"))
+        job_completed = parse_timestamp(job.get("completed_at"))
+        steps = []
+        for step in job.get("steps") or []:
+            steps.append(
+                {
+                    "number": step.get("number"),
+                    "name": step.get("name"),
+                    "conclusion": step.get("conclusion"),
+                    "duration_seconds": seconds_between(
+                        parse_timestamp(step.get("started_at")), parse_timestamp(step.get("completed_at"))
+                    ),
+                }
+            )
+        job_timings.append(
+            {
+                "name": job.get("name"),
+                "conclusion": job.get("conclusion"),
+                "queue_seconds": seconds_between(job_created, job_started),
+                "duration_seconds": seconds_between(job_started, job_completed),
+                "completed_at": job_completed.isoformat(timespec="seconds") if job_completed else None,
+                "steps": steps,
+            }
+        )
+
+    return {
+        "queue_seconds": seconds_between(created_at, started_at),
+        "jobs": job_timings,
+    }
+
+
+def summarize_critical_path(timing: dict, step_limit: int = 3) -> dict:
+    """Summarize the job that gated run completion and its slowest steps.
+
+    Jobs may run in parallel, so the run finishes when its last job does;
+    that job (plus the queue time before it) is the critical path.
+    """
+
+    jobs = [job for job in timing.get("jobs", []) if job.get("completed_at")]
+    if not jobs:
+        return {"queue_seconds": timing.get("queue_seconds"), "job": None, "job_seconds": None, "slowest_steps": []}
+
+    gating_job = max(jobs, key=lambda job: job["completed_at"])
+    steps = [step for step in gating_job["steps"] if isinstance(step.get("duration_seconds"), (int, float))]
+    steps.sort(key=lambda step: step["duration_seconds"], reverse=True)
+    return {
+        "queue_seconds": timing.get("queue_seconds"),
+        "job": gating_job["name"],
+        "job_queue_seconds": gating_job["queue_seconds"],
+        "job_seconds": gating_job["duration_seconds"],
+        "slowest_steps": [
+            {"name": step["name"], "duration_seconds": step["duration_seconds"]} for step in steps[:step_limit]
+        ],
+    }
+
+
+def normalize_run(
+    run: dict,
+    owner: str,
+    repo: str,
+    line_limit: int,
+    log_archive: Optional[BreathLogArchive] = None,
+    jobs: Optional[List[dict]] = None,
+) -> dict:
+    """Normalize run metadata and include a log excerpt.
+
+    When ``log_archive`` is provided the full log is retained in the
+    compressed archive and the excerpt is cut from that copy instead of
+    being downloaded separately. When ``jobs`` is provided the run also
+    carries a job/step ``timing`` breakdown and a ``critical_path`` summary.
+    """
 
     started_at = parse_timestamp(run.get("run_started_at") or run.get("created_at"))
     completed_at = parse_timestamp(run.get("updated_at"))
@@ -155,14 +265,23 @@ def normalize_run(run: dict, owner: str, repo: str, line_limit: int) -> dict:
         duration = (completed_at - started_at).total_seconds()
 
     run_id = int(run.get("id", 0))
-    logs = fetch_run_log_excerpt(owner, repo, run_id, line_limit) if run_id else []
+    archive_path: Optional[Path] = None
+    if run_id and log_archive is not None:
+        bundle = download_run_logs(owner, repo, run_id)
+        full_log = list(iter_log_lines(bundle)) if bundle is not None else []
+        if full_log:
+            archive_path = log_archive.add_run(run_id, full_log)
+        logs = full_log[:line_limit]
+    else:
+        logs = fetch_run_log_excerpt(owner, repo, run_id, line_limit) if run_id and line_limit > 0 else []
 
     def timestamp_to_iso(dt: Optional[datetime]) -> Optional[str]:
         return dt.isoformat(timespec="seconds") if dt else None
 
     log_excerpt = [line for line in logs if line][:line_limit]
-    return {
+    cycle = {
         "run_id": run_id,
+        "repo": f"{owner}/{repo}" if owner else repo,
         "name": run.get("name"),
         "event": run.get("event"),
         "status": run.get("status"),
@@ -173,14 +292,47 @@ def normalize_run(run: dict, owner: str, repo: str, line_limit: int) -> dict:
         "duration_seconds": duration,
         "log_excerpt": log_excerpt,
     }
-
-
-def summarize_cycles(cycles: Iterable[dict]) -> Dict[str, Optional[float]]:
+    if archive_path is not None:
+        cycle["log_archive"] = str(archive_path)
+    if jobs is not None:
+        timing = build_run_timing(run, jobs)
+        cycle["timing"] = timing
+        cycle["critical_path"] = summarize_critical_path(timing)
+    return cycle
+
+
+def slowest_steps(cycles: Iterable[dict], limit: int = 5) -> List[dict]:
+    """Rank job steps by their longest observed duration across cycles."""
+
+    observed: Dict[tuple, List[float]] = {}
+    for cycle in cycles:
+        for job in (cycle.get("timing") or {}).get("jobs", []):
+            for step in job.get("steps", []):
+                duration = step.get("duration_seconds")
+                if isinstance(duration, (int, float)):
+                    observed.setdefault((job.get("name"), step.get("name")), []).append(duration)
+
+    ranked = sorted(observed.items(), key=lambda item: max(item[1]), reverse=True)
+    return [
+        {
+            "job": job_name,
+            "step": step_name,
+            "runs": len(durations),
+            "longest_seconds": round(max(durations), 2),
+            "average_seconds": round(sum(durations) / len(durations), 2),
+        }
+        for (job_name, step_name), durations in ranked[:limit]
+    ]
+
+
+def summarize_cycles(cycles: Iterable[dict]) -> Dict[str, object]:
     """Compute aggregate statistics for a list of normalized cycles."""
 
+    cycles = list(cycles)
+    steps = slowest_steps(cycles)
     durations = [cycle.get("duration_seconds") for cycle in cycles if isinstance(cycle.get("duration_seconds"), (int, float))]
     if not durations:
-        return {"count": 0, "average_duration_seconds": None, "longest_duration_seconds": None}
+        return {"count": 0, "average_duration_seconds": None, "longest_duration_seconds": None, "slowest_steps": steps}
 
     average = sum(durations) / len(durations)
     longest = max(durations)
@@ -188,9 +340,101 @@ def summarize_cycles(cycles: Iterable[dict]) -> Dict[str, Optional[float]]:
         "count": len(durations),
         "average_duration_seconds": round(average, 2),
         "longest_duration_seconds": round(longest, 2),
+        "slowest_steps": steps,
     }
 
 
+RunKey = Tuple[str, int]
+
+
+def cycle_key(cycle: dict, default_repo: str = "") -> RunKey:
+    """Identify a cycle by ``(repo, run_id)``; run ids are only unique within a repository."""
+
+    return str(cycle.get("repo") or default_repo), int(cycle.get("run_id") or 0)
+
+
+def payload_repo(payload: dict) -> str:
+    """The ``owner/repo`` a genesis payload was imported from, for cycles that predate ``repo``."""
+
+    source = payload.get("source") or {}
+    owner, repo = source.get("owner") or "", source.get("repo") or ""
+    return f"{owner}/{repo}" if owner else repo
+
+
+def ledger_run_keys(history_path: Path) -> Set[RunKey]:
+    """Return the ``(repo, run_id)`` keys already appended to the JSON-lines history ledger."""
+
+    keys: Set[RunKey] = set()
+    if not history_path.exists():
+        return keys
+    with history_path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                cycle = json.loads(line)
+                if cycle.get("run_id"):
+                    keys.add(cycle_key(cycle))
+    return keys
+
+
+def record_cycles(
+    genesis_path: Path,
+    history_path: Path,
+    cycles: Iterable[dict],
+    known_run_keys: Optional[Set[RunKey]] = None,
+    annotate: Optional[Callable[[dict, List[dict]], None]] = None,
+    limit: Optional[int] = None,
+) -> Tuple[dict, List[dict]]:
+    """Merge pushed cycles into the genesis payload and the history ledger.
+
+    Runs are identified by ``(repo, run_id)``. Cycles replace any genesis
+    entry with the same key and are kept newest first, matching the order
+    of the polling importer; with ``limit`` only the newest ``limit``
+    cycles stay in genesis, as the importer's ``--limit`` does. A cycle is
+    *fresh* when its run is in neither the genesis payload nor the history
+    ledger. The ledger is never truncated, so a late redelivery of a run
+    that has aged out of the genesis payload is still recognized. Fresh
+    cycles are appended to the ledger. ``known_run_keys`` lets a long-lived
+    caller pass the ledger's keys instead of rereading the file; the set
+    is updated in place. ``annotate(payload, fresh)`` runs before the
+    genesis payload is written, so callers can add sections without a
+    second write. Returns the updated payload and the fresh cycles.
+    """
+
+    cycles = list(cycles)
+    if genesis_path.exists():
+        payload = json.loads(genesis_path.read_text(encoding="utf-8"))
+    else:
+        payload = {"schema": "tyme-pulse-genesis/v1", "source": {}, "summary": {}, "breath_cycles": []}
+
+    if known_run_keys is None:
+        known_run_keys = ledger_run_keys(history_path)
+    default_repo = payload_repo(payload)
+    existing = payload.get("breath_cycles", [])
+    known = known_run_keys | {cycle_key(cycle, default_repo) for cycle in existing}
+    fresh = [cycle for cycle in cycles if cycle_key(cycle) not in known]
+
+    incoming = {cycle_key(cycle) for cycle in cycles}
+    merged = [cycle for cycle in existing if cycle_key(cycle, default_repo) not in incoming] + cycles
+    merged.sort(key=lambda cycle: cycle.get("started_at") or "", reverse=True)
+    if limit is not None:
+        del merged[limit:]
+    payload["breath_cycles"] = merged
+    payload["summary"] = summarize_cycles(merged)
+    if annotate is not None:
+        annotate(payload, fresh)
+
+    genesis_path.parent.mkdir(parents=True, exist_ok=True)
+    genesis_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    if fresh:
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with history_path.open("a", encoding="utf-8") as handle:
+            for cycle in fresh:
+                handle.write(json.dumps(cycle, separators=(",", ":")) + "\n")
+        known_run_keys.update(cycle_key(cycle) for cycle in fresh)
+    return payload, fresh
+
+
 def dump_yaml(data: object, indent: int = 0) -> str:
     """Lightweight YAML serializer for dict/list structures."""
 
@@ -224,8 +468,21 @@ def dump_yaml(data: object, indent: int = 0) -> str:
     return f"{spaces}{json.dumps(data)}"
 
 
-def build_payload(owner: str, repo: str, workflow: str, limit: int, line_limit: int) -> dict:
-    """Pull workflow runs, normalize them, and assemble the pulse payload."""
+def build_payload(
+    owner: str,
+    repo: str,
+    workflow: str,
+    limit: int,
+    line_limit: int,
+    log_archive: Optional[BreathLogArchive] = None,
+    include_timing: bool = True,
+    workers: int = 4,
+) -> dict:
+    """Pull workflow runs, normalize them, and assemble the pulse payload.
+
+    Each run's logs and (when ``include_timing`` is set) its jobs are
+    fetched concurrently across ``workers`` threads.
+    """
 
     workflow_id = resolve_workflow_id(owner, repo, workflow)
     if workflow_id is None:
@@ -234,7 +491,17 @@ def build_payload(owner: str, repo: str, workflow: str, limit: int, line_limit:
     else:
         runs = fetch_workflow_runs(owner, repo, workflow_id, limit)
 
-    cycles = [normalize_run(run, owner, repo, line_limit) for run in runs]
+    def ingest(run: dict) -> dict:
+        run_id = int(run.get("id", 0))
+        jobs = fetch_run_jobs(owner, repo, run_id) if include_timing and run_id else None
+        return normalize_run(run, owner, repo, line_limit, log_archive, jobs)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        cycles = list(pool.map(ingest, runs))
+    # The API lists runs by creation time; genesis readers merge on start time.
+    cycles.sort(key=lambda cycle: cycle.get("started_at") or "", reverse=True)
+    if log_archive is not None:
+        log_archive.save()
     summary = summarize_cycles(cycles)
 
     payload = {
@@ -269,7 +536,9 @@ def main(argv: Optional[List[str]] = None) -> int:  # pragma: no cover - CLI ent
     parser.add_argument("--owner", default=DEFAULT_OWNER, help="Repository owner (default: sovereign-codex)")
     parser.add_argument("--repo", default=DEFAULT_REPO, help="Repository name (default: SICC)")
     parser.add_argument("--workflow", default=DEFAULT_WORKFLOW, help="Workflow name, path, or id (default: breath)")
-    parser.add_argument("--limit", type=int, default=10, help="Maximum number of runs to import (default: 10)")
+    parser.add_argument(
+        "--limit", type=int, default=DEFAULT_LIMIT, help=f"Maximum number of runs to import (default: {DEFAULT_LIMIT})"
+    )
     parser.add_argument("--log-lines", type=int, default=40, help="Maximum number of log lines per run (default: 40)")
     parser.add_argument(
         "--output-dir",
@@ -277,21 +546,50 @@ def main(argv: Optional[List[str]] = None) -> int:  # pragma: no cover - CLI ent
         default=Path("chronicle"),
         help="Directory where TYME-PULSE artifacts are written (default: chronicle)",
     )
+    parser.add_argument(
+        "--archive-logs",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Retain full run logs compressed in DIR with a searchable token index (e.g. chronicle/breath_logs)",
+    )
+    parser.add_argument(
+        "--no-timing",
+        action="store_true",
+        help="Skip fetching jobs and steps for the per-run timing breakdown",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent run fetches (default: 4)")
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Recompute anomalies, grouped pacing and the forecast in the metabolic loop snapshot",
+    )
 
     args = parser.parse_args(argv)
     genesis_path = args.output_dir / "TYME-PULSE-GENESIS.json"
     wave_path = args.output_dir / "TYME-PULSE-WAVE.yaml"
 
-    payload = build_payload(args.owner, args.repo, args.workflow, args.limit, args.log_lines)
+    log_archive = BreathLogArchive(args.archive_logs) if args.archive_logs else None
+    payload = build_payload(
+        args.owner,
+        args.repo,
+        args.workflow,
+        args.limit,
+        args.log_lines,
+        log_archive,
+        include_timing=not args.no_timing,
+        workers=args.workers,
+    )
 
     metabolic_loop = MetabolicLoop(genesis_path=genesis_path)
-    pacing_snapshot = metabolic_loop.install(payload.get("breath_cycles", []))
+    pacing_snapshot = metabolic_loop.install(payload.get("breath_cycles", []), history=args.history)
 
     payload["metabolic_loop"] = {
         "installed_at": pacing_snapshot["updated_at"],
         "pacing_file": str(metabolic_loop.output_path),
         "breath_pacing": pacing_snapshot["breath_pacing"],
         "cycles_observed": pacing_snapshot["cycles_observed"],
+        "cycles_total": pacing_snapshot["cycles_total"],
     }
 
     wave_payload = {
@@ -307,8 +605,9 @@ def main(argv: Optional[List[str]] = None) -> int:  # pragma: no cover - CLI ent
         "notes": textwrap.dedent(
             """
             The wave ledger mirrors the genesis payload but is tuned for human review.
-            Log excerpts are truncated to keep the pulse wave compact; use GitHub to
-            inspect full traces when deeper resonance checks are required.
+            Log excerpts are truncated to keep the pulse wave compact; import with
+            --archive-logs and query scripts/breath_log_search.py (or use GitHub)
+            to inspect full traces when deeper resonance checks are required.
             """
         ).strip(),
     }
@@ -0,0 +1,60 @@
+"""Search archived Breath Cycle run logs by keyword.
+
+Queries resolve against the inverted token index written by
+``scripts/breath_cycle_importer.py --archive-logs`` and report matching
+runs with their line numbers. Compressed logs are only opened for runs
+that matched, and only when ``--show-lines`` is requested.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from engine.breath_log_archive import BreathLogArchive
+
+DEFAULT_ARCHIVE = Path("chronicle/breath_logs")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Search archived Breath Cycle run logs.")
+    parser.add_argument("query", help="Keywords that must all appear on a matching log line.")
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=DEFAULT_ARCHIVE,
+        help="Directory holding the compressed logs and index (default: chronicle/breath_logs)",
+    )
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of runs to report.")
+    parser.add_argument("--show-lines", action="store_true", help="Include the text of each matching line.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    archive = BreathLogArchive(args.archive)
+
+    started = time.perf_counter()
+    hits = archive.search(args.query, include_lines=args.show_lines, limit=args.limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    result = {
+        "query": args.query,
+        "archive": str(args.archive),
+        "runs_matched": len(hits),
+        "elapsed_ms": round(elapsed_ms, 3),
+        "matches": [hit.to_dict() for hit in hits],
+    }
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Receive ``workflow_run`` webhooks and ingest Breath Cycle runs as they finish.
+
+Instead of polling GitHub on a schedule, this receiver listens for the
+``workflow_run`` events GitHub pushes when a run completes. Each event is
+normalized with the importer's ``normalize_run``, merged into
+``chronicle/TYME-PULSE-GENESIS.json``, appended to the JSON-lines history
+``chronicle/TYME-PULSE-HISTORY.jsonl``, and folded incrementally into the
+metabolic loop snapshot. Redelivered events refresh the stored cycle
+without being counted twice in the pacing, even after the run has aged out
+of the genesis payload: runs are deduplicated by ``(repo, run_id)`` against
+the history ledger. Genesis keeps only the newest ``--limit`` runs, like the
+polling importer; the ledger keeps them all.
+
+Recorded payloads can be replayed against a local receiver::
+
+    python scripts/breath_webhook_receiver.py --port 8765 &
+    curl -X POST http://127.0.0.1:8765/ \\
+         -H "X-GitHub-Event: workflow_run" \\
+         -H "Content-Type: application/json" \\
+         --data @recorded_workflow_run.json
+
+When ``--secret`` (or ``TYME_WEBHOOK_SECRET``) is set, the
+``X-Hub-Signature-256`` header must match the HMAC of the request body.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from engine.metabolic_loop import MetabolicLoop
+from scripts.breath_cycle_importer import (
+    DEFAULT_LIMIT,
+    RunKey,
+    fetch_run_jobs,
+    ledger_run_keys,
+    normalize_run,
+    record_cycles,
+)
+
+DEFAULT_OUTPUT_DIR = Path("chronicle")
+
+
+class BreathWebhookReceiver:
+    """Turn ``workflow_run`` webhook payloads into stored breath cycles."""
+
+    def __init__(
+        self,
+        output_dir: Path = DEFAULT_OUTPUT_DIR,
+        metabolic_output: Path = Path("heartbeat/logs/metabolic_loop.json"),
+        workflow: Optional[str] = None,
+        line_limit: int = 0,
+        include_timing: bool = False,
+        secret: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_LIMIT,
+    ) -> None:
+        self.genesis_path = output_dir / "TYME-PULSE-GENESIS.json"
+        self.history_path = output_dir / "TYME-PULSE-HISTORY.jsonl"
+        self.loop = MetabolicLoop(genesis_path=self.genesis_path, output_path=metabolic_output)
+        self.workflow = workflow.lower() if workflow else None
+        self.line_limit = line_limit
+        self.include_timing = include_timing
+        self.secret = secret
+        self.limit = limit
+        self._ledger_run_keys: Optional[Set[RunKey]] = None
+
+    def verify_signature(self, body: bytes, signature: Optional[str]) -> bool:
+        """Check the ``X-Hub-Signature-256`` header when a secret is configured."""
+
+        if not self.secret:
+            return True
+        if not signature:
+            return False
+        expected = "sha256=" + hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def _matches_workflow(self, run: Dict[str, Any]) -> bool:
+        if not self.workflow:
+            return True
+        candidates = (
+            str(run.get("workflow_id", "")),
+            (run.get("name") or "").lower(),
+            (run.get("path") or "").lower(),
+        )
+        return self.workflow in candidates
+
+    def handle_event(self, event: Optional[str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Ingest a webhook payload and report what happened to it."""
+
+        if event != "workflow_run":
+            return {"status": "ignored", "reason": f"unsupported event {event!r}"}
+        if payload.get("action") != "completed":
+            return {"status": "ignored", "reason": f"action {payload.get('action')!r} is not 'completed'"}
+
+        run = payload.get("workflow_run") or {}
+        if not run.get("id"):
+            return {"status": "ignored", "reason": "payload has no workflow_run id"}
+        if not self._matches_workflow(run):
+            return {"status": "ignored", "reason": f"workflow {run.get('name')!r} is not tracked"}
+
+        repository = payload.get("repository") or run.get("repository") or {}
+        owner = (repository.get("owner") or {}).get("login", "")
+        repo = repository.get("name", "")
+
+        run_id = int(run["id"])
+        jobs = fetch_run_jobs(owner, repo, run_id) if self.include_timing else None
+        cycle = normalize_run(run, owner, repo, self.line_limit, jobs=jobs)
+
+        observed: Dict[str, Any] = {}
+
+        def fold_into_loop(genesis: Dict[str, Any], fresh: List[dict]) -> None:
+            snapshot = observed["snapshot"] = self.loop.observe(fresh)
+            genesis["metabolic_loop"] = {
+                "installed_at": snapshot["updated_at"],
+                "pacing_file": str(self.loop.output_path),
+                "breath_pacing": snapshot["breath_pacing"],
+                "cycles_observed": snapshot["cycles_observed"],
+                "cycles_total": snapshot["cycles_total"],
+            }
+
+        try:
+            if self._ledger_run_keys is None:
+                self._ledger_run_keys = ledger_run_keys(self.history_path)
+            _, fresh = record_cycles(
+                self.genesis_path,
+                self.history_path,
+                [cycle],
+                known_run_keys=self._ledger_run_keys,
+                annotate=fold_into_loop,
+                limit=self.limit,
+            )
+        except (OSError, json.JSONDecodeError) as exc:
+            return {"status": "error", "run_id": run_id, "reason": f"{type(exc).__name__}: {exc}"}
+        snapshot = observed["snapshot"]
+
+        return {
+            "status": "ingested" if fresh else "updated",
+            "run_id": run_id,
+            "duration_seconds": cycle["duration_seconds"],
+            "breath_pacing": snapshot["breath_pacing"],
+        }
+
+
+def make_handler(receiver: BreathWebhookReceiver) -> type:
+    """Bind a request handler class to the given receiver."""
+
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def _respond(self, code: int, body: Dict[str, Any]) -> None:
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            self._respond(200, {"status": "listening", "genesis": str(receiver.genesis_path)})
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length)
+            if not receiver.verify_signature(body, self.headers.get("X-Hub-Signature-256")):
+                self._respond(401, {"status": "rejected", "reason": "signature mismatch"})
+                return
+            try:
+                payload = json.loads(body.decode("utf-8") or "{}")
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                self._respond(400, {"status": "rejected", "reason": f"invalid JSON: {exc}"})
+                return
+
+            result = receiver.handle_event(self.headers.get("X-GitHub-Event"), payload)
+            if result["status"] == "error":
+                self._respond(500, result)
+            else:
+                self._respond(202 if result["status"] in ("ingested", "updated") else 200, result)
+
+    return WebhookHandler
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Receive workflow_run webhooks and ingest Breath Cycle runs.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--workflow", default=None, help="Only ingest runs of this workflow name, path, or id")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=DEFAULT_OUTPUT_DIR,
+        help="Directory holding the genesis payload and history ledger (default: chronicle)",
+    )
+    parser.add_argument(
+        "--log-lines",
+        type=int,
+        default=0,
+        help="Log lines to fetch from GitHub per run; 0 skips the download (default: 0)",
+    )
+    parser.add_argument("--timing", action="store_true", help="Fetch jobs and steps for a timing breakdown")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"Newest runs kept in the genesis payload; older ones stay in the ledger (default: {DEFAULT_LIMIT})",
+    )
+    parser.add_argument(
+        "--secret",
+        default=os.getenv("TYME_WEBHOOK_SECRET"),
+        help="Webhook secret used to verify X-Hub-Signature-256 (default: $TYME_WEBHOOK_SECRET)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None) -> None:  # pragma: no cover - CLI entry point
+    args = parse_args(argv)
+    receiver = BreathWebhookReceiver(
+        output_dir=args.output_dir,
+        workflow=args.workflow,
+        line_limit=args.log_lines,
+        include_timing=args.timing,
+        secret=args.secret,
+        limit=args.limit,
+    )
+    server = HTTPServer((args.host, args.port), make_handler(receiver))
+    print(f"[OK] Breath webhook receiver listening on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    main()
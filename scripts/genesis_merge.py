@@ -0,0 +1,65 @@
+"""Pace the Breath Cycle across several genesis payloads at once.
+
+Each argument is a ``TYME-PULSE-GENESIS.json`` produced for one repository
+or shard. Their ``breath_cycles`` are combined by a streaming k-way merge
+(newest first, deduplicated by ``(repo, run_id)``) and installed into a
+single metabolic loop snapshot. With ``--history`` per-repository figures
+are written under ``grouped_pacing.repo``::
+
+    python scripts/genesis_merge.py shards/sicc.json shards/tyme.json \\
+        --output heartbeat/logs/metabolic_loop.json --history
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from engine.metabolic_loop import MetabolicLoop
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Merge breath cycles from several genesis payloads into one pacing.")
+    parser.add_argument("genesis", nargs="+", type=Path, help="Genesis payloads to merge")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("heartbeat/logs/metabolic_loop.json"),
+        help="Metabolic loop snapshot to write (default: heartbeat/logs/metabolic_loop.json)",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Discard the persisted pacing state first")
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Recompute anomalies, grouped pacing and the forecast over every merged cycle",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None) -> None:  # pragma: no cover - CLI entry point
+    args = parse_args(argv)
+    primary, *others = args.genesis
+    loop = MetabolicLoop(genesis_path=primary, output_path=args.output, merge_sources=others)
+    snapshot = loop.install(rebuild=args.rebuild, history=args.history)
+    print(
+        json.dumps(
+            {
+                "sources": snapshot["source"],
+                "cycles_observed": snapshot["cycles_observed"],
+                "cycles_total": snapshot["cycles_total"],
+                "breath_pacing": snapshot["breath_pacing"],
+                "repos": snapshot.get("grouped_pacing", {}).get("repo", {}),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    main()
@@ -0,0 +1,47 @@
+"""Synchronize several AVOT hives in parallel and write a federated manifest."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.hive_federation import build_federated_sync
+
+
+DEFAULT_OUTPUT = Path("chronicle/hive_federation_sync.json")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("registries", nargs="+", type=Path, help="AVOT registry JSON files, one per hive.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="Where to write the federated synchronization manifest.",
+    )
+    parser.add_argument(
+        "--hive-output-dir",
+        type=Path,
+        default=None,
+        help="Directory to keep the per-hive manifests in (default: a temporary directory, removed afterwards).",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per hive, up to CPUs).")
+    return parser.parse_args()
+
+
+def main() -> Dict[str, Any]:
+    args = parse_args()
+    manifest = build_federated_sync(args.registries, args.output, workers=args.workers, hive_output_dir=args.hive_output_dir)
+    print(json.dumps({"output": str(args.output), "summary": manifest["summary"], "conflicts": manifest["conflicts"][:20]}, indent=2))
+    return manifest
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Coordinate Tyme pulse activation from the genesis payload.
 
-This utility loads ``chronicle/TYME-PULSE-GENESIS.json``, computes the
+This utility reads ``chronicle/TYME-PULSE-GENESIS.json`` selectively (only
+the ``source`` block, plus the cycle fields the loop needs), computes the
 metabolic cadence via the :class:`MetabolicLoop`, and stages a
 synchronization manifest for AVOT agents. The resulting manifest captures
 current pacing and marks each agent as ready for resonance alignment so
@@ -21,21 +22,20 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from engine.metabolic_loop import MetabolicLoop
+from engine.registry_cache import load_json_cached
+from engine.selective_json import read_keys
+
 GENESIS_PATH = REPO_ROOT / "chronicle/TYME-PULSE-GENESIS.json"
 AVOT_REGISTRY_PATH = REPO_ROOT / "engine/avot_registry.json"
 DEFAULT_SYNC_OUTPUT = REPO_ROOT / "chronicle/pulse_sync_state.json"
 
 
-def load_json(path: Path) -> Dict[str, Any]:
-    """Load JSON content from disk, returning an empty dict if missing."""
-
-    if not path.exists():
-        return {}
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def prepare_metabolic_snapshot(genesis: Dict[str, Any]) -> Dict[str, Any]:
-    """Compute and install metabolic pacing from the genesis payload."""
+    """Compute and install metabolic pacing from the genesis payload.
+
+    When ``genesis`` carries no ``breath_cycles`` the loop streams the
+    cycle fields it needs straight from the genesis file.
+    """
 
     cycles = genesis.get("breath_cycles")
     loop = MetabolicLoop(genesis_path=GENESIS_PATH, output_path=REPO_ROOT / "heartbeat/logs/metabolic_loop.json")
@@ -87,8 +87,8 @@ def write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
 
 
 def run(output: Path) -> Path:
-    genesis = load_json(GENESIS_PATH)
-    avot_registry = load_json(AVOT_REGISTRY_PATH)
+    genesis = read_keys(GENESIS_PATH, ["source"])
+    avot_registry = load_json_cached(AVOT_REGISTRY_PATH) if AVOT_REGISTRY_PATH.exists() else {}
 
     metabolic_snapshot = prepare_metabolic_snapshot(genesis)
     agent_roster = prepare_agent_roster(avot_registry)
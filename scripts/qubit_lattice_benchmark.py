@@ -0,0 +1,40 @@
+"""Benchmark the qubit-lattice state-vector simulator in gates per second."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.qubit_lattice import benchmark_gates, max_qubits
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--qubits",
+        type=int,
+        nargs="+",
+        default=[4, 8, 12, 16, 20],
+        help="Qubit counts to benchmark.",
+    )
+    parser.add_argument("--gates", type=int, default=200, help="Gates per benchmarked circuit.")
+    parser.add_argument("--batch", type=int, default=1, help="State vectors simulated side by side.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the random circuits.")
+    return parser.parse_args()
+
+
+def main() -> List[Dict[str, Any]]:
+    args = parse_args()
+    results = benchmark_gates(args.qubits, gates=args.gates, batch=args.batch, seed=args.seed)
+    print(json.dumps({"max_qubits": max_qubits(args.batch), "results": results}, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
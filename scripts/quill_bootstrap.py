@@ -31,12 +31,25 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_OUTPUT,
         help="Where to write the Quill-core lattice manifest.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip the write when only timestamps changed; otherwise append a delta record beside the manifest.",
+    )
+    parser.add_argument(
+        "--integrity-cache",
+        type=Path,
+        default=None,
+        help="JSON file memoizing bridge integrity results across runs.",
+    )
     return parser.parse_args()
 
 
 def main() -> Dict[str, Any]:
     args = parse_args()
-    manifest = bootstrap_quill_core(args.registry, args.output)
+    manifest = bootstrap_quill_core(
+        args.registry, args.output, incremental=args.incremental, integrity_cache=args.integrity_cache
+    )
     print(json.dumps(manifest, indent=2))
     return manifest
 
@@ -0,0 +1,97 @@
+"""Benchmark the single-pass README scanner against the former two-pass scan."""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.quill_synthesis import DEFAULT_KEYWORD_LIMIT, STOPWORDS, read_headings, scan_readme
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes-mb",
+        type=float,
+        nargs="+",
+        default=[1.0, 4.0, 16.0],
+        help="Synthetic README sizes to scan, in megabytes.",
+    )
+    parser.add_argument("--limit", type=int, default=DEFAULT_KEYWORD_LIMIT, help="Keyword limit.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic README text.")
+    return parser.parse_args()
+
+
+def synthetic_readme(path: Path, size_mb: float, seed: int) -> None:
+    """Write a Markdown file of roughly ``size_mb`` with headings and stopword-heavy prose."""
+
+    rng = random.Random(seed)
+    stopwords = sorted(word for word in STOPWORDS if len(word) >= 4)
+    vocabulary = stopwords * 8 + [f"concept{index}" for index in range(2000)]
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    with path.open("w") as handle:
+        while written < target:
+            if rng.random() < 0.05:
+                line = f"## {' '.join(rng.choices(vocabulary, k=4))}\n"
+            else:
+                line = " ".join(rng.choices(vocabulary, k=14)) + ".\n"
+            handle.write(line)
+            written += len(line)
+
+
+def two_pass_scan(path: Path, limit: int) -> Tuple[List[str], List[str]]:
+    """The scan ``scan_repository`` used before: read twice, tokenize everything."""
+
+    headings = read_headings(path)
+    tokens = re.findall(r"[A-Za-z][A-Za-z0-9\-]{3,}", path.read_text())
+    normalized = [token.lower() for token in tokens if token.lower() not in STOPWORDS]
+    seen: List[str] = []
+    for keyword in normalized:
+        if keyword not in seen:
+            seen.append(keyword)
+        if len(seen) >= limit:
+            break
+    return headings, seen
+
+
+def main() -> List[Dict[str, Any]]:
+    args = parse_args()
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mb in args.sizes_mb:
+            readme = Path(directory) / "README.md"
+            synthetic_readme(readme, size_mb, args.seed)
+            started = time.perf_counter()
+            legacy = two_pass_scan(readme, args.limit)
+            legacy_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            streamed = scan_readme(readme, args.limit)
+            streamed_seconds = time.perf_counter() - started
+            results.append(
+                {
+                    "size_mb": round(readme.stat().st_size / (1024 * 1024), 2),
+                    "headings": len(streamed[0]),
+                    "keywords": len(streamed[1]),
+                    "matches_two_pass": streamed == legacy,
+                    "two_pass_seconds": legacy_seconds,
+                    "single_pass_seconds": streamed_seconds,
+                    "speedup": legacy_seconds / streamed_seconds if streamed_seconds else None,
+                }
+            )
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()